@@ -0,0 +1,224 @@
+try:
+    import numpy as np  # [선택] pip install numpy (array 엔진 전용)
+except ImportError:
+    np = None
+
+# 거리 계산용 '무한대' (int64 범위 안의 큰 값)
+_FAR = 1 << 60
+
+# ==========================================
+# 팀 단위 유닛 상태 배열 (Struct-of-Arrays)
+# ==========================================
+class TeamArrays:
+    """한 팀의 모든 유닛 상태를 필드별 NumPy 배열로 보관
+
+    배열의 i번째 칸과 views[i] 스프라이트가 같은 유닛이다.
+    스프라이트는 그리기용 껍데기일 뿐이고, 실제 시뮬레이션 값은 전부 배열에 있다.
+    유닛 순서는 소환 순서를 유지한다 (거리가 같을 때 먼저 소환된 유닛을 고르기 위함).
+    """
+    FLOAT_FIELDS = ("x", "hp", "speed", "atk", "rng", "cooldown", "last_attack", "anim_start", "anim_duration")
+    INT_FIELDS = ("rect_x", "half_w")
+
+    def __init__(self, direction, capacity=64):
+        self.direction = direction
+        self.n = 0
+        self.capacity = capacity
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        for name in self.INT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int64))
+        self.attacking = np.zeros(capacity, dtype=bool)
+        self.views = []
+
+    def _grow(self):
+        new_capacity = self.capacity * 2
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS + ("attacking",):
+            old = getattr(self, name)
+            arr = np.zeros(new_capacity, dtype=old.dtype)
+            arr[:self.n] = old[:self.n]
+            setattr(self, name, arr)
+        self.capacity = new_capacity
+
+    def add(self, unit):
+        """GameEntity 의 현재 값을 배열 끝에 복사"""
+        if self.n == self.capacity:
+            self._grow()
+        i = self.n
+        self.x[i] = unit.exact_x
+        self.rect_x[i] = unit.rect.x
+        self.half_w[i] = unit.rect.width // 2
+        self.hp[i] = unit.hp
+        self.speed[i] = unit.speed
+        self.atk[i] = unit.attack_power
+        self.rng[i] = unit.attack_range
+        self.cooldown[i] = unit.attack_cooldown
+        self.last_attack[i] = unit.last_attack_time
+        self.anim_start[i] = unit.attack_anim_start_time
+        self.anim_duration[i] = unit.anim_duration
+        self.attacking[i] = unit.state == "attack"  # 새로 소환하면 move, 스냅샷 복원이면 저장된 상태
+        self.views.append(unit)
+        self.n += 1
+
+    def compact(self, keep):
+        """keep[i] 가 False 인 유닛을 제거 (순서 유지)"""
+        k = int(np.count_nonzero(keep))
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS + ("attacking",):
+            arr = getattr(self, name)
+            arr[:k] = arr[:self.n][keep]
+        self.views = [v for v, alive in zip(self.views, keep.tolist()) if alive]
+        self.n = k
+
+    def unit_states(self):
+        """스냅샷용 유닛 상태 목록 (GameEntity.save_state 형식, 값은 배열에서 읽는다)"""
+        n = self.n
+        return [(view.type.name, x, view.prev_x, rx, view.rect.bottom, hp, last_attack, anim_start,
+                 "attack" if attacking else "move")
+                for view, x, rx, hp, last_attack, anim_start, attacking in zip(
+                    self.views, self.x[:n].tolist(), self.rect_x[:n].tolist(), self.hp[:n].tolist(),
+                    self.last_attack[:n].tolist(), self.anim_start[:n].tolist(), self.attacking[:n].tolist())]
+
+    def clear(self):
+        self.n = 0
+        self.views = []
+
+    def centers(self):
+        return self.rect_x[:self.n] + self.half_w[:self.n]
+
+
+def nearest_targets(src_centers, dst_centers):
+    """각 src 위치에서 가장 가까운 dst 인덱스와 거리 (벡터화)
+
+    거리가 같으면 인덱스가 작은(먼저 소환된) 유닛을 고른다.
+    GameEntity.find_nearest_target / LaneGroup.nearest 와 같은 규칙이다.
+    """
+    order = np.argsort(dst_centers, kind="stable")
+    sorted_c = dst_centers[order]
+    m = len(sorted_c)
+
+    # 오른쪽 후보: centerx >= src 인 첫 유닛
+    j = np.searchsorted(sorted_c, src_centers, side="left")
+    jr = np.minimum(j, m - 1)
+    right_idx = order[jr]
+    right_dist = np.where(j < m, sorted_c[jr] - src_centers, _FAR)
+
+    # 왼쪽 후보: centerx < src 중 가장 가까운 값의 첫 유닛
+    jl = np.maximum(j - 1, 0)
+    left_val = sorted_c[jl]
+    left_idx = order[np.searchsorted(sorted_c, left_val, side="left")]
+    left_dist = np.where(j > 0, src_centers - left_val, _FAR)
+
+    choose_left = (left_dist < right_dist) | ((left_dist == right_dist) & (left_idx < right_idx))
+    idx = np.where(choose_left, left_idx, right_idx)
+    dist = np.minimum(left_dist, right_dist)
+    return idx, dist
+
+
+# ==========================================
+# 배열 기반 전투 엔진
+# ==========================================
+class ArrayCombatEngine:
+    """GameManager 의 유닛 시뮬레이션을 팀별 NumPy 배열로 일괄 처리하는 엔진
+
+    한 틱의 처리 순서는 기존 Group.update 방식과 똑같이 맞춘다.
+      1) 아군: 사망 처리 -> 가장 가까운 적 탐색 -> 공격(쿨타임) 또는 이동
+      2) 적군: 사망 처리 -> 가장 가까운 아군 탐색 -> 공격(쿨타임) 또는 이동
+    같은 스테이지/시드라면 object 엔진과 같은 결과가 나온다.
+    """
+    def __init__(self, on_player_death=None):
+        if np is None:
+            raise ImportError("array 엔진을 쓰려면 numpy 가 필요합니다 (pip install numpy)")
+        self.players = TeamArrays(direction=1)
+        self.enemies = TeamArrays(direction=-1)
+        self.on_player_death = on_player_death
+        self.sync_views = True  # False 면 스프라이트 갱신 생략 (헤드리스/벤치마크용)
+        self.swing_sound = None
+
+    def add_player(self, unit):
+        self.players.add(unit)
+        if self.swing_sound is None:
+            self.swing_sound = unit.swing_sound
+
+    def add_enemy(self, unit):
+        self.enemies.add(unit)
+
+    def clear(self):
+        """유닛 전부 제거 (스냅샷 복원 전에 호출, 스프라이트 정리는 GameManager 가 한다)"""
+        self.players.clear()
+        self.enemies.clear()
+
+    def step(self, current_time):
+        self._step_team(self.players, self.enemies, current_time, self.on_player_death)
+        self._step_team(self.enemies, self.players, current_time, None)
+        if self.sync_views:
+            self._sync(self.players, current_time)
+            self._sync(self.enemies, current_time)
+
+    def _step_team(self, me, other, current_time, on_death):
+        # 1. 사망 처리 (HP 0 이하 유닛 제거)
+        if me.n:
+            dead = me.hp[:me.n] <= 0
+            if dead.any():
+                for i in np.flatnonzero(dead).tolist():
+                    view = me.views[i]
+                    if on_death:
+                        on_death(int(me.rect_x[i] + me.half_w[i]), view.rect.centery)
+                    view.despawn()
+                me.compact(~dead)
+
+        n = me.n
+        if n == 0:
+            return
+
+        # 2. 가장 가까운 상대 탐색 및 사거리 판정
+        if other.n:
+            target_idx, dist = nearest_targets(me.centers(), other.centers())
+            attacking = dist <= me.rng[:n]
+        else:
+            attacking = np.zeros(n, dtype=bool)
+
+        # 3. 쿨타임이 끝난 유닛만 공격 (데미지는 대상별로 합산)
+        if attacking.any():
+            ready = attacking & (current_time - me.last_attack[:n] >= me.cooldown[:n])
+            if ready.any():
+                damage = np.bincount(target_idx[ready], weights=me.atk[:n][ready], minlength=other.n)
+                other.hp[:other.n] -= damage
+                me.last_attack[:n][ready] = current_time
+                me.anim_start[:n][ready] = current_time
+                if me is self.players and self.swing_sound:
+                    self.swing_sound.play()
+
+        # 4. 사거리 밖 유닛은 이동
+        moving = ~attacking
+        x = me.x[:n]
+        x[moving] += me.speed[:n][moving] * me.direction
+        me.rect_x[:n] = np.trunc(x).astype(np.int64)
+        me.attacking[:n] = attacking
+
+    def remove_at_base(self):
+        """왼쪽 끝(기지)에 닿은 적을 제거하고 그 수를 반환"""
+        n = self.enemies.n
+        if n == 0:
+            return 0
+        reached = self.enemies.rect_x[:n] <= 0
+        count = int(np.count_nonzero(reached))
+        if count:
+            for i in np.flatnonzero(reached).tolist():
+                self.enemies.views[i].despawn()
+            self.enemies.compact(~reached)
+        return count
+
+    def _sync(self, team, current_time):
+        # 스프라이트(그리기용)에 위치(보간용 직전 위치 포함)/HP/이미지만 반영
+        n = team.n
+        if n == 0:
+            return
+        show_attack = (current_time - team.anim_start[:n]) < team.anim_duration[:n]
+        for view, x, rx, hp, atk_img, attacking in zip(team.views, team.x[:n].tolist(), team.rect_x[:n].tolist(),
+                                                       team.hp[:n].tolist(), show_attack.tolist(),
+                                                       team.attacking[:n].tolist()):
+            view.prev_x = view.exact_x
+            view.exact_x = x
+            view.rect.x = rx
+            view.hp = hp
+            view.state = "attack" if attacking else "move"
+            view.image = view.attack_image if atk_img else view.base_image
@@ -0,0 +1,262 @@
+import json
+import os
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+# ==========================================
+# 에셋 레지스트리 (스프라이트 / 사운드 공유 캐시)
+# ==========================================
+class AssetRegistry:
+    """경로 + 목표 크기 + 알파 모드별로 이미지를 한 번만 로드해서 공유하는 캐시
+
+    유닛이 소환될 때마다 디스크에서 PNG를 읽고 스케일하던 것을 없애기 위해,
+    같은 키로 요청되면 이미 만들어 둔 Surface(플라이웨이트)를 그대로 돌려준다.
+    반환된 Surface는 여러 유닛이 함께 쓰므로 절대 직접 수정(set_alpha 등)하면 안 된다.
+    """
+    def __init__(self):
+        self._images = {}        # (path, size, alpha) -> Surface 또는 None(로드 실패)
+        self._sounds = {}        # (path, volume) -> Sound 또는 None
+        self._placeholders = {}  # (size, color) -> 대체 Surface
+        self._pending = {}       # (path, size, alpha) -> 디코드 중인 Future (preload)
+
+        # [아틀라스] bake_assets.py 결과물: (파일 이름, 크기, 알파) -> (시트 이름, Rect)
+        self._atlas_dir = None
+        self._atlas_files = {}   # 시트 이름 -> 파일 이름
+        self._atlas_entries = {}
+        self._sheets = {}        # 시트 이름 -> 화면 포맷으로 변환된 Surface
+        self._sheet_pending = {} # 시트 이름 -> 디코드 중인 Future
+
+        # [헤드리스] True 면 이미지/사운드를 전혀 만들지 않고 None 을 돌려준다 (headless_mode() 안에서만 켠다)
+        self.headless = False
+
+        # [통계] 캐시 적중 / 미스 / 로드한 픽셀 바이트 수
+        self.hits = 0
+        self.misses = 0
+        self.bytes_loaded = 0
+
+    def image(self, path, size=None, alpha=True):
+        """이미지를 로드(최초 1회) 후 공유 Surface 반환. 실패하면 None"""
+        if self.headless:
+            return None
+        key = (path, size, alpha)
+        if key in self._images:
+            self.hits += 1
+            return self._images[key]
+
+        self.misses += 1
+        entry = self._atlas_entry(path, size, alpha)
+        sheet_surf = self._sheet(entry[0]) if entry else None
+        if sheet_surf is not None:
+            # 아틀라스에 있으면 시트의 서브서피스 (개별 디코드/스케일/변환 없음)
+            surf = sheet_surf.subsurface(entry[1])
+            self._images[key] = surf
+            return surf
+
+        future = self._pending.pop(key, None)
+        # 미리 디코드해 둔 것이 있으면 그것을 (아직 진행 중이면 끝날 때까지 기다림), 없으면 지금 로드
+        surf = future.result() if future else self._decode(path, size)
+        if surf is not None:
+            try:
+                surf = self._to_display_format(surf, alpha)
+                self.bytes_loaded += surf.get_pitch() * surf.get_height()
+            except Exception:
+                surf = None
+
+        self._images[key] = surf
+        return surf
+
+    @staticmethod
+    def _decode(path, size):
+        """파일 읽기 + 디코드 + 스케일 (화면 없이도 되는 부분이라 워커 스레드에서 실행 가능)"""
+        try:
+            if not path:
+                return None
+            surf = pygame.image.load(path)
+            if size and surf.get_size() != tuple(size):
+                surf = pygame.transform.scale(surf, size)
+            return surf
+        except Exception:
+            return None
+
+    def use_atlas(self, atlas_dir, source_dir):
+        """bake_assets.py 로 구운 아틀라스를 쓰도록 설정 (시트 디코드는 처음 필요할 때 / preload 때)
+
+        원본 PNG 의 크기/수정 시각이 색인과 다른 항목은 빼서, 그 이미지는 원본에서 직접 로드되게 한다.
+        색인이 없으면 아무것도 하지 않는다.
+        """
+        index_path = os.path.join(atlas_dir, "atlas_index.json")
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        fresh = set()
+        for name, record in index.get("sources", {}).items():
+            try:
+                st = os.stat(os.path.join(source_dir, name))
+            except OSError:
+                continue
+            if st.st_size == record["size"] and st.st_mtime == record["mtime"]:
+                fresh.add(name)
+
+        self._atlas_dir = atlas_dir
+        self._atlas_files = index.get("sheets", {})
+        self._atlas_entries = {}
+        for key, entry in index.get("entries", {}).items():
+            name, size_text, alpha_text = key.rsplit("|", 2)
+            if name not in fresh:
+                continue
+            size = None if size_text == "orig" else tuple(int(v) for v in size_text.split("x"))
+            file_name = os.path.basename(name)
+            self._atlas_entries[(file_name, size, alpha_text == "a")] = (entry["sheet"], pygame.Rect(entry["rect"]))
+        return True
+
+    def _atlas_entry(self, path, size, alpha):
+        if not self._atlas_entries or not path:
+            return None
+        return self._atlas_entries.get((os.path.basename(path), tuple(size) if size else None, alpha))
+
+    def _sheet(self, sheet):
+        """아틀라스 시트 Surface (최초 1회 디코드 + 화면 포맷 변환)"""
+        surf = self._sheets.get(sheet)
+        if surf is not None:
+            return surf
+        future = self._sheet_pending.pop(sheet, None)
+        surf = future.result() if future else self._decode(os.path.join(self._atlas_dir, self._atlas_files[sheet]), None)
+        if surf is None:
+            # 시트 파일이 없거나 깨졌으면 이 시트의 항목은 원본에서 직접 로드
+            print(f"[경고] 아틀라스 시트를 읽을 수 없습니다: {sheet}")
+            self._atlas_entries = {k: v for k, v in self._atlas_entries.items() if v[0] != sheet}
+            return None
+        surf = self._to_display_format(surf, sheet == "alpha")
+        self.bytes_loaded += surf.get_pitch() * surf.get_height()
+        if pygame.display.get_surface() is not None:
+            self._sheets[sheet] = surf
+        return surf
+
+    def preload(self, specs, max_workers=4):
+        """(path, size, alpha) 목록을 스레드 풀에서 미리 디코드해 둔다 (기다리지 않고 바로 반환)
+
+        화면 포맷 변환(convert)은 디스플레이가 필요하므로 image() / warm_up() 에서 한다.
+        """
+        if self.headless:
+            return
+        todo = [spec for spec in specs if spec not in self._images and spec not in self._pending]
+        # 아틀라스에 있는 이미지는 개별 디코드 대신 시트 한 장만 디코드
+        sheets = {self._atlas_entry(*spec)[0] for spec in todo if self._atlas_entry(*spec)}
+        sheets = [s for s in sheets if s not in self._sheets and s not in self._sheet_pending]
+        todo = [spec for spec in todo if not self._atlas_entry(*spec)]
+        if not todo and not sheets:
+            return
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        for sheet in sheets:
+            path = os.path.join(self._atlas_dir, self._atlas_files[sheet])
+            self._sheet_pending[sheet] = executor.submit(self._decode, path, None)
+        for spec in todo:
+            self._pending[spec] = executor.submit(self._decode, spec[0], spec[1])
+        executor.shutdown(wait=False)
+
+    def warm_up(self, manifest):
+        """manifest 의 이미지 / 사운드를 전부 캐시에 올린다 (화면 생성 + 믹서 초기화 후 호출)"""
+        for path, size, alpha in manifest.get("images", ()):
+            self.image(path, size, alpha)
+        for path, volume in manifest.get("sounds", ()):
+            self.sound(path, volume)
+
+    def placeholder(self, size, color):
+        """이미지 로드 실패 시 쓰는 단색 대체 Surface (역시 공유)"""
+        if self.headless:
+            return None
+        key = (tuple(size), tuple(color))
+        surf = self._placeholders.get(key)
+        if surf is None:
+            surf = pygame.Surface(size)
+            surf.fill(color)
+            self._placeholders[key] = surf
+        return surf
+
+    def sound(self, path, volume=1.0):
+        """사운드를 로드(최초 1회) 후 공유 Sound 반환. 믹서가 없거나 실패하면 None"""
+        if self.headless:
+            return None
+        key = (path, volume)
+        if key in self._sounds:
+            self.hits += 1
+            return self._sounds[key]
+
+        self.misses += 1
+        snd = None
+        if not pygame.mixer.get_init():
+            # 믹서 초기화 전이면 캐시하지 않고 다음에 다시 시도
+            return None
+        try:
+            if os.path.exists(path):
+                snd = pygame.mixer.Sound(path)
+                snd.set_volume(volume)
+                freq, fmt, channels = pygame.mixer.get_init()
+                self.bytes_loaded += snd.get_length() * freq * channels * (abs(fmt) // 8)
+            else:
+                print(f"[경고] 사운드 파일이 없습니다: {path}")
+        except Exception as e:
+            print(f"[오류] 사운드 로드 중 에러 발생: {e}")
+
+        self._sounds[key] = snd
+        return snd
+
+    def _to_display_format(self, surf, alpha):
+        # 화면 모드가 설정된 뒤에만 convert 가능 (블릿 속도 향상)
+        if pygame.display.get_surface() is None:
+            return surf
+        return surf.convert_alpha() if alpha else surf.convert()
+
+    @contextmanager
+    def headless_mode(self):
+        """with 블록 안에서만 헤드리스로 (끝나면 이전 값으로 되돌린다)
+
+        UnitType 이미지는 프로세스 전체에서 공유되고 GameManager.reset() 때 다시 채워지므로,
+        헤드리스 실행 뒤에 같은 프로세스에서 만든 화면용 GameManager 가 None 스프라이트를 받지 않게 한다.
+        """
+        previous = self.headless
+        self.headless = True
+        try:
+            yield
+        finally:
+            self.headless = previous
+
+    def clear(self):
+        self._sheets.clear()
+        self._sheet_pending.clear()
+        self._pending.clear()
+        self._images.clear()
+        self._sounds.clear()
+        self._placeholders.clear()
+
+    def stats(self):
+        """캐시 상태 요약 (적중/미스/바이트)"""
+        cached_bytes = 0
+        for surf in self._images.values():
+            if surf is not None:
+                # 아틀라스 서브서피스는 pitch 가 시트 전체 폭이므로 실제 크기로 계산
+                cached_bytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "images": len(self._images),
+            "sounds": len(self._sounds),
+            "bytes_loaded": int(self.bytes_loaded),
+            "bytes_cached": cached_bytes,
+        }
+
+    def report(self):
+        s = self.stats()
+        total = s["hits"] + s["misses"]
+        hit_rate = (s["hits"] / total * 100) if total else 0.0
+        return (f"[에셋] 이미지 {s['images']}개 / 사운드 {s['sounds']}개, "
+                f"적중 {s['hits']} / 미스 {s['misses']} ({hit_rate:.1f}%), "
+                f"캐시 {s['bytes_cached'] / 1024:.0f} KB")
+
+
+# 프로세스 전체에서 공유하는 레지스트리
+assets = AssetRegistry()
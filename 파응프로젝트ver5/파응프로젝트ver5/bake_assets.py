@@ -0,0 +1,168 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+import config
+from manifest import stage_manifest
+from game_manager import STAGE_ENEMY_POOLS
+
+# ==========================================
+# 에셋 굽기 (오프라인 빌드 단계)
+# ==========================================
+# config.py 의 이미지 상수(스테이지 manifest)를 읽어 각 이미지를 최종 출력 크기로 미리 스케일하고,
+# 아틀라스 PNG 두 장(알파 / 불투명)과 색인 JSON 으로 묶는다.
+# 게임은 시작할 때 아틀라스 두 장만 디코드하고, 각 이미지는 그 서브서피스로 쓴다 (개별 디코드/스케일 없음).
+#
+# 사용 예)
+#   python bake_assets.py            # 원본이 바뀌었을 때만 다시 굽는다
+#   python bake_assets.py --force    # 무조건 다시 굽기
+#
+# 결과물은 config.BAKED_ASSET_DIR 에 생기며 저장소에는 올리지 않는다 (언제든 다시 만들 수 있음).
+# 원본 PNG 의 수정 시각/크기가 색인과 다르면 게임은 그 이미지만 원래대로 직접 로드한다.
+
+INDEX_FILE = "atlas_index.json"
+SHEET_FILES = {"alpha": "atlas_alpha.png", "opaque": "atlas_opaque.png"}
+INDEX_VERSION = 1
+
+
+def entry_key(name, size, alpha):
+    """색인 키: "C-1.png|150x150|a" (원본 파일 이름 + 출력 크기 + 알파 여부)"""
+    size_text = f"{size[0]}x{size[1]}" if size else "orig"
+    return f"{name}|{size_text}|{'a' if alpha else 'o'}"
+
+
+def source_name(path):
+    """BASE_IMAGE_DIR 기준 상대 경로 (그 밖의 파일은 굽지 않는다)"""
+    rel = os.path.relpath(path, config.BASE_IMAGE_DIR)
+    return None if rel.startswith("..") else rel.replace("\\", "/")
+
+
+def file_sha1(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def collect_specs():
+    """모든 스테이지 manifest 의 이미지 항목 (중복 제거, 순서 유지)"""
+    specs = []
+    for stage_level in sorted(STAGE_ENEMY_POOLS):
+        specs += stage_manifest(stage_level)["images"]
+    return [spec for spec in dict.fromkeys(specs) if os.path.exists(spec[0]) and source_name(spec[0])]
+
+
+def pack_shelves(sizes, width):
+    """선반(shelf) 방식 패킹: 높이 순으로 한 줄씩 채운다. (위치 목록, 전체 높이) 반환"""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > width:
+            x, y = 0, y + shelf_h
+            shelf_h = 0
+        positions[i] = (x, y)
+        x += w
+        shelf_h = max(shelf_h, h)
+    return positions, y + shelf_h
+
+
+def is_up_to_date(out_dir, specs):
+    """색인이 있고, 구울 목록이 같고, 원본이 그대로면 True (수정 시각만 바뀐 경우는 해시로 확인)"""
+    index_path = os.path.join(out_dir, INDEX_FILE)
+    if not os.path.exists(index_path):
+        return False
+    if not all(os.path.exists(os.path.join(out_dir, f)) for f in SHEET_FILES.values()):
+        return False
+    with open(index_path, encoding="utf-8") as f:
+        index = json.load(f)
+    if index.get("version") != INDEX_VERSION:
+        return False
+
+    wanted = {entry_key(source_name(p), size, alpha) for p, size, alpha in specs}
+    if wanted != set(index["entries"]):
+        return False
+
+    touched = False
+    for name, record in index["sources"].items():
+        path = os.path.join(config.BASE_IMAGE_DIR, name)
+        if not os.path.exists(path):
+            return False
+        st = os.stat(path)
+        if st.st_size == record["size"] and st.st_mtime == record["mtime"]:
+            continue
+        if file_sha1(path) != record["sha1"]:
+            return False
+        # 내용은 같고 수정 시각만 바뀜: 색인만 갱신
+        record["size"], record["mtime"] = st.st_size, st.st_mtime
+        touched = True
+
+    if touched:
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, indent=1)
+    return True
+
+
+def bake(out_dir, width=2048, force=False):
+    """아틀라스와 색인을 만든다. 이미 최신이면 아무것도 하지 않고 False 반환"""
+    # 게임과 똑같이 convert 하기 위해 (보이지 않는) 디스플레이가 필요하다
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+
+    specs = collect_specs()
+    if not force and is_up_to_date(out_dir, specs):
+        return False
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    # 1. 원본 로드 -> 최종 크기로 스케일 -> 게임과 같은 화면 포맷으로 변환
+    groups = {"alpha": [], "opaque": []}
+    sources = {}
+    for path, size, alpha in specs:
+        surf = pygame.image.load(path)
+        if size and surf.get_size() != tuple(size):
+            surf = pygame.transform.scale(surf, size)
+        surf = surf.convert_alpha() if alpha else surf.convert()
+        name = source_name(path)
+        groups["alpha" if alpha else "opaque"].append((entry_key(name, size, alpha), surf))
+        if name not in sources:
+            st = os.stat(path)
+            sources[name] = {"size": st.st_size, "mtime": st.st_mtime, "sha1": file_sha1(path)}
+
+    # 2. 종류별로 한 장씩 패킹
+    os.makedirs(out_dir, exist_ok=True)
+    entries = {}
+    for sheet, items in groups.items():
+        sizes = [surf.get_size() for _, surf in items]
+        positions, height = pack_shelves(sizes, width)
+        if sheet == "alpha":
+            atlas = pygame.Surface((width, max(height, 1)), pygame.SRCALPHA)
+            atlas.fill((0, 0, 0, 0))
+        else:
+            atlas = pygame.Surface((width, max(height, 1)))
+        for (key, surf), pos in zip(items, positions):
+            # 알파 시트는 섞지 않고 그대로 복사 (투명 픽셀 RGB 까지 원본과 같게)
+            atlas.blit(surf, pos, special_flags=pygame.BLEND_RGBA_MAX if sheet == "alpha" else 0)
+            entries[key] = {"sheet": sheet, "rect": [pos[0], pos[1], surf.get_width(), surf.get_height()]}
+        pygame.image.save(atlas, os.path.join(out_dir, SHEET_FILES[sheet]))
+
+    index = {"version": INDEX_VERSION, "sheets": SHEET_FILES, "entries": entries, "sources": sources}
+    with open(os.path.join(out_dir, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="이미지를 최종 크기로 미리 스케일해 아틀라스로 굽기")
+    parser.add_argument("--out", default=None, help="출력 폴더 (기본: config.BAKED_ASSET_DIR)")
+    parser.add_argument("--width", type=int, default=2048, help="아틀라스 가로 크기")
+    parser.add_argument("--force", action="store_true", help="원본이 그대로여도 다시 굽기")
+    args = parser.parse_args()
+
+    out_dir = args.out or config.BAKED_ASSET_DIR
+    start = time.perf_counter()
+    if bake(out_dir, width=args.width, force=args.force):
+        print(f"[굽기] 완료 ({time.perf_counter() - start:.2f}초) -> {out_dir}")
+    else:
+        print(f"[굽기] 원본 변경 없음, 건너뜀 -> {out_dir}")
@@ -0,0 +1,139 @@
+import argparse
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import config
+from entity import UNIT_STATS
+from headless import run_headless, GreedySpawnPolicy
+
+# ==========================================
+# 몬테카를로 밸런스 스윕 (멀티 프로세스)
+# ==========================================
+# 유닛 능력치(UNIT_STATS)와 경제 설정(config)을 격자로 바꿔 가며
+# 시드별 헤드리스 전투를 모든 CPU 코어에서 돌리고, 격자점별 통계를 표로 저장한다.
+#
+# 사용 예)
+#   python balance_sweep.py --stage 3 --seeds 200 \
+#       --param C1.atk=500,1000,2000 --param MONEY_RATE=5,10 --out sweep.csv
+#
+# 파라미터 이름 규칙
+#   "C1.hp"      -> UNIT_STATS["C1"]["hp"]
+#   "MONEY_RATE" -> config.MONEY_RATE
+
+# 워커 프로세스에서 매 작업마다 되돌릴 원래 값
+_DEFAULT_STATS = {name: dict(stats) for name, stats in UNIT_STATS.items()}
+_DEFAULT_CONFIG = {}
+
+
+def parse_param(text):
+    """"C1.hp=80,100,120" -> ("C1.hp", [80, 100, 120])"""
+    name, values = text.split("=", 1)
+    parsed = []
+    for v in values.split(","):
+        v = v.strip()
+        try:
+            parsed.append(int(v))
+        except ValueError:
+            parsed.append(float(v))  # "1.5", "1e3" 등
+    return name.strip(), parsed
+
+
+def apply_overrides(overrides):
+    """기본값으로 되돌린 뒤 이번 격자점의 값을 적용 (같은 프로세스에서 여러 격자점을 돌리므로)"""
+    for name, stats in _DEFAULT_STATS.items():
+        UNIT_STATS[name].clear()
+        UNIT_STATS[name].update(stats)
+    for key, value in _DEFAULT_CONFIG.items():
+        setattr(config, key, value)
+
+    for key, value in overrides.items():
+        if "." in key:
+            unit_name, stat = key.split(".", 1)
+            if unit_name not in UNIT_STATS or stat not in UNIT_STATS[unit_name]:
+                raise KeyError(f"알 수 없는 유닛 능력치: {key}")
+            UNIT_STATS[unit_name][stat] = value
+        else:
+            if not hasattr(config, key):
+                raise KeyError(f"알 수 없는 config 값: {key}")
+            _DEFAULT_CONFIG.setdefault(key, getattr(config, key))
+            setattr(config, key, value)
+
+
+def run_batch(stage_level, overrides, seeds, engine, max_time_sec):
+    """워커 작업 단위: 격자점 하나에 대해 여러 시드를 연속 실행"""
+    apply_overrides(overrides)
+    rows = []
+    for seed in seeds:
+        r = run_headless(stage_level, policy=GreedySpawnPolicy(), seed=seed, engine=engine, max_time_sec=max_time_sec)
+        rows.append((r["result"], r["sim_time_sec"], r["base_hp"]))
+    return overrides, rows
+
+
+def summarize(overrides, rows):
+    n = len(rows)
+    wins = [r for r in rows if r[0] == "VICTORY"]
+    timeouts = sum(1 for r in rows if r[0] == "TIMEOUT")
+    summary = dict(overrides)
+    summary.update({
+        "runs": n,
+        "win_rate": round(len(wins) / n, 4) if n else 0.0,
+        "timeout_rate": round(timeouts / n, 4) if n else 0.0,
+        "avg_victory_time_sec": round(sum(r[1] for r in wins) / len(wins), 3) if wins else "",
+        "avg_base_hp": round(sum(r[2] for r in rows) / n, 2) if n else 0.0,
+    })
+    return summary
+
+
+def write_table(path, table):
+    """결과 표 저장: .npz 면 열(column) 단위 NumPy 파일, 그 외에는 CSV"""
+    columns = list(table[0].keys()) if table else []
+    if path.endswith(".npz"):
+        import numpy as np
+        np.savez(path, **{c: np.array([row[c] for row in table]) for c in columns})
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(table)
+
+
+def sweep(stage_level, grid, seeds, engine="object", workers=None, max_time_sec=600, batch_size=25):
+    """격자 x 시드 전체를 프로세스 풀로 실행하고 격자점별 요약 목록 반환"""
+    names = list(grid.keys())
+    points = [dict(zip(names, values)) for values in itertools.product(*grid.values())] or [{}]
+    seed_list = list(range(seeds))
+    batches = [seed_list[i:i + batch_size] for i in range(0, len(seed_list), batch_size)]
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(run_batch, stage_level, point, batch, engine, max_time_sec)
+                   for point in points for batch in batches]
+        for future in as_completed(futures):
+            overrides, rows = future.result()
+            results.setdefault(tuple(overrides.items()), []).extend(rows)
+
+    return [summarize(point, results[tuple(point.items())]) for point in points]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="헤드리스 몬테카를로 밸런스 스윕")
+    parser.add_argument("--stage", type=int, default=1)
+    parser.add_argument("--seeds", type=int, default=100, help="격자점마다 돌릴 시드 수")
+    parser.add_argument("--param", action="append", default=[], help='예: "C1.hp=80,100" 또는 "MONEY_RATE=5,10"')
+    parser.add_argument("--engine", choices=["object", "array"], default="object")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-time", type=float, default=600, help="한 판의 최대 게임 시간(초)")
+    parser.add_argument("--out", default="sweep.csv", help=".csv 또는 .npz")
+    args = parser.parse_args()
+
+    grid = dict(parse_param(p) for p in args.param)
+    start = time.perf_counter()
+    table = sweep(args.stage, grid, args.seeds, engine=args.engine, workers=args.workers, max_time_sec=args.max_time)
+    write_table(args.out, table)
+
+    total_runs = sum(row["runs"] for row in table)
+    print(f"[스윕] {len(table)}개 격자점, {total_runs}판 완료 ({time.perf_counter() - start:.1f}초) -> {args.out}")
+    for row in table:
+        print(row)
@@ -0,0 +1,324 @@
+import os
+# 창 / 소리 없이 실행 (CI 머신용). pygame 을 불러오기 전에 정해야 한다
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+from time import perf_counter
+import pygame
+import config
+from assets import assets
+from entity import GameEntity
+from game_manager import GameManager, PLAYER_UNIT_TYPES, STAGE_ENEMY_POOLS, STAGE_BOSSES
+from renderer import DirtyRenderer, FullRenderer, ResultScreen
+from profiler import percentile
+from headless import StressSpawnPolicy
+
+# ==========================================
+# 성능 벤치마크 (고정 시드 시나리오)
+# ==========================================
+# 시뮬레이션(GameManager.update -> GameEntity.update / find_nearest_target)과
+# 그리기(유닛 blit + HUD + 결과 화면 + 화면 반영), 동영상 디코드를 정해진 시나리오로 재고
+# 결과를 JSON 으로 저장한다. 기준 결과(baseline)와 비교해서 느려진 시나리오가 있으면 종료 코드 1.
+#
+# 사용 예)
+#   python benchmark.py                                   # 모든 시나리오 실행 후 표 출력
+#   python benchmark.py --only sim_500 --only render      # 이름이 이것으로 시작하는 시나리오만
+#   python benchmark.py --save-baseline bench_base.json   # 기준 결과 저장
+#   python benchmark.py --baseline bench_base.json --out bench.json   # 비교 (느려졌으면 실패)
+#
+# 시나리오 종류
+#   sim_*    : 헤드리스 고정 스텝. 지표 = 초당 틱 수, 틱당 시간 분포
+#   render_* : 더미 SDL 화면에 스텝 + 그리기 + 화면 반영. 지표 = 초당 프레임 수, 프레임 시간 분포
+#   endless_*: 엔드리스 모드를 웨이브 표대로 ramp_ticks 만큼 진행한 뒤(유닛 수백 마리) 이어지는 스텝.
+#              지표 = 초당 틱 수 (아군은 StressSpawnPolicy 로 계속 소환, 기지 HP 무한)
+#   video    : 엔딩 동영상 디코드(워커 스레드) + blit. 지표 = 초당 프레임 수
+# 유닛이 있는 시나리오는 웨이브/돈 지급 예약을 비우고 정해진 배치로만 싸우므로 (기지 HP 무한)
+# 같은 시드면 매번 같은 일을 한다.
+
+SEED = 1234
+UNIT_BOTTOM = config.SCREEN_HEIGHT - 100
+
+
+def make_field(stage_level, per_side, engine="object", seed=SEED, boss=False):
+    """per_side 마리씩 아군(왼쪽 절반) / 적(오른쪽 절반)을 고정 시드로 배치한 GameManager"""
+    gm = GameManager(stage_level, engine=engine, seed=seed)
+    gm.scheduler.clear()            # 웨이브 / 돈 지급 없음 (배치한 유닛만 싸운다)
+    gm.player_base_hp = 10 ** 9     # 적이 기지에 닿아도 끝나지 않도록
+    rng = random.Random(seed)
+    half = config.SCREEN_WIDTH // 2
+    player_types = list(PLAYER_UNIT_TYPES.values())
+    enemy_pool = STAGE_ENEMY_POOLS.get(stage_level, STAGE_ENEMY_POOLS[1])
+
+    for _ in range(per_side):
+        unit = gm.pool.acquire(GameEntity, rng.choice(player_types), rng.randrange(0, half - 80),
+                               UNIT_BOTTOM, gm.create_death_effect)
+        gm.player_units.add(unit)
+        if gm.engine: gm.engine.add_player(unit)
+    enemy_types = [rng.choice(enemy_pool) for _ in range(per_side)]
+    if boss:
+        enemy_types[-1] = STAGE_BOSSES[stage_level]
+        gm.boss_spawned = True
+    for enemy_type in enemy_types:
+        unit = gm.pool.acquire(GameEntity, enemy_type, rng.randrange(half, config.SCREEN_WIDTH - 50), UNIT_BOTTOM)
+        gm.enemy_units.add(unit)
+        if gm.engine: gm.engine.add_enemy(unit)
+    return gm
+
+
+def measure(step, iterations, warmup=10):
+    """step() 을 warmup 번 버리고 iterations 번 잰 호출별 시간(ms) 목록"""
+    for _ in range(warmup):
+        step()
+    times = []
+    for _ in range(iterations):
+        start = perf_counter()
+        step()
+        times.append((perf_counter() - start) * 1000)
+    return times
+
+
+def summarize(times):
+    total = sum(times)
+    ordered = sorted(times)
+    return {
+        "iterations": len(times),
+        "per_sec": round(len(times) / total * 1000, 1) if total else 0.0,
+        "mean_ms": round(total / len(times), 4),
+        "p50_ms": round(percentile(ordered, 0.50), 4),
+        "p99_ms": round(percentile(ordered, 0.99), 4),
+        "max_ms": round(ordered[-1], 4),
+    }
+
+
+# ==========================================
+# 시나리오
+# ==========================================
+def sim_scenario(stage_level, per_side, ticks, engine="object", boss=False):
+    def run():
+        with assets.headless_mode():
+            gm = make_field(stage_level, per_side, engine=engine, boss=boss)
+            if gm.engine:
+                gm.engine.sync_views = False
+            return measure(gm.step, ticks)
+    return run
+
+
+def endless_scenario(ramp_ticks, ticks, engine="object"):
+    def run():
+        with assets.headless_mode():
+            gm = GameManager(config.ENDLESS_STAGE, engine=engine, seed=SEED)
+            gm.player_base_hp = 10 ** 9
+            if gm.engine:
+                gm.engine.sync_views = False
+            policy = StressSpawnPolicy()
+
+            def tick():
+                policy.act(gm, gm.sim_time)
+                gm.step()
+            return measure(tick, ticks, warmup=ramp_ticks)
+    return run
+
+
+def _display():
+    """더미 화면 준비 (이미지 로드/변환에 필요)"""
+    if not pygame.display.get_init():
+        pygame.display.init()
+        pygame.font.init()
+    return pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+
+def render_scenario(per_side, frames, renderer_cls):
+    """한 프레임 = 시뮬레이션 1스텝 + blit 목록 + 그리기(유닛/이펙트 + HUD) + 화면 반영"""
+    def run():
+        screen = _display()
+        font = pygame.font.SysFont("arial", 22, bold=True)
+        gm = make_field(1, per_side)
+        background = assets.image(config.IMG_BG_STAGE1, screen.get_size(), alpha=False)
+        renderer = renderer_cls(screen, background)
+        hud_rect = pygame.Rect(0, 0, config.SCREEN_WIDTH, 80)
+
+        def frame():
+            gm.step()
+            widgets = [(gm.hud_key(), hud_rect, lambda surface: gm.draw_hud(surface, font))]
+            renderer.render(gm.unit_blit_list(1.0), widgets)
+        return measure(frame, frames)
+    return run
+
+
+def result_scenario(frames, renderer_cls):
+    """승리 화면이 떠 있는 동안의 프레임 (유닛은 멈춰 있고 결과 레이어만 그린다)"""
+    def run():
+        screen = _display()
+        font = pygame.font.SysFont("arial", 22, bold=True)
+        gm = make_field(1, 20)
+        gm.game_over = True
+        gm.result_message = "VICTORY!!"
+        background = assets.image(config.IMG_BG_STAGE1, screen.get_size(), alpha=False)
+        renderer = renderer_cls(screen, background)
+        result_screen = ResultScreen()
+        blit_list = gm.unit_blit_list(1.0)
+
+        def frame():
+            widgets = [(gm.result_message, screen.get_rect(),
+                        lambda surface: result_screen.draw(surface, gm.result_message, font))]
+            renderer.render(blit_list, widgets)
+        return measure(frame, frames)
+    return run
+
+
+def video_scenario(frames):
+    """엔딩 동영상: 디코드 / 크기 조정 / 색 변환된 프레임을 받아 blit 하기까지 (표시 시각 대기 없음)
+
+    영상이 frames 보다 짧으면 끝까지만 잰다.
+    """
+    def run():
+        try:
+            from video_player import VideoPlayer
+        except ImportError as e:
+            return f"opencv 없음 ({e})"
+        screen = _display()
+        player = VideoPlayer(config.VID_ENDING, screen.get_size())
+        if not player.open():
+            return f"동영상을 열 수 없음 ({config.VID_ENDING})"
+        times = []
+        try:
+            while len(times) < frames:
+                start = perf_counter()
+                pending = player.next_frame()
+                if pending is None:
+                    break
+                slot, _ = pending
+                screen.blit(player.surfaces[slot], (0, 0))
+                player.release_frame(slot)
+                times.append((perf_counter() - start) * 1000)
+        finally:
+            player.close()
+        return times or "동영상에 프레임이 없음"
+    return run
+
+
+SCENARIOS = {
+    "sim_empty": sim_scenario(1, 0, 5000),
+    "sim_50": sim_scenario(1, 50, 1000),
+    "sim_500": sim_scenario(1, 500, 200),
+    "sim_5000": sim_scenario(1, 5000, 20),
+    "sim_50_array": sim_scenario(1, 50, 1000, engine="array"),
+    "sim_500_array": sim_scenario(1, 500, 200, engine="array"),
+    "sim_5000_array": sim_scenario(1, 5000, 20, engine="array"),
+    "sim_boss": sim_scenario(3, 30, 600, boss=True),
+    "endless_peak": endless_scenario(6000, 600),
+    "endless_peak_array": endless_scenario(6000, 600, engine="array"),
+    "render_empty_dirty": render_scenario(0, 300, DirtyRenderer),
+    "render_50_dirty": render_scenario(50, 300, DirtyRenderer),
+    "render_50_full": render_scenario(50, 300, FullRenderer),
+    "render_500_dirty": render_scenario(500, 100, DirtyRenderer),
+    "result_dirty": result_scenario(300, DirtyRenderer),
+    "result_full": result_scenario(300, FullRenderer),
+    "video": video_scenario(300),
+}
+
+
+def run_benchmarks(names, repeat=3):
+    """시나리오마다 repeat 번 실행해 가장 빠른 회차를 기록 (다른 프로세스 간섭을 줄이려고)"""
+    results = {}
+    for name in names:
+        best = None
+        for _ in range(repeat):
+            gc.collect()
+            outcome = SCENARIOS[name]()
+            if isinstance(outcome, str):  # 실행할 수 없는 환경 -> 건너뛴 이유
+                best = {"skipped": outcome}
+                break
+            summary = summarize(outcome)
+            if best is None or summary["per_sec"] > best["per_sec"]:
+                best = summary
+        results[name] = best
+        print(format_row(name, best), flush=True)
+    return {"meta": environment(repeat), "scenarios": results}
+
+
+def environment(repeat):
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "numpy": numpy_version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "sim_hz": config.SIM_HZ,
+        "seed": SEED,
+        "repeat": repeat,
+    }
+
+
+def format_row(name, result):
+    if "skipped" in result:
+        return f"  {name:<20} 건너뜀: {result['skipped']}"
+    return (f"  {name:<20} {result['per_sec']:>10.1f}/s  p50 {result['p50_ms']:8.3f}  "
+            f"p99 {result['p99_ms']:8.3f}  max {result['max_ms']:8.3f} ms")
+
+
+def compare(current, baseline, tolerance):
+    """기준 대비 초당 처리량이 tolerance 비율 넘게 줄어든 시나리오 목록 [(이름, 기준, 현재, 변화율)]"""
+    regressions = []
+    for name, result in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base or "skipped" in base or "skipped" in result:
+            continue
+        change = result["per_sec"] / base["per_sec"] - 1
+        mark = "  <-- 느려짐" if change < -tolerance else ""
+        print(f"  {name:<20} {base['per_sec']:>10.1f} -> {result['per_sec']:>10.1f}/s  ({change:+.1%}){mark}")
+        if mark:
+            regressions.append((name, base["per_sec"], result["per_sec"], change))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="시뮬레이션 / 그리기 성능 벤치마크")
+    parser.add_argument("--only", action="append", default=[], help="이름이 이것으로 시작하는 시나리오만 (여러 번 가능)")
+    parser.add_argument("--repeat", type=int, default=3, help="시나리오마다 반복 횟수 (가장 빠른 회차 기록)")
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--save-baseline", default=None, help="이번 결과를 기준으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="허용하는 처리량 감소 비율")
+    parser.add_argument("--list", action="store_true", help="시나리오 이름만 출력")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(SCENARIOS))
+        sys.exit(0)
+
+    names = [name for name in SCENARIOS if not args.only or any(name.startswith(p) for p in args.only)]
+    if not names:
+        parser.error(f"해당하는 시나리오가 없습니다: {args.only}")
+
+    print(f"[벤치마크] 시나리오 {len(names)}개, {args.repeat}회 중 최고 기록 (초당 / 호출당 ms)")
+    report = run_benchmarks(names, repeat=args.repeat)
+
+    for path in (args.out, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"[벤치마크] 저장 -> {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"[비교] 기준: {args.baseline} ({baseline.get('meta', {}).get('date', '?')}), 허용 {args.tolerance:.0%}")
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"[비교] 느려진 시나리오 {len(regressions)}개")
+            sys.exit(1)
+        print("[비교] 느려진 시나리오 없음")
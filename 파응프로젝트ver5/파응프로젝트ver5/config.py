@@ -5,7 +5,25 @@ import os
 # ==============================
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # 렌더링 프레임 상한
+
+# 고정 스텝 시뮬레이션 (렌더 FPS 와 무관하게 항상 같은 간격으로 진행)
+# 유닛 speed 값은 '시뮬레이션 1스텝당 픽셀' 이다
+SIM_HZ = 60
+SIM_STEP_MS = 1000 / SIM_HZ
+MAX_SIM_STEPS_PER_FRAME = 5  # 한 프레임에서 따라잡을 최대 스텝 수 (넘으면 밀린 시간은 버림)
+
+# 프레임 페이싱 (frame_pacer.py): 프레임 예산을 넘으면 시뮬레이션은 그대로 두고 그리기만 줄인다
+PACER_HEADROOM = 0.9         # 한 프레임 작업량이 예산의 이 비율을 넘으면 그리기를 한 단계 줄인다
+PACER_RECOVER = 0.6          # 그리기를 한 단계 늘려도 예상 작업량이 이 비율 밑이면 회복
+PACER_SETTLE_FRAMES = 30     # 단계를 바꾼 뒤 다음 판단까지 기다리는 프레임 수
+PACER_HALF_RATE_FX = True    # 첫 단계: 이펙트 위치 / HUD 값을 두 번 그릴 때 한 번만 갱신
+PACER_MAX_RENDER_SKIP = 4    # 최대 N 프레임에 한 번만 그리기
+PACER_SPIN_MS = 1.5          # 다음 프레임 직전 이만큼은 sleep 대신 바쁜 대기 (간격 안정)
+
+# 렌더링 방식: "dirty"(바뀐 영역만 갱신) 또는 "full"(매 프레임 전체 다시 그리기)
+RENDER_MODE = "dirty"
+DIRTY_MAX_AREA_RATIO = 0.75  # 지울 영역이 화면 넓이의 이 비율을 넘는 프레임은 전체를 다시 그린다
 
 # 색상 정의
 WHITE = (255, 255, 255)
@@ -71,6 +89,13 @@ IMG_BTN_C3_LOCK = get_path("btn_3_lock.png")
 IMG_RESULT_VIC = get_path("victory_1_.png")
 IMG_RESULT_DEF = get_path("Defeat_.png")
 
+# 이미지 출력 크기
+UNIT_SIZE = (150, 150)
+BOSS_SIZE = (375, 375)
+DEATH_EFFECT_SIZE = (150, 150)
+RESULT_IMAGE_SIZE = (600, 350)
+BUTTON_SIZE = (120, 120)
+
 # ==============================
 # [NEW] 미디어 경로 (사운드 & 비디오)
 # ==============================
@@ -78,6 +103,25 @@ IMG_RESULT_DEF = get_path("Defeat_.png")
 BASE_SOUND_DIR = r"C:\Users\wonmo\OneDrive\Desktop\파응프로젝트ver5\sound"
 SND_SWING = os.path.join(BASE_SOUND_DIR, "Swing.wav")
 
+# 미리 구운 이미지 아틀라스 (python bake_assets.py 로 생성, 없으면 원본 PNG 를 직접 로드)
+BAKED_ASSET_DIR = r"C:\Users\wonmo\OneDrive\Desktop\파응프로젝트ver5\baked"
+
+# 런처 메뉴 이미지 캐시 (표시 크기로 줄인 PPM/PNG, python menu_cache.py 로 미리 생성 가능)
+MENU_CACHE_DIR = r"C:\Users\wonmo\OneDrive\Desktop\파응프로젝트ver5\menu_cache"
+
+# 리플레이 저장 폴더 (판마다 입력 기록을 .rpl 로 저장, python replay.py 로 재생)
+REPLAY_DIR = r"C:\Users\wonmo\OneDrive\Desktop\파응프로젝트ver5\replays"
+RECORD_REPLAYS = True
+
+# 프레임 프로파일러 (F3: 프레임 시간 p50/p99 + 구간별 시간 + 유닛 수 표시, F4: 트레이스 파일 저장)
+SHOW_PROFILER = False
+PROFILER_HISTORY = 600  # 구간별로 보관하는 최근 프레임 수 (60FPS 기준 10초)
+TRACE_DIR = r"C:\Users\wonmo\OneDrive\Desktop\파응프로젝트ver5\traces"
+
+# 처리량 기록 (엔드리스 모드에서 1초마다 유닛 수 / update ms / draw ms 를 CSV 로 저장)
+ENDLESS_TELEMETRY = True
+TELEMETRY_DIR = r"C:\Users\wonmo\OneDrive\Desktop\파응프로젝트ver5\telemetry"
+
 # 비디오 경로
 BASE_VIDEO_DIR = r"C:\Users\wonmo\OneDrive\Desktop\파응프로젝트ver5\video"
 VID_ENDING = os.path.join(BASE_VIDEO_DIR, "ending.mp4")
@@ -92,4 +136,23 @@ MAX_MONEY = 2000
 
 COOLTIME_C1 = 4.0
 COOLTIME_C2 = 7.0
-COOLTIME_C3 = 10.0
\ No newline at end of file
+COOLTIME_C3 = 10.0
+
+# ==============================
+# 엔드리스(스트레스) 모드
+# ==============================
+ENDLESS_STAGE = 4                # 런처의 ENDLESS 버튼이 여는 스테이지 번호
+ENDLESS_ENGINE = "array"         # 유닛이 수백 마리까지 늘어나므로 NumPy 일괄 처리 엔진 사용
+ENDLESS_BASE_HP = 1000
+ENDLESS_TABLE_WAVES = 120        # 미리 계산하는 웨이브 수 (이후는 마지막 간격 / 마리 수로 계속)
+ENDLESS_FIRST_WAVE_MS = 3000
+ENDLESS_START_INTERVAL_MS = 4000
+ENDLESS_MIN_INTERVAL_MS = 600
+ENDLESS_INTERVAL_DECAY = 0.95    # 웨이브마다 간격에 곱하는 값
+ENDLESS_BATCH_STEP = 4           # 이 웨이브 수마다 한 번에 나오는 적 +1
+ENDLESS_MAX_BATCH = 24
+ENDLESS_BOSS_EVERY = 20          # 이 웨이브마다 보스 한 마리 포함 (0 이면 없음)
+
+# 부하 상한 (모든 스테이지 공통, 넘으면 멈추지 않고 덜 만든다)
+MAX_UNITS_PER_SIDE = 300         # 적은 대기열로 미뤘다가 자리가 나면 소환, 아군은 소환 불가
+MAX_EFFECTS = 200                # 사망 이펙트 (넘으면 새 이펙트는 생략, 전투 결과와 무관)
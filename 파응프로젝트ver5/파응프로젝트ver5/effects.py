@@ -0,0 +1,110 @@
+import pygame
+import config
+from assets import assets
+
+# ==========================================
+# 알파 단계별 페이드 프레임 (한 번만 만들어 공유)
+# ==========================================
+class FadeFrames:
+    """원본 이미지의 알파 0~255 단계 프레임 목록
+
+    각 프레임은 원본 전체를 가리키는 서브서피스에 set_alpha(단계) 만 해 둔 것이라
+    픽셀 복사 없이 256개를 만들 수 있고, 그려지는 결과는 사본에 set_alpha 한 것과 같다.
+    (레지스트리의 공유 원본 Surface 자체의 알파는 건드리지 않는다)
+    """
+    def __init__(self, base):
+        self.base = base
+        rect = base.get_rect()
+        self.frames = []
+        for level in range(256):
+            frame = base.subsurface(rect)
+            frame.set_alpha(level)
+            self.frames.append(frame)
+
+    def __getitem__(self, level):
+        return self.frames[level]
+
+
+# ==========================================
+# 사망 승천 이펙트 일괄 처리
+# ==========================================
+class EffectSystem:
+    """캐릭터 사망 시 위로 승천하며 사라지는 이펙트 전체를 한 곳에서 처리
+
+    이펙트마다 스프라이트/Surface 사본을 만들지 않고, 상태는 병렬 배열(x, y, 직전 y, 알파)로만 두고
+    그리기는 공유 FadeFrames 의 프레임을 고른 (Surface, 위치) 목록으로 한 번에 blits 한다.
+    이동/페이드는 dt 기준이라 렌더 FPS 와 무관하다.
+    동시에 max_effects 개가 넘으면 새 이펙트는 만들지 않는다 (유닛이 한꺼번에 많이 죽을 때 그리기 부하 상한).
+    """
+    def __init__(self, rise_speed=60.0, fade_speed=48.0, max_effects=None):
+        self.rise_speed = rise_speed   # 초당 픽셀 (60FPS 기준 프레임당 1px)
+        self.fade_speed = fade_speed   # 초당 알파 감소량 (60FPS 기준 프레임당 0.8)
+        self.max_effects = max_effects
+        self.skipped = 0               # 상한 때문에 생략한 이펙트 수
+        self.fade_frames = None
+        self.size = config.DEATH_EFFECT_SIZE
+        self.xs = []
+        self.ys = []
+        self.prev_ys = []
+        self.alphas = []
+
+    def load_frames(self):
+        """이펙트 이미지를 레지스트리에서 받아 알파 프레임을 준비 (스테이지 시작 시)"""
+        base = assets.image(config.IMG_C_DIE, config.DEATH_EFFECT_SIZE)
+        if base is None and not assets.headless:
+            base = pygame.Surface((125, 125), pygame.SRCALPHA)
+            base.fill((255, 255, 255, 128))
+        # 헤드리스: 그리지 않으므로 프레임 불필요 (위치/수명만 계산)
+        self.fade_frames = FadeFrames(base) if base is not None else None
+        self.size = base.get_size() if base is not None else config.DEATH_EFFECT_SIZE
+
+    def spawn(self, x, y):
+        """(x, y) 를 중심으로 이펙트 하나 시작"""
+        if self.max_effects is not None and len(self.alphas) >= self.max_effects:
+            self.skipped += 1
+            return
+        rect = pygame.Rect((0, 0), self.size)
+        rect.center = (x, y)
+        self.xs.append(rect.x)
+        self.ys.append(float(rect.y))
+        self.prev_ys.append(float(rect.y))
+        self.alphas.append(255.0)
+
+    def update(self, dt_sec):
+        if not self.alphas:
+            return
+        rise = self.rise_speed * dt_sec
+        fade = self.fade_speed * dt_sec
+        xs, ys, prev_ys, alphas = [], [], [], []
+        for x, y, alpha in zip(self.xs, self.ys, self.alphas):
+            alpha -= fade
+            if alpha <= 0:
+                continue  # 다 사라진 이펙트는 배열에서 뺀다
+            xs.append(x)
+            prev_ys.append(y)
+            ys.append(y - rise)
+            alphas.append(alpha)
+        self.xs, self.ys, self.prev_ys, self.alphas = xs, ys, prev_ys, alphas
+
+    def blit_list(self, interp=1.0):
+        """[보간 그리기] (알파 단계 프레임, 위치) 목록 - unit_blit_list 뒤에 이어 붙인다"""
+        frames = self.fade_frames
+        if frames is None:
+            return []
+        return [(frames[int(alpha)], (x, int(prev_y + (y - prev_y) * interp)))
+                for x, y, prev_y, alpha in zip(self.xs, self.ys, self.prev_ys, self.alphas)]
+
+    def draw(self, screen, interp=1.0):
+        screen.blits(self.blit_list(interp), doreturn=False)
+
+    def clear(self):
+        self.xs, self.ys, self.prev_ys, self.alphas = [], [], [], []
+
+    def snapshot(self):
+        return (list(self.xs), list(self.ys), list(self.prev_ys), list(self.alphas))
+
+    def restore(self, snap):
+        self.xs, self.ys, self.prev_ys, self.alphas = (list(values) for values in snap)
+
+    def __len__(self):
+        return len(self.alphas)
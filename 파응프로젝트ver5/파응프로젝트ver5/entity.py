@@ -1,116 +1,205 @@
 import pygame
 import config
-import os
+from assets import assets
+from lane_index import LaneGroup
+from pool import Poolable
 
-# ==========================================
-# [신규 클래스] 사망 승천 이펙트
-# ==========================================
-class DeathEffect(pygame.sprite.Sprite):
-    """캐릭터 사망 시 위로 승천하는 애니메이션 이펙트"""
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.Surface((125, 125), pygame.SRCALPHA)
-        try:
-            loaded_img = pygame.image.load(config.IMG_C_DIE).convert_alpha()
-            self.image = pygame.transform.scale(loaded_img, (150, 150))
-        except Exception:
-            self.image.fill((255, 255, 255, 128))
-
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y) 
-        self.rise_speed = 1.0 
-        self.alpha = 255       
-        self.fade_speed = 0.8
-
-    def update(self, dt_sec):
-        self.rect.y -= self.rise_speed
-        self.alpha -= self.fade_speed
-        if self.alpha <= 0:
-            self.kill()
-        else:
-            self.image.set_alpha(int(self.alpha))
+# 쿨타임 종료 이벤트를 이만큼(ms) 먼저 꺼내 확인 (scheduler.after 의 slack, 부동소수 반올림 오차보다 충분히 크고 한 스텝보다 훨씬 작게)
+COOLDOWN_SLACK_MS = 1e-6
 
 # ==========================================
-# 1. 기본 엔티티 클래스 (부모)
+# 1. 유닛 종류 표 (종류마다 한 번만 저장되는 값)
 # ==========================================
-class GameEntity(pygame.sprite.Sprite):
-    def __init__(self, x, y, hp, speed, attack_power, attack_range, attack_speed, team, image_path, attack_image_path, on_death_callback=None):
-        super().__init__()
-
+# 유닛별 능력치 표 (밸런스 조정 / 자동 밸런스 실험은 이 표만 바꾸면 된다)
+UNIT_STATS = {
+    # --- [아군] ---
+    "C1": dict(hp=100, speed=1.5, atk=2000, rng=100, atk_spd=0.8, cost=50, spawn_delay=4.0),
+    "C2": dict(hp=400, speed=0.8, atk=10, rng=90, atk_spd=0.8, cost=100, spawn_delay=7.0),
+    "C3": dict(hp=200, speed=1.2, atk=40, rng=125, atk_spd=1.0, cost=400, spawn_delay=10.0),
+    # --- [적군] ---
+    "M1_1": dict(hp=60, speed=1.0, atk=8, rng=80, atk_spd=1.0),
+    "M1_2": dict(hp=90, speed=2.0, atk=12, rng=80, atk_spd=0.8),
+    "M2_1": dict(hp=250, speed=0.5, atk=20, rng=100, atk_spd=1.2),
+    "M2_2": dict(hp=300, speed=1.1, atk=25, rng=115, atk_spd=2.0),
+    "MBoss": dict(hp=3000, speed=0.4, atk=100, rng=160, atk_spd=2),
+}
+
+# 유닛별 이미지 (config 이름: 기본 이미지, 공격 이미지, 출력 크기)
+# 실행 중 config 경로가 바뀌어도 반영되도록 이름으로 적고 쓸 때 읽는다 (manifest.py 도 이 표를 쓴다)
+UNIT_IMAGES = {
+    "C1": ("IMG_C1", "IMG_C1_A", "UNIT_SIZE"),
+    "C2": ("IMG_C2", "IMG_C2_A", "UNIT_SIZE"),
+    "C3": ("IMG_C3", "IMG_C3_A", "UNIT_SIZE"),
+    "M1_1": ("IMG_M1_1", "IMG_M1_1", "UNIT_SIZE"),
+    "M1_2": ("IMG_M1_2", "IMG_M1_2", "UNIT_SIZE"),
+    "M2_1": ("IMG_M2_1", "IMG_M2_1_A", "UNIT_SIZE"),
+    "M2_2": ("IMG_M2_2", "IMG_M2_2_A", "UNIT_SIZE"),
+    "MBoss": ("IMG_MBOSS", "IMG_MBOSS_A", "BOSS_SIZE"),
+}
+
+
+class UnitType:
+    """한 종류의 유닛이 모두 공유하는 변하지 않는 값 (능력치, 크기, 이미지, 사운드)
+
+    유닛 인스턴스에는 위치 / HP / 타이머 / 상태만 두고, 나머지는 전부 여기서 읽는다.
+    호출하면 그 종류의 유닛을 만든다: C1(x, y, on_death_callback)
+    """
+    __slots__ = ("name", "team", "direction", "max_hp", "speed", "attack_power", "attack_range",
+                 "attack_cooldown", "anim_duration", "cost", "spawn_delay", "size",
+                 "base_image", "attack_image", "swing_sound")
+
+    def __init__(self, name, team):
+        self.name = name
         self.team = team
-        self.state = "move"
-        self.on_death_callback = on_death_callback
+        self.direction = 1 if team == 'player' else -1
+        self.anim_duration = 200
+        self.base_image = None
+        self.attack_image = None
+        self.swing_sound = None
+        self.load_stats()
+
+    def load_stats(self):
+        """UNIT_STATS / config 에서 능력치와 크기를 다시 읽는다"""
+        stats = UNIT_STATS[self.name]
+        self.max_hp = stats["hp"]
+        self.speed = stats["speed"]
+        self.attack_power = stats["atk"]
+        self.attack_range = stats["rng"]
+        self.attack_cooldown = stats["atk_spd"] * 1000 
+        self.cost = stats.get("cost", 0)
+        self.spawn_delay = stats.get("spawn_delay", 0)
+        self.size = getattr(config, UNIT_IMAGES[self.name][2])
+
+    def load_assets(self):
+        """[에셋] 레지스트리에서 공유 Surface / Sound 를 받아온다 (레지스트리 캐시라 두 번째부터는 조회만)"""
+        image_attr, attack_attr, _ = UNIT_IMAGES[self.name]
+        default_surface = assets.placeholder(self.size, config.BLUE if self.team == 'player' else config.RED)
+        self.base_image = assets.image(getattr(config, image_attr), self.size) or default_surface
+        self.attack_image = assets.image(getattr(config, attack_attr), self.size) or default_surface
+
+        # [NEW] 아군 공격 사운드 (모든 아군 유닛이 하나의 Sound 객체를 공유)
+        if self.team == 'player':
+            self.swing_sound = assets.sound(config.SND_SWING, volume=0.4)
 
-        default_surface = pygame.Surface((125, 125))
-        default_surface.fill(config.BLUE if team == 'player' else config.RED)
+    def refresh(self):
+        """스테이지 시작 시 호출: 표가 바뀌었거나(밸런스 실험) 에셋 캐시를 비운 뒤에도 최신 값을 쓰도록"""
+        self.load_stats()
+        self.load_assets()
 
-        self.base_image = default_surface.copy()
-        self.attack_image = default_surface.copy()
+    def __call__(self, x, y, on_death_callback=None):
+        return GameEntity(self, x, y, on_death_callback)
 
-        self.load_and_set_image(image_path, is_attack=False)
-        self.load_and_set_image(attack_image_path, is_attack=True)
+    def __repr__(self):
+        return f"<UnitType {self.name}>"
 
-        self.image = self.base_image
-        self.rect = self.image.get_rect()
+
+# ==========================================
+# 2. 유닛 (종류 표 + 인스턴스별 상태)
+# ==========================================
+class GameEntity(Poolable):
+    """전투 유닛 하나. __slots__ 로 인스턴스별 상태만 저장한다 (__dict__ 없음)
+
+    pygame.sprite.Sprite 는 __dict__ 를 만들므로 상속하지 않고,
+    Group 이 호출하는 스프라이트 규약(add_internal / remove_internal / kill / alive)만 직접 구현한다.
+    이 규약은 아래 "스프라이트 규약" 주석에 적은 pygame 2.x 의 Group 동작에 기대고 있다
+    (확인: tests/test_sprite_protocol.py).
+    """
+    __slots__ = ("type", "state", "on_death_callback", "image", "rect", "exact_x", "prev_x",
+                 "lane", "lane_key", "hp", "last_attack_time", "attack_anim_start_time", "ready", "pool", "_groups")
+
+    def __init__(self, unit_type, x, y, on_death_callback=None):
+        self.pool = None
+        self._groups = []
+        self.rect = pygame.Rect((0, 0), unit_type.size)  # 헤드리스에서는 image 가 None 이므로 크기로 만든다
+        self.reset(unit_type, x, y, on_death_callback)
+
+    def reset(self, unit_type, x, y, on_death_callback=None):
+        """소환 직후 상태로 초기화 (오브젝트 풀에서 다시 꺼낼 때도 호출, 다른 종류로도 재사용 가능)"""
+        self.type = unit_type
+        self.state = "move"
+        self.on_death_callback = on_death_callback
+
+        self.image = unit_type.base_image
+        self.rect.size = unit_type.size
         self.rect.bottomleft = (x, y)
 
         self.exact_x = float(self.rect.x)
+        self.prev_x = self.exact_x  # 직전 스텝 위치 (그리기 보간용)
 
-        self.hp = hp
-        self.max_hp = hp
-        self.speed = speed
-        self.attack_power = attack_power
-        self.attack_range = attack_range
+        # [레인 인덱스] LaneGroup 에 추가되면 그룹이 직접 채워 넣는다
+        self.lane = None
+        self.lane_key = None
 
-        self.attack_cooldown = attack_speed * 1000 
+        self.hp = unit_type.max_hp
         self.last_attack_time = 0
-
         self.attack_anim_start_time = 0 
-        self.anim_duration = 200
-
-        # [NEW] 아군 공격 사운드 로드
-        self.swing_sound = None
-        if self.team == 'player':
-            try:
-                # 파일이 실제로 존재하는지 확인 (디버깅용)
-                if os.path.exists(config.SND_SWING):
-                    self.swing_sound = pygame.mixer.Sound(config.SND_SWING)
-                    self.swing_sound.set_volume(0.4) # 볼륨 조절 (0.0 ~ 1.0)
-                    # print(f"[알림] 사운드 로드 성공: {config.SND_SWING}")
-                else:
-                    print(f"[경고] 사운드 파일이 없습니다: {config.SND_SWING}")
-            except Exception as e:
-                print(f"[오류] 사운드 로드 중 에러 발생: {e}")
-
-    def load_and_set_image(self, path, is_attack):
-        try:
-            loaded_img = pygame.image.load(path)
-            if "Boss" in path:
-                target_size = (375, 375) 
-            else:
-                target_size = (150, 150) 
-            scaled_img = pygame.transform.scale(loaded_img, target_size)
-            if is_attack:
-                self.attack_image = scaled_img
-            else:
-                self.base_image = scaled_img
-        except Exception:
-            pass 
-
-    def update(self, target_list, current_time):
+        # 공격 가능 여부: 공격하면 False 가 되고 쿨타임 종료 이벤트가 True 로 돌린다.
+        # None 은 아직 공격한 적이 없거나(소환 / 스냅샷 복원 직후) 스케줄러 없이 도는 경우로, 시각을 직접 비교한다.
+        self.ready = None
+
+    # ------------------------------
+    # 종류 공통 값 (읽기 전용)
+    # ------------------------------
+    team = property(lambda self: self.type.team)
+    max_hp = property(lambda self: self.type.max_hp)
+    speed = property(lambda self: self.type.speed)
+    attack_power = property(lambda self: self.type.attack_power)
+    attack_range = property(lambda self: self.type.attack_range)
+    attack_cooldown = property(lambda self: self.type.attack_cooldown)
+    anim_duration = property(lambda self: self.type.anim_duration)
+    cost = property(lambda self: self.type.cost)
+    spawn_delay = property(lambda self: self.type.spawn_delay)
+    base_image = property(lambda self: self.type.base_image)
+    attack_image = property(lambda self: self.type.attack_image)
+    swing_sound = property(lambda self: self.type.swing_sound)
+
+    # ------------------------------
+    # 스프라이트 규약 (pygame.sprite.Group 과 함께 쓰기 위함, pygame 2.x 기준 - 2.6.1 에서 확인)
+    # ------------------------------
+    # Sprite 인스턴스가 아니면 AbstractGroup.add / remove / has 는 먼저 인자를 반복 가능한 묶음으로 보고
+    # 펼쳐 보다가(TypeError) 마지막 분기에서 group.add_internal(self) + self.add_internal(group) 을 부른다.
+    # 그래서 이 클래스는 __iter__ / __getitem__ / _spritegroup 을 가지면 안 된다 (묶음이나 옛 그룹으로 취급됨).
+    # 그 밖에 Group 이 쓰는 것:
+    #   - draw(): self.image / self.rect, 그룹의 spritedict 키로 쓰이므로 해시 가능해야 한다 (기본 id 해시)
+    #   - update(*args): self.update(*args)
+    #   - empty() / remove_internal: self.remove_internal(group)
+    # kill() 은 Sprite.kill 과 같이 속한 그룹마다 group.remove_internal(self) 를 부른다.
+    def add_internal(self, group):
+        self._groups.append(group)
+
+    def remove_internal(self, group):
+        self._groups.remove(group)
+
+    def kill(self):
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups.clear()
+
+    def alive(self):
+        return bool(self._groups)
+
+    def groups(self):
+        return list(self._groups)
+
+    # ------------------------------
+    # 전투
+    # ------------------------------
+    def update(self, target_list, current_time, scheduler=None):
         if self.hp <= 0:
-            if self.team == 'player' and self.on_death_callback:
+            if self.type.team == 'player' and self.on_death_callback:
                 self.on_death_callback(self.rect.centerx, self.rect.centery)
-            self.kill()
+            self.despawn()
             return
 
+        unit_type = self.type
+        self.prev_x = self.exact_x
         target = self.find_nearest_target(target_list)
 
         if target:
             distance = abs(self.rect.centerx - target.rect.centerx)
-            if distance <= self.attack_range:
+            if distance <= unit_type.attack_range:
                 self.state = "attack"
-                self.attack(target, current_time)
+                self.attack(target, current_time, scheduler)
             else:
                 self.state = "move"
                 self.move()
@@ -118,17 +207,25 @@ class GameEntity(pygame.sprite.Sprite):
             self.state = "move"
             self.move()
 
-        if current_time - self.attack_anim_start_time < self.anim_duration:
-            self.image = self.attack_image
-        else:
-            self.image = self.base_image
+        if scheduler is None:
+            # 스케줄러 없이 단독으로 돌릴 때는 매 틱 모션 시간을 확인
+            if current_time - self.attack_anim_start_time < unit_type.anim_duration:
+                self.image = unit_type.attack_image
+            else:
+                self.image = unit_type.base_image
 
     def move(self):
-        direction = 1 if self.team == 'player' else -1
-        self.exact_x += self.speed * direction
+        unit_type = self.type
+        self.exact_x += unit_type.speed * unit_type.direction
         self.rect.x = int(self.exact_x)
+        if self.lane is not None:
+            self.lane.reposition(self)
 
     def find_nearest_target(self, target_list):
+        # 정렬된 레인 그룹이면 이분 탐색 O(log n)
+        if isinstance(target_list, LaneGroup):
+            return target_list.nearest(self.rect.centerx)
+
         nearest = None
         min_dist = float('inf')
         for unit in target_list:
@@ -138,66 +235,67 @@ class GameEntity(pygame.sprite.Sprite):
                 nearest = unit
         return nearest
 
-    def attack(self, target, current_time):
-        if current_time - self.last_attack_time >= self.attack_cooldown:
-            target.take_damage(self.attack_power)
+    def attack(self, target, current_time, scheduler=None):
+        unit_type = self.type
+        ready = self.ready
+        if ready is None:
+            ready = current_time - self.last_attack_time >= unit_type.attack_cooldown
+        if ready:
+            target.take_damage(unit_type.attack_power)
             self.last_attack_time = current_time
             self.attack_anim_start_time = current_time
+            if scheduler is not None:
+                # 쿨타임 / 공격 모션은 예약 이벤트로 끝낸다 (쿨타임 중인 유닛은 매 틱 시각을 비교하지 않음)
+                self.ready = False
+                scheduler.after(current_time, unit_type.attack_cooldown, self.end_cooldown, current_time,
+                                slack=COOLDOWN_SLACK_MS)
+                self.image = unit_type.attack_image
+                scheduler.after(current_time, unit_type.anim_duration, self.end_attack_anim, current_time)
             
             # [NEW] 아군이면 공격 사운드 재생
-            if self.swing_sound:
-                self.swing_sound.play()
+            if unit_type.swing_sound:
+                unit_type.swing_sound.play()
+
+    def end_cooldown(self, now, start_time):
+        """쿨타임 종료 이벤트 (풀로 돌아갔다가 재사용된 경우는 무시)"""
+        if self.last_attack_time == start_time and self.ready is False:
+            self.ready = True
+
+    def end_attack_anim(self, now, start_time):
+        """공격 모션 종료 이벤트 (그 사이 다시 공격했거나 풀로 돌아갔다가 재사용된 경우는 무시)"""
+        if self.attack_anim_start_time == start_time:
+            self.image = self.type.base_image
+
+    def save_state(self):
+        """스냅샷용 상태 튜플: (종류 이름, x, 직전 x, rect.x, rect.bottom, HP, 마지막 공격 시각, 모션 시작 시각, 상태)"""
+        return (self.type.name, self.exact_x, self.prev_x, self.rect.x, self.rect.bottom, self.hp,
+                self.last_attack_time, self.attack_anim_start_time, self.state)
+
+    def load_state(self, state, now):
+        """save_state() 값으로 되돌린다. now 기준으로 공격 모션 중이면 True"""
+        (_, self.exact_x, self.prev_x, self.rect.x, self.rect.bottom, self.hp,
+         self.last_attack_time, self.attack_anim_start_time, self.state) = state
+        unit_type = self.type
+        in_attack_anim = self.attack_anim_start_time > 0 and now - self.attack_anim_start_time < unit_type.anim_duration
+        self.image = unit_type.attack_image if in_attack_anim else unit_type.base_image
+        return in_attack_anim
 
     def take_damage(self, amount):
         self.hp -= amount
 
 # ==========================================
-# 2. 팀별 중간 부모 클래스
-# ==========================================
-class PlayerUnit(GameEntity):
-    def __init__(self, x, y, hp, speed, atk, rng, atk_spd, cost, spawn_delay, image_path, attack_image_path, on_death_callback):
-        super().__init__(x, y, hp, speed, atk, rng, atk_spd, 'player', image_path, attack_image_path, on_death_callback)
-        self.cost = cost
-        self.spawn_delay = spawn_delay
-
-class EnemyUnit(GameEntity):
-    def __init__(self, x, y, hp, speed, atk, rng, atk_spd, image_path, attack_image_path):
-        super().__init__(x, y, hp, speed, atk, rng, atk_spd, 'enemy', image_path, attack_image_path, None)
-
-# ==========================================
-# 3. 개별 캐릭터 상세 정의
+# 3. 개별 캐릭터 정의 (종류 표)
 # ==========================================
+UNIT_TYPES = {name: UnitType(name, 'player' if name.startswith("C") else 'enemy') for name in UNIT_STATS}
 
 # --- [아군] ---
-class C1(PlayerUnit):
-    def __init__(self, x, y, on_death_callback):
-        super().__init__(x, y, hp=100, speed=1.5, atk=2000, rng=100, atk_spd=0.8, cost=50, spawn_delay=4.0, image_path=config.IMG_C1, attack_image_path=config.IMG_C1_A, on_death_callback=on_death_callback)
-
-class C2(PlayerUnit):
-    def __init__(self, x, y, on_death_callback):
-        super().__init__(x, y, hp=400, speed=0.8, atk=10, rng=90, atk_spd=0.8, cost=100, spawn_delay=7.0, image_path=config.IMG_C2, attack_image_path=config.IMG_C2_A, on_death_callback=on_death_callback)
-
-class C3(PlayerUnit):
-    def __init__(self, x, y, on_death_callback):
-        super().__init__(x, y, hp=200, speed=1.2, atk=40, rng=125, atk_spd=1.0, cost=400, spawn_delay=10.0, image_path=config.IMG_C3, attack_image_path=config.IMG_C3_A, on_death_callback=on_death_callback)
+C1 = UNIT_TYPES["C1"]
+C2 = UNIT_TYPES["C2"]
+C3 = UNIT_TYPES["C3"]
 
 # --- [적군] ---
-class M1_1(EnemyUnit):
-    def __init__(self, x, y):
-        super().__init__(x, y, hp=60, speed=1.0, atk=8, rng=80, atk_spd=1.0, image_path=config.IMG_M1_1, attack_image_path=config.IMG_M1_1)
-
-class M1_2(EnemyUnit):
-    def __init__(self, x, y):
-        super().__init__(x, y, hp=90, speed=2.0, atk=12, rng=80, atk_spd=0.8, image_path=config.IMG_M1_2, attack_image_path=config.IMG_M1_2)
-
-class M2_1(EnemyUnit):
-    def __init__(self, x, y):
-        super().__init__(x, y, hp=250, speed=0.5, atk=20, rng=100, atk_spd=1.2, image_path=config.IMG_M2_1, attack_image_path=config.IMG_M2_1_A)
-
-class M2_2(EnemyUnit):
-    def __init__(self, x, y):
-        super().__init__(x, y, hp=300, speed=1.1, atk=25, rng=115, atk_spd=2.0, image_path=config.IMG_M2_2, attack_image_path=config.IMG_M2_2_A)
-
-class MBoss(EnemyUnit):
-    def __init__(self, x, y):
-        super().__init__(x, y, hp=3000, speed=0.4, atk=100, rng=160, atk_spd=2, image_path=config.IMG_MBOSS, attack_image_path=config.IMG_MBOSS_A)
\ No newline at end of file
+M1_1 = UNIT_TYPES["M1_1"]
+M1_2 = UNIT_TYPES["M1_2"]
+M2_1 = UNIT_TYPES["M2_1"]
+M2_2 = UNIT_TYPES["M2_2"]
+MBoss = UNIT_TYPES["MBoss"]
@@ -0,0 +1,119 @@
+from time import perf_counter, sleep
+import config
+
+# ==========================================
+# 적응형 프레임 페이싱
+# ==========================================
+# clock.tick(FPS) 대신 쓰는 프레임 간격 조절기.
+#   - 대기: 다음 프레임 시각 PACER_SPIN_MS 전까지는 sleep, 남은 시간은 perf_counter 로 바쁜 대기
+#     (sleep 만 쓰면 OS 타이머 해상도만큼 간격이 들쭉날쭉하다)
+#   - 측정: 프레임마다 update(이벤트 + 시뮬레이션) / draw(UI + 그리기 + 화면 반영) 비용의 이동 평균
+#   - 조절: 한 프레임 평균 작업량이 예산(1000/FPS ms)의 PACER_HEADROOM 을 넘으면 단계를 올리고,
+#           한 단계 내렸을 때의 예상 작업량이 PACER_RECOVER 밑이면 내린다 (바꾼 뒤 PACER_SETTLE_FRAMES 동안은 유지)
+#       단계 0 : 매 프레임 그리기
+#       단계 1 : 이펙트 위치 / HUD 값을 두 번 그릴 때 한 번만 갱신 (PACER_HALF_RATE_FX)
+#       단계 2~: 그 위에 N 프레임에 한 번만 그리기 (N = 단계, 최대 PACER_MAX_RENDER_SKIP)
+# 건너뛰는 것은 그리기뿐이고 시뮬레이션은 고정 스텝 그대로라서, 느린 컴퓨터에서도 전투 결과는 같다.
+
+class FramePacer:
+    def __init__(self, fps=None):
+        self.fps = fps or config.FPS
+        self.budget_ms = 1000 / self.fps
+        self.spin_sec = config.PACER_SPIN_MS / 1000
+        self.max_level = config.PACER_MAX_RENDER_SKIP + (1 if config.PACER_HALF_RATE_FX else 0) - 1
+        self.reset()
+
+    def reset(self):
+        """새 판 시작 (메뉴에 머물던 시간이 첫 프레임 간격으로 들어가지 않도록 시계도 맞춘다)"""
+        self.level = 0
+        self.frame = 0             # 지금까지 지난 프레임 수
+        self.rendered = 0          # 그 중 그린 프레임 수
+        self.skipped = 0           # 건너뛴 그리기 수
+        self.update_ms = 0.0       # 이동 평균
+        self.draw_ms = 0.0
+        self._settle = config.PACER_SETTLE_FRAMES
+        self._last = perf_counter()
+        self._deadline = self._last
+
+    # ------------------------------------------
+    # 대기
+    # ------------------------------------------
+    def wait(self):
+        """다음 프레임 시각까지 기다리고, 지난 프레임부터 흐른 시간(ms)을 반환 (clock.tick 대신)"""
+        self._deadline += 1 / self.fps
+        now = perf_counter()
+        if now >= self._deadline:
+            # 이미 늦었다: 밀린 프레임을 몰아서 따라잡지 않고 지금부터 다시 센다
+            self._deadline = now
+        else:
+            remaining = self._deadline - now - self.spin_sec
+            if remaining > 0:
+                sleep(remaining)
+            while perf_counter() < self._deadline:
+                pass
+            now = perf_counter()
+        dt_ms = (now - self._last) * 1000
+        self._last = now
+        return dt_ms
+
+    # ------------------------------------------
+    # 이번 프레임에 할 일
+    # ------------------------------------------
+    @property
+    def render_every(self):
+        """N 프레임에 한 번 그리기"""
+        return self._render_every(self.level)
+
+    @staticmethod
+    def _render_every(level):
+        offset = 1 if config.PACER_HALF_RATE_FX else 0
+        return max(1, level - offset + 1)
+
+    @property
+    def half_rate(self):
+        return config.PACER_HALF_RATE_FX and self.level >= 1
+
+    def should_render(self):
+        return self.frame % self.render_every == 0
+
+    def fresh_fx(self):
+        """이번에 그리는 프레임에서 이펙트 / HUD 를 새로 계산할지 (반속도 단계면 두 번에 한 번)"""
+        return not self.half_rate or self.rendered % 2 == 0
+
+    # ------------------------------------------
+    # 측정 / 조절
+    # ------------------------------------------
+    def end_frame(self, update_ms, draw_ms=None):
+        """프레임 마감. draw_ms 가 None 이면 이번 프레임은 그리지 않은 것"""
+        self.frame += 1
+        self.update_ms += (update_ms - self.update_ms) * 0.1
+        if draw_ms is None:
+            self.skipped += 1
+        else:
+            self.rendered += 1
+            self.draw_ms += (draw_ms - self.draw_ms) * 0.1
+
+        if self._settle > 0:
+            self._settle -= 1
+            return
+        if self._cost(self.level) > self.budget_ms * config.PACER_HEADROOM and self.level < self.max_level:
+            self.level += 1
+            self._settle = config.PACER_SETTLE_FRAMES
+        elif self.level > 0 and self._cost(self.level - 1) < self.budget_ms * config.PACER_RECOVER:
+            self.level -= 1
+            self._settle = config.PACER_SETTLE_FRAMES
+
+    def _cost(self, level):
+        """level 단계에서의 한 프레임 평균 작업량 예상 (그리기는 N 프레임에 한 번이므로 1/N)"""
+        return self.update_ms + self.draw_ms / self._render_every(level)
+
+    def status(self):
+        """HUD 표시용 글자 (단계 0 이면 빈 문자열)"""
+        if self.level == 0:
+            return ""
+        parts = []
+        if self.render_every > 1:
+            parts.append(f"render 1/{self.render_every}")
+        if self.half_rate:
+            parts.append("fx 1/2")
+        return "  ".join(parts)
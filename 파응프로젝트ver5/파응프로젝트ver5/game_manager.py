@@ -1,170 +1,403 @@
 import pygame
 import config
-from entity import C1, C2, C3, M1_1, M1_2, M2_1, M2_2, MBoss, DeathEffect
+import snapshot as snapshot_codec
+from entity import C1, C2, C3, M1_1, M1_2, M2_1, M2_2, MBoss, GameEntity, UNIT_TYPES
+from effects import EffectSystem
+from lane_index import LaneGroup
+from array_engine import ArrayCombatEngine
+from ui_text import HudText
+from pool import ObjectPool
+from scheduler import Scheduler
+from waves import WaveTable, ENDLESS_ENEMY_POOL, ENDLESS_BOSS
+from time import perf_counter
 import random
 
+# 스테이지별 적 구성 (manifest.py 가 스테이지 미리 로드 목록을 만들 때도 쓴다)
+STAGE_ENEMY_POOLS = {
+    1: [M1_1, M1_2, M2_1],  # Stage 1: 약함
+    2: [M1_2, M2_1, M2_2],  # Stage 2: 보통
+    3: [M2_1, M2_2],        # Stage 3: 어려움 (강한 유닛만)
+    config.ENDLESS_STAGE: ENDLESS_ENEMY_POOL,  # 엔드리스: 웨이브 표의 단계별로 이 중 일부만 (waves.py)
+}
+# 보스가 나오는 스테이지 (일반 스테이지는 마지막 적 대신, 엔드리스는 보스 웨이브마다)
+STAGE_BOSSES = {3: MBoss, config.ENDLESS_STAGE: ENDLESS_BOSS}
+
+# 스냅샷에 저장되는 유닛 종류 순번
+UNIT_TYPE_NAMES = list(UNIT_TYPES)
+
+# 소환 버튼 번호 -> 아군 유닛 종류
+PLAYER_UNIT_TYPES = {1: C1, 2: C2, 3: C3}
+
+
+def stage_unit_types(stage_level):
+    """스테이지에 나오는 모든 유닛 종류 (아군 + 적 구성 + 보스)"""
+    unit_types = list(PLAYER_UNIT_TYPES.values())
+    unit_types += STAGE_ENEMY_POOLS.get(stage_level, STAGE_ENEMY_POOLS[1])
+    if stage_level in STAGE_BOSSES:
+        unit_types.append(STAGE_BOSSES[stage_level])
+    return unit_types
+
 class GameManager:
-    def __init__(self, stage_level):
+    def __init__(self, stage_level, engine="object", seed=None):
+        """engine: "object"(스프라이트별 update) 또는 "array"(NumPy 일괄 처리)
+        seed: 적 구성/소환 간격 난수 시드 (None 이면 reset 할 때마다 새로 뽑는다)
+        """
         self.stage_level = stage_level
+        self.engine_mode = engine
+        self.base_seed = seed
+
+        # [엔드리스] 정해진 수 대신 웨이브 표대로 끝없이 (표는 한 번만 계산해 RETRY 에도 재사용)
+        self.endless = stage_level == config.ENDLESS_STAGE
+        self.wave_table = WaveTable() if self.endless else None
+
+        # [HUD] 폰트별 HudText 묶음 (draw_hud 에서 처음 그릴 때 생성, reset 후에도 재사용)
+        self._hud_font = None
+        self._hud = None
+
+        # [오브젝트 풀] 죽은 유닛을 모아 재사용 (reset 후에도 유지)
+        self.pool = ObjectPool()
+
+        # [이펙트] 사망 이펙트는 스프라이트 대신 배열 + 공유 알파 프레임으로 일괄 처리
+        self.effects = EffectSystem(max_effects=config.MAX_EFFECTS)
+
+        # [스케줄러] 돈 지급 / 웨이브 소환 / 공격 모션 종료 / 버튼 쿨타임 해제를 시각 예약으로 처리
+        self.scheduler = Scheduler()
+
+        # [프로파일러] 실행 환경이 FrameProfiler 를 넣어 주면 update 세부 구간 시간을 기록 (None 이면 측정 안 함)
+        self.profiler = None
 
-        # [경제 시스템]
+        self.reset()
+
+    def reset(self):
+        """같은 스테이지를 처음 상태로 되돌린다 (RETRY 용, 객체/HUD 캐시는 그대로 재사용)"""
+        stage_level = self.stage_level
+
+        # 이전 판에 남아 있던 유닛은 풀로 돌려보낸다 (RETRY)
+        for group in (getattr(self, "player_units", ()), getattr(self, "enemy_units", ())):
+            for sprite in list(group):
+                sprite.despawn()
+        self.effects.clear()
+        self.effects.load_frames()
+
+        # [난수] 판마다 자기 시드의 Random 만 쓴다 (시드 + 입력 기록만 있으면 같은 판을 그대로 재현)
+        self.seed = self.base_seed if self.base_seed is not None else random.randrange(1 << 32)
+        self.rng = random.Random(self.seed)
+
+        # 유닛 종류 표를 최신 능력치 / 에셋으로 갱신 (유닛 인스턴스는 이 표를 공유한다)
+        for unit_type in stage_unit_types(stage_level):
+            unit_type.refresh()
+
+        # [고정 스텝 시계] sim_time 은 tick * SIM_STEP_MS (ms) 로만 증가한다
+        self.tick = 0
+        self.sim_time = 0.0
+        self.accumulator = 0.0
+        self.dropped_ms = 0.0  # 따라잡기 한도를 넘어 버린 시간 누계 (처리량 기록용, 시뮬레이션 상태 아님)
+        self.scheduler.clear()
+
+        # [경제 시스템] MONEY_INTERVAL 마다 돈 지급 (예약 이벤트)
         self.money = 0
-        self.money_timer = 0
+        self.income_time = 0  # 마지막으로 돈을 받은 시각
 
         # [게임 상태: 기지 HP]
-        self.player_base_hp = config.PLAYER_BASE_HP
+        self.max_base_hp = config.ENDLESS_BASE_HP if self.endless else config.PLAYER_BASE_HP
+        self.player_base_hp = self.max_base_hp
         self.game_over = False
         self.result_message = ""
         
         # [★ 수정] 보스 등장 여부 확인 플래그
         self.boss_spawned = False
 
-        # [유닛 그룹]
-        self.player_units = pygame.sprite.Group()
-        self.enemy_units = pygame.sprite.Group()
-        self.effects = pygame.sprite.Group()
+        # [유닛 그룹] x좌표로 정렬된 레인 그룹 (가까운 적 탐색을 이분 탐색으로)
+        self.player_units = LaneGroup()
+        self.enemy_units = LaneGroup()
+
+        # [엔진] array 모드에서는 유닛 상태를 NumPy 배열로 관리하고 스프라이트는 그리기만 한다
+        self.engine = None
+        if self.engine_mode == "array":
+            self.engine = ArrayCombatEngine(on_player_death=self.create_death_effect)
+            self.player_units = pygame.sprite.Group()
+            self.enemy_units = pygame.sprite.Group()
 
         # [웨이브 관리]
-        # Stage 1: 10마리, Stage 2: 15마리, Stage 3: 20마리
-        self.total_enemies_to_spawn = 5 + (stage_level * 5) 
+        # Stage 1: 10마리, Stage 2: 15마리, Stage 3: 20마리 (엔드리스는 끝이 없으므로 0)
+        self.total_enemies_to_spawn = 0 if self.endless else 5 + (stage_level * 5)
         self.enemies_spawned_count = 0
         self.spawn_timer = 0
-        self.spawn_interval = 3000 
+        self.spawn_interval = self.wave_table[0][0] if self.endless else 3000
+        self.wave = 0           # 엔드리스: 다음에 나올 웨이브 번호
+        self.spawn_backlog = 0  # 유닛 수 상한 때문에 미뤄 둔 적 수 (자리가 나면 다음 웨이브 때 소환)
+
+        self._schedule_timers()
+
+    def _schedule_timers(self):
+        """돈 지급 / 다음 웨이브 이벤트 예약 (reset, restore 공통)"""
+        self.scheduler.after(self.income_time, config.MONEY_INTERVAL * 1000, self._on_income)
+        if self.endless:
+            self.scheduler.after(self.spawn_timer, self.spawn_interval, self._on_endless_wave, strict=True)
+        elif self.enemies_spawned_count < self.total_enemies_to_spawn:
+            self.scheduler.after(self.spawn_timer, self.spawn_interval, self._on_wave, strict=True)
+
+    def _on_income(self, now):
+        if self.money < config.MAX_MONEY:
+            self.money += config.MONEY_RATE
+        self.income_time = now
+        self.scheduler.after(now, config.MONEY_INTERVAL * 1000, self._on_income)
+
+    def _on_wave(self, now):
+        if self.enemies_spawned_count >= self.total_enemies_to_spawn:
+            return
+        self.spawn_enemy()
+        self.spawn_timer = now
+        self.spawn_interval = self.rng.randint(2000, 5000)
+        self.scheduler.after(self.spawn_timer, self.spawn_interval, self._on_wave, strict=True)
+
+    def _on_endless_wave(self, now):
+        """웨이브 표의 다음 웨이브 소환. 적이 상한만큼 있으면 남는 수는 대기열로 미룬다"""
+        _, _, count, tier, boss = self.wave_table[self.wave]
+        queued = self.spawn_backlog + count
+        room = max(0, config.MAX_UNITS_PER_SIDE - len(self.enemy_units))
+        spawn_count = min(queued, room)
+        enemy_pool = self.wave_table.pool(tier)
+        for i in range(spawn_count):
+            if boss and i == 0:  # (자리가 하나도 없으면 이번 보스는 건너뛴다)
+                self.boss_spawned = True
+                self._add_enemy(ENDLESS_BOSS)
+            else:
+                self._add_enemy(self.rng.choice(enemy_pool))
+        self.spawn_backlog = queued - spawn_count
+
+        # 다음 웨이브는 표의 시각에 맞춘다 (틱 단위로 늦게 실행된 만큼이 쌓이지 않도록)
+        self.wave += 1
+        self.spawn_timer = now
+        self.spawn_interval = self.wave_table[self.wave][0] - now
+        self.scheduler.after(self.spawn_timer, self.spawn_interval, self._on_endless_wave, strict=True)
 
     def create_death_effect(self, x, y):
-        effect = DeathEffect(x, y)
-        self.effects.add(effect)
+        self.effects.spawn(x, y)
+
+    def advance(self, frame_dt_sec):
+        """[고정 스텝] 렌더 프레임 시간을 누적해 고정 간격 스텝으로 소비하고, 보간 비율(0~1)을 반환"""
+        self.accumulator += frame_dt_sec * 1000
+        steps = 0
+        while self.accumulator >= config.SIM_STEP_MS and not self.game_over:
+            if steps >= config.MAX_SIM_STEPS_PER_FRAME:
+                # 따라잡기 한도 초과: 밀린 시간은 버린다 (화면이 잠깐 느려질 뿐 전투 결과는 같다)
+                self.dropped_ms += self.accumulator
+                self.accumulator = 0.0
+                break
+            self.step()
+            self.accumulator -= config.SIM_STEP_MS
+            steps += 1
+        return min(self.accumulator / config.SIM_STEP_MS, 1.0)
+
+    def step(self):
+        """시뮬레이션 1스텝 진행"""
+        self.tick += 1
+        self.sim_time = self.tick * config.SIM_STEP_MS
+        self.update(config.SIM_STEP_MS / 1000, self.sim_time)
 
     def update(self, dt_sec, current_time):
         if self.game_over: return
+        prof = self.profiler
+        if prof: t = perf_counter()
 
-        # 1. [경제] 돈 자동 증가
-        self.money_timer += dt_sec
-        if self.money_timer >= config.MONEY_INTERVAL:
-            if self.money < config.MAX_MONEY:
-                self.money += config.MONEY_RATE
-            self.money_timer = 0
-
-        # 2. [시스템] 적 자동 생성 (웨이브)
-        if self.enemies_spawned_count < self.total_enemies_to_spawn:
-            if current_time - self.spawn_timer > self.spawn_interval:
-                self.spawn_enemy()
-                self.spawn_timer = current_time
-                self.spawn_interval = random.randint(2000, 5000)
+        # 1~2. [경제 / 웨이브 / 타이머] 시각이 된 예약 이벤트만 실행 (돈 지급, 적 소환, 모션 종료 등)
+        self.scheduler.run_due(current_time)
+        if prof: t = prof.record("sim.timers", t)
 
         # 3. 유닛 업데이트 및 충돌 처리
-        self.player_units.update(self.enemy_units, current_time)
-        self.enemy_units.update(self.player_units, current_time)
+        if self.engine:
+            self.engine.step(current_time)
+            if prof: t = prof.record("sim.units", t)
+        else:
+            self.player_units.update(self.enemy_units, current_time, self.scheduler)
+            if prof: t = prof.record("sim.players", t)
+            self.enemy_units.update(self.player_units, current_time, self.scheduler)
+            if prof: t = prof.record("sim.enemies", t)
         self.effects.update(dt_sec)
+        if prof: t = prof.record("sim.effects", t)
 
         # 4. 승패 판정
         self.check_game_status()
+        if prof: prof.record("sim.status", t)
 
     def spawn_player_unit(self, unit_type):
         spawn_x, spawn_y = 100, config.SCREEN_HEIGHT - 100
-        new_unit = None
-        if unit_type == 1:
-            new_unit = C1(spawn_x, spawn_y, self.create_death_effect)
-        elif unit_type == 2:
-            new_unit = C2(spawn_x, spawn_y, self.create_death_effect)
-        elif unit_type == 3:
-            new_unit = C3(spawn_x, spawn_y, self.create_death_effect)
-
-        if new_unit:
-            if self.money >= new_unit.cost:
-                self.money -= new_unit.cost
-                self.player_units.add(new_unit)
-                return True
-        return False
+        player_type = PLAYER_UNIT_TYPES.get(unit_type)
+        if player_type is None:
+            return False
+
+        # 살 수 있는지 먼저 확인 (돈이 모자라거나 유닛 수 상한이면 만들지 않는다)
+        if self.money < player_type.cost or len(self.player_units) >= config.MAX_UNITS_PER_SIDE:
+            return False
+
+        new_unit = self.pool.acquire(GameEntity, player_type, spawn_x, spawn_y, self.create_death_effect)
+        self.money -= player_type.cost
+        self.player_units.add(new_unit)
+        if self.engine: self.engine.add_player(new_unit)
+        return True
 
     def spawn_enemy(self):
         """[시스템] 적 생성 로직 - 스테이지별 난이도 조정"""
-        spawn_x, spawn_y = config.SCREEN_WIDTH - 50, config.SCREEN_HEIGHT - 100
-
         # [수정] 스테이지별 적 구성
-        enemy_pool = [M1_1, M1_2, M2_1] # Stage 1: 약함
-
-        if self.stage_level == 2:
-            enemy_pool = [M1_2, M2_1, M2_2] # Stage 2: 보통
-        elif self.stage_level == 3:
-            enemy_pool = [M2_1, M2_2]       # Stage 3: 어려움 (강한 유닛만)
-
-        enemy_class = random.choice(enemy_pool)
+        enemy_pool = STAGE_ENEMY_POOLS.get(self.stage_level, STAGE_ENEMY_POOLS[1])
+        enemy_type = self.rng.choice(enemy_pool)
 
         # 마지막 유닛인지 확인
         is_last_enemy = (self.enemies_spawned_count == self.total_enemies_to_spawn - 1)
 
         # [★ 수정] Stage 3의 마지막은 보스 등장 (Stage 2 제외)
-        if is_last_enemy and self.stage_level == 3:
-             enemy_class = MBoss
+        if is_last_enemy and self.stage_level in STAGE_BOSSES:
+             enemy_type = STAGE_BOSSES[self.stage_level]
              self.boss_spawned = True # 보스 소환됨 표시
 
-        enemy = enemy_class(spawn_x, spawn_y)
+        self._add_enemy(enemy_type)
+
+    def _add_enemy(self, enemy_type):
+        spawn_x, spawn_y = config.SCREEN_WIDTH - 50, config.SCREEN_HEIGHT - 100
+        enemy = self.pool.acquire(GameEntity, enemy_type, spawn_x, spawn_y)
         self.enemy_units.add(enemy)
+        if self.engine: self.engine.add_enemy(enemy)
         self.enemies_spawned_count += 1
 
     def check_game_status(self):
-        for enemy in self.enemy_units:
-            # 적이 화면 왼쪽 끝에 닿으면 데미지
-            if enemy.rect.left <= 0:
-                self.player_base_hp -= 50 
-                enemy.kill() 
+        # 적이 화면 왼쪽 끝에 닿으면 데미지
+        if self.engine:
+            self.player_base_hp -= 50 * self.engine.remove_at_base()
+        else:
+            # (왼쪽 끝 후보는 centerx 가 가장 큰 유닛 폭의 절반 이하인 유닛들뿐)
+            for enemy in self.enemy_units.in_range(0, config.BOSS_SIZE[0] // 2):
+                if enemy.rect.left <= 0:
+                    self.player_base_hp -= 50 
+                    enemy.despawn() 
 
         if self.player_base_hp <= 0:
             self.game_over = True
             self.result_message = "DEFEAT..."
 
-        if (self.enemies_spawned_count >= self.total_enemies_to_spawn) and (len(self.enemy_units) == 0):
+        if not self.endless and (self.enemies_spawned_count >= self.total_enemies_to_spawn) and (len(self.enemy_units) == 0):
             self.game_over = True
             self.result_message = "VICTORY!!"
 
-    def draw_ui(self, screen, font):
-        # HP 바
-        pygame.draw.rect(screen, config.RED, (20, 20, 200, 20)) 
-        hp_ratio = max(0, self.player_base_hp / config.PLAYER_BASE_HP)
-        pygame.draw.rect(screen, config.GREEN, (20, 20, 200 * hp_ratio, 20)) 
-
-        # 텍스트 UI
-        hp_text = font.render(f"Base HP: {self.player_base_hp}", True, config.BLACK)
-        screen.blit(hp_text, (230, 20))
-
-        money_text = font.render(f"Money: {self.money} / {config.MAX_MONEY}", True, config.BLACK)
-        screen.blit(money_text, (20, 50))
-
-        remaining = self.total_enemies_to_spawn - self.enemies_spawned_count + len(self.enemy_units)
-        wave_text = font.render(f"Enemies Left: {remaining}", True, config.RED)
-        screen.blit(wave_text, (config.SCREEN_WIDTH - 250, 20))
+    # ==========================================
+    # 스냅샷 (리플레이 탐색 / 체크포인트)
+    # ==========================================
+    def unit_states(self):
+        """(아군 상태 목록, 적 상태 목록) - GameEntity.save_state 형식, 그룹 순서 그대로"""
+        if self.engine:
+            return self.engine.players.unit_states(), self.engine.enemies.unit_states()
+        return ([unit.save_state() for unit in self.player_units],
+                [unit.save_state() for unit in self.enemy_units])
+
+    def state(self):
+        """현재 판의 시뮬레이션 상태 딕셔너리 (에셋/Surface/콜백은 담지 않는다)"""
+        players, enemies = self.unit_states()
+        return {
+            "stage_level": self.stage_level, "engine": self.engine_mode,
+            "tick": self.tick, "sim_time": self.sim_time, "accumulator": self.accumulator,
+            "money": self.money, "income_time": self.income_time,
+            "player_base_hp": self.player_base_hp, "game_over": self.game_over,
+            "result_message": self.result_message, "boss_spawned": self.boss_spawned,
+            "enemies_spawned_count": self.enemies_spawned_count,
+            "spawn_timer": self.spawn_timer, "spawn_interval": self.spawn_interval,
+            "wave": self.wave, "spawn_backlog": self.spawn_backlog,
+            "seed": self.seed, "rng": self.rng.getstate(),
+            "players": players, "enemies": enemies,
+            "effects": self.effects.snapshot(),
+        }
+
+    def snapshot(self):
+        """현재 상태를 압축 바이트 버퍼로 저장 (체크포인트 / 리플레이 탐색 / 분기 탐색용)"""
+        return snapshot_codec.pack(self.state(), UNIT_TYPE_NAMES)
+
+    def restore(self, data):
+        """snapshot() 버퍼로 되돌린다 (에셋 재로드 없음, 같은 스테이지 / 엔진의 GameManager 에서만)"""
+        snap = snapshot_codec.unpack(data, UNIT_TYPE_NAMES)
+        if (snap["stage_level"], snap["engine"]) != (self.stage_level, self.engine_mode):
+            raise ValueError(f"다른 판의 스냅샷입니다: 스테이지 {snap['stage_level']} / {snap['engine']}")
+
+        for group in (self.player_units, self.enemy_units):
+            for sprite in list(group):
+                sprite.despawn()
+        if self.engine:
+            self.engine.clear()
+
+        for name in ("tick", "sim_time", "accumulator", "money", "income_time", "player_base_hp",
+                     "game_over", "result_message", "boss_spawned", "enemies_spawned_count",
+                     "spawn_timer", "spawn_interval", "wave", "spawn_backlog", "seed"):
+            setattr(self, name, snap[name])
+        self.rng.setstate(snap["rng"])
+        self.effects.restore(snap["effects"])
+
+        self.scheduler.clear()
+        self._schedule_timers()
+        for states, group, on_death in ((snap["players"], self.player_units, self.create_death_effect),
+                                        (snap["enemies"], self.enemy_units, None)):
+            for state in states:
+                unit = self.pool.acquire(GameEntity, UNIT_TYPES[state[0]], state[3], state[4], on_death)
+                in_attack_anim = unit.load_state(state, self.sim_time)
+                group.add(unit)
+                if self.engine:
+                    (self.engine.add_player if on_death else self.engine.add_enemy)(unit)
+                elif in_attack_anim:
+                    # 공격 모션 도중이었으면 종료 이벤트도 다시 예약
+                    self.scheduler.after(unit.attack_anim_start_time, unit.anim_duration,
+                                         unit.end_attack_anim, unit.attack_anim_start_time)
+
+    def checksum(self):
+        """시뮬레이션 결과를 좌우하는 상태의 CRC32 (리플레이 검증용, 그리기 전용 값은 제외)"""
+        return snapshot_codec.sim_checksum(self.state(), UNIT_TYPE_NAMES)
+
+    def draw_units(self, screen, alpha=1.0):
+        """[보간 그리기] 직전 스텝과 현재 스텝 위치 사이를 alpha 비율로 보간해서 그린다"""
+        screen.blits(self.unit_blit_list(alpha), doreturn=False)
+
+    def unit_blit_list(self, alpha=1.0, effects=True):
+        """적 -> 아군 -> 이펙트 순서의 (Surface, 보간 위치) 목록 (effects=False 면 이펙트는 빼고)"""
+        blit_list = []
+        for group in (self.enemy_units, self.player_units):
+            for unit in group:
+                x = unit.prev_x + (unit.exact_x - unit.prev_x) * alpha
+                blit_list.append((unit.image, (int(x), unit.rect.y)))
+        if effects:
+            blit_list.extend(self.effects.blit_list(alpha))
+        return blit_list
 
-        # ==============================
-        # 승패 이미지 화면 출력
-        # ==============================
-        if self.game_over:
+    def draw_ui(self, screen, font):
+        # 승패 결과 화면은 renderer.ResultScreen 이 그린다
+        self.draw_hud(screen, font)
 
-            # 반투명 오버레이
-            overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
-            overlay.set_alpha(150)
-            overlay.fill(config.BLACK)
-            screen.blit(overlay, (0, 0))
+    def hud_key(self):
+        """HUD 에 표시되는 값 묶음 (값이 같으면 HUD 를 다시 그릴 필요 없음)"""
+        return (self.player_base_hp, self.money, self.enemies_remaining(), self.wave)
 
-            # 1) 이미지 로드
-            victory_img = pygame.image.load(config.IMG_RESULT_VIC)
-            defeat_img = pygame.image.load(config.IMG_RESULT_DEF)
+    def enemies_remaining(self):
+        if self.endless:
+            return len(self.enemy_units) + self.spawn_backlog
+        return self.total_enemies_to_spawn - self.enemies_spawned_count + len(self.enemy_units)
 
-            # 2) 이미지 크기 조절
-            victory_img = pygame.transform.scale(victory_img, (600, 350))
-            defeat_img = pygame.transform.scale(defeat_img, (600, 350))
+    def draw_hud(self, screen, font):
+        # HP 바
+        pygame.draw.rect(screen, config.RED, (20, 20, 200, 20)) 
+        hp_ratio = max(0, self.player_base_hp / self.max_base_hp)
+        pygame.draw.rect(screen, config.GREEN, (20, 20, 200 * hp_ratio, 20)) 
 
-            # 3) 출력할 이미지 선택
-            if "VICTORY" in self.result_message:
-                result_image = victory_img
-            else:
-                result_image = defeat_img
-
-            # 4) 중앙 정렬 후 그리기
-            screen.blit(
-                result_image,
-                (
-                    config.SCREEN_WIDTH // 2 - result_image.get_width() // 2,
-                    config.SCREEN_HEIGHT // 2 - result_image.get_height() // 2
-                )
-            )
\ No newline at end of file
+        # 텍스트 UI (값이 바뀔 때만 래스터화, 돈은 글리프 아틀라스로 조립)
+        hud = self._get_hud(font)
+        hud["hp"].draw(screen, f"{self.player_base_hp}")
+        hud["money"].draw(screen, f"{self.money} / {config.MAX_MONEY}")
+        if self.endless:
+            hud["wave"].draw(screen, f"{self.wave}  ({self.enemies_remaining()})")
+        else:
+            hud["wave"].draw(screen, f"{self.enemies_remaining()}")
+
+    def _get_hud(self, font):
+        if self._hud_font is not font:
+            self._hud_font = font
+            self._hud = {
+                "hp": HudText(font, config.BLACK, (230, 20), "Base HP: "),
+                "money": HudText(font, config.BLACK, (20, 50), "Money: ", use_atlas=True),
+                "wave": HudText(font, config.RED, (config.SCREEN_WIDTH - 250, 20),
+                                "Wave: " if self.endless else "Enemies Left: "),
+            }
+        return self._hud
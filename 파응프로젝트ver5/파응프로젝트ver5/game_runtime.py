@@ -0,0 +1,459 @@
+import pygame
+import sys
+import gc
+import os
+import time
+import config
+from game_manager import GameManager
+from entity import UNIT_STATS
+from assets import assets
+from renderer import create_renderer, ResultScreen
+from ui_text import text_cache
+from manifest import stage_manifest, stage_background, boss_background
+from replay import ReplayRecorder
+from profiler import FrameProfiler, ProfilerOverlay
+from telemetry import ThroughputLog
+from frame_pacer import FramePacer
+
+# pygame 쪽 실행 환경 (버튼 / 동영상 / 게임 루프)
+# 런처(main.py)는 이 모듈을 창을 띄운 뒤에 백그라운드로 불러온다 (pygame / numpy import 가 무겁기 때문).
+
+
+# ==========================================
+# 이미지 기반 유닛 소환 버튼
+# ==========================================
+class UI_Button:
+    def __init__(self, x, y, w, h, image_path, lock_image_path=None, cost=0, cooldown=0):
+        self.rect = pygame.Rect(x, y, w, h)
+        self.cost = cost
+        self.cost_text = f"${cost}"
+        self.cooldown_ms = cooldown * 1000  
+        self.cooling = False  # 쿨타임 중이면 True (해제는 GameManager 스케줄러가 예약 시각에)
+        self.image = None
+        self.lock_image = None
+
+        if image_path:
+            self.image = assets.image(image_path, (w, h))
+        if lock_image_path:
+            self.lock_image = assets.image(lock_image_path, (w, h))
+
+    def draw(self, screen, font, current_money):
+        on_cooldown = self.cooling
+        is_money_enough = current_money >= self.cost
+        
+        if not is_money_enough or on_cooldown:
+            if self.lock_image:
+                screen.blit(self.lock_image, (self.rect.x, self.rect.y))
+            else:
+                if self.image: screen.blit(self.image, (self.rect.x, self.rect.y))
+        else:
+            if self.image:
+                screen.blit(self.image, (self.rect.x, self.rect.y))
+
+        text_color = config.YELLOW if is_money_enough else config.RED
+        # 비용 글자는 바뀌지 않으므로 캐시된 Surface 재사용
+        shadow_surf = text_cache.render(font, self.cost_text, config.BLACK)
+        cost_surf = text_cache.render(font, self.cost_text, text_color)
+        cost_x = self.rect.x + (self.rect.width - cost_surf.get_width()) // 2
+        cost_y = self.rect.y + self.rect.height - 25
+        screen.blit(shadow_surf, (cost_x + 1, cost_y + 1))
+        screen.blit(cost_surf, (cost_x, cost_y))
+
+    def state_key(self, current_money):
+        """버튼 모양을 결정하는 값 (잠김 여부, 비용 색상) - 더티 렌더러가 변화 감지에 사용"""
+        is_money_enough = current_money >= self.cost
+        return (not is_money_enough or self.cooling, is_money_enough)
+
+    def is_clicked(self, pos):
+        return self.rect.collidepoint(pos)
+
+    def is_available(self, current_money):
+        return current_money >= self.cost and not self.cooling
+
+    def use(self, current_time, scheduler):
+        """클릭 성공: 쿨타임 시작, 해제 시각을 예약"""
+        self.cooling = True
+        scheduler.after(current_time, self.cooldown_ms, self._unlock)
+
+    def _unlock(self, now):
+        self.cooling = False
+
+    def reset(self):
+        self.cooling = False
+
+# ==========================================
+# 텍스트 기반 버튼
+# ==========================================
+class TextButton:
+    def __init__(self, x, y, w, h, text, color):
+        self.rect = pygame.Rect(x, y, w, h)
+        self.text = text
+        self.color = color
+
+    def draw(self, screen, font):
+        pygame.draw.rect(screen, self.color, self.rect)
+        pygame.draw.rect(screen, config.BLACK, self.rect, 2)
+        label = text_cache.render(font, self.text, config.BLACK)
+        label_x = self.rect.x + (self.rect.width - label.get_width()) // 2
+        label_y = self.rect.y + (self.rect.height - label.get_height()) // 2
+        screen.blit(label, (label_x, label_y))
+
+    def is_clicked(self, pos):
+        return self.rect.collidepoint(pos)
+
+# ==========================================
+# [함수 정의] 동영상 재생 (수정됨: 원본 속도 유지)
+# ==========================================
+def play_video(screen, video_path):
+    # OpenCV 는 import 가 무거우므로 실제로 영상을 틀 때(Stage 3 승리) 처음 불러온다
+    from video_player import VideoPlayer
+    # 디코드는 VideoPlayer 의 워커 스레드가, 여기서는 영상 타임스탬프에 맞춰 표시만 한다
+    player = VideoPlayer(video_path, (config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    if not player.open():
+        print(f"[오류] 비디오 파일을 열 수 없습니다: {video_path}")
+        return
+
+    def handle_events():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                player.close()
+                pygame.quit()
+                sys.exit()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE or event.key == pygame.K_q:
+                    return False
+        return True
+
+    finished = player.play(screen, handle_events)
+    player.close()
+    if player.dropped:
+        print(f"[동영상] {player.shown}프레임 표시, {player.dropped}프레임 건너뜀")
+    if not finished:
+        return
+
+    screen.fill(config.BLACK)
+    pygame.display.flip()
+
+# ==========================================
+# 게임 실행 환경 (스테이지 사이에 유지)
+# ==========================================
+class GameRuntime:
+    """pygame 초기화 / 화면 / 믹서 / 폰트 / 버튼 / 로드된 에셋을 한 번만 준비해 계속 쓰는 실행 환경
+
+    - 스테이지를 시작할 때마다 pygame.init / set_mode / SysFont / 이미지 로드를 반복하지 않는다.
+    - 같은 스테이지 RETRY 는 GameManager.reset() 으로 제자리 초기화만 한다.
+    - 메뉴로 돌아갈 때는 pygame 창을 숨기기만 하고, 완전히 끝낼 때 shutdown() 으로 정리한다.
+    """
+    def __init__(self):
+        self.started = False
+        self.gm = None
+        self.screen = None
+        # 미리 구운 아틀라스가 있으면 사용 (bake_assets.py, 색인만 읽고 시트는 처음 필요할 때 디코드)
+        assets.use_atlas(config.BAKED_ASSET_DIR, config.BASE_IMAGE_DIR)
+
+    def preload(self, stage_level):
+        """스테이지 이미지를 백그라운드 스레드에서 미리 디코드 (런처의 깜빡임 애니메이션 동안)"""
+        assets.preload(stage_manifest(stage_level)["images"])
+
+    def start(self):
+        if self.started: return
+        try:
+            pygame.mixer.pre_init(44100, -16, 2, 2048)
+            pygame.init()
+            pygame.mixer.init()
+        except Exception as e:
+            print(f"[오류] 사운드 시스템 초기화 실패: {e}")
+
+        self.screen_size = (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.screen = pygame.display.set_mode(self.screen_size)
+        # [프레임 페이싱] clock.tick 대신: 정확한 대기 + 과부하면 그리기만 줄인다
+        self.pacer = FramePacer(config.FPS)
+        self.font = pygame.font.SysFont("arial", 22, bold=True) 
+
+        # 버튼 설정
+        path_c1 = getattr(config, 'IMG_BTN_C1', None) 
+        path_c2 = getattr(config, 'IMG_BTN_C2', None)
+        path_c3 = getattr(config, 'IMG_BTN_C3', None)
+        path_c1_lock = getattr(config, 'IMG_BTN_C1_LOCK', None)
+        path_c2_lock = getattr(config, 'IMG_BTN_C2_LOCK', None)
+        path_c3_lock = getattr(config, 'IMG_BTN_C3_LOCK', None)
+
+        btn_w, btn_h = config.BUTTON_SIZE
+        btn_y = config.SCREEN_HEIGHT - 130 
+        
+        self.btn_c1 = UI_Button(30,            btn_y, btn_w, btn_h, path_c1, lock_image_path=path_c1_lock, cost=UNIT_STATS["C1"]["cost"], cooldown=config.COOLTIME_C1)
+        self.btn_c2 = UI_Button(30 + 120 + 20, btn_y, btn_w, btn_h, path_c2, lock_image_path=path_c2_lock, cost=UNIT_STATS["C2"]["cost"], cooldown=config.COOLTIME_C2)
+        self.btn_c3 = UI_Button(30 + 240 + 40, btn_y, btn_w, btn_h, path_c3, lock_image_path=path_c3_lock, cost=UNIT_STATS["C3"]["cost"], cooldown=config.COOLTIME_C3)
+
+        # HUD(기지 HP / 돈 / 남은 적) 가 그려지는 상단 영역
+        self.hud_rect = pygame.Rect(0, 0, config.SCREEN_WIDTH, 80)
+        # 그리기를 줄이고 있을 때 표시 ("render 1/2  fx 1/2", 남은 적 표시 아래)
+        self.pacing_rect = pygame.Rect(config.SCREEN_WIDTH - 250, 50, 240, 26)
+
+        self.btn_retry = TextButton(config.SCREEN_WIDTH//2 - 110, config.SCREEN_HEIGHT//2 + 150, 100, 50, "RETRY", config.WHITE)
+        self.btn_menu = TextButton(config.SCREEN_WIDTH//2 + 10, config.SCREEN_HEIGHT//2 + 150, 100, 50, "MENU", config.WHITE)
+
+        # [결과 화면] 오버레이/이미지는 여기서 한 번만 준비
+        self.result_screen = ResultScreen(buttons=(self.btn_retry, self.btn_menu))
+
+        # [프로파일러] 프레임 구간별 시간 (F3: 화면 표시, F4: 트레이스 저장)
+        self.profiler = FrameProfiler(config.PROFILER_HISTORY)
+        self.profiler_overlay = ProfilerOverlay(self.profiler, pygame.font.SysFont("arial", 13),
+                                                (config.SCREEN_WIDTH - 270, 90))
+        self.show_profiler = config.SHOW_PROFILER
+        self.started = True
+
+    def show(self, visible=True):
+        """pygame 창 보이기/숨기기 (창과 로드된 Surface 는 그대로 유지)"""
+        flags = pygame.SHOWN if visible else pygame.HIDDEN
+        self.screen = pygame.display.set_mode(self.screen_size, flags)
+
+    def shutdown(self):
+        if not self.started: return
+        print(assets.report())
+        # pygame.quit() 후에는 변환된 Surface를 재사용할 수 없으므로 캐시를 비운다
+        assets.clear()
+        pygame.quit()
+        self.started = False
+        self.gm = None
+
+    def prepare_stage(self, stage_level):
+        """스테이지 시작 준비: 같은 스테이지면 GameManager 를 제자리 초기화, 아니면 새로 생성"""
+        if self.gm and self.gm.stage_level == stage_level:
+            self.gm.reset()
+        else:
+            # 엔드리스는 유닛이 수백 마리까지 늘어나므로 배열 엔진 (config.ENDLESS_ENGINE)
+            engine = config.ENDLESS_ENGINE if stage_level == config.ENDLESS_STAGE else "object"
+            self.gm = GameManager(stage_level, engine=engine)
+        self.gm.profiler = self.profiler
+        for btn in (self.btn_c1, self.btn_c2, self.btn_c3):
+            btn.reset()
+        self.result_screen.reset()
+
+        # [워밍업] 스테이지 manifest 의 이미지/사운드를 전부 캐시에 올린다
+        # (런처에서 미리 디코드해 둔 것은 화면 포맷 변환만 하므로, 첫 프레임/첫 소환에 디스크 I/O 가 없다)
+        assets.warm_up(stage_manifest(stage_level))
+
+        self.stage_bg_image = assets.image(stage_background(stage_level), self.screen_size, alpha=False)
+        self.boss_bg_image = None
+
+        boss_path = boss_background(stage_level)
+        if boss_path:
+            self.boss_bg_image = assets.image(boss_path, self.screen_size, alpha=False)
+
+        # 지금까지 만든 오래 사는 객체(에셋, 폰트, 모듈 등)는 GC 검사 대상에서 빼서 전투 중 GC 정지를 줄인다
+        # 먼저 지난 판에 얼려 둔 것을 풀어야 다른 스테이지로 바꿀 때 이전 GameManager(순환 참조)가 회수된다
+        gc.unfreeze()
+        gc.collect()
+        gc.freeze()
+
+    # ==========================================
+    # 게임 실행 루프
+    # ==========================================
+    def play(self, stage_level):
+        """스테이지 한 판 실행. "RETRY" / "MENU" / "QUIT" 중 하나를 반환"""
+        self.start()
+        self.show(True)
+        if stage_level == config.ENDLESS_STAGE:
+            pygame.display.set_caption("Defense Game - Endless")
+        else:
+            pygame.display.set_caption(f"Defense Game - Stage {stage_level}")
+        self.prepare_stage(stage_level)
+
+        screen = self.screen
+        pacer = self.pacer
+        font = self.font
+        gm = self.gm
+        btn_c1, btn_c2, btn_c3 = self.btn_c1, self.btn_c2, self.btn_c3
+        btn_retry, btn_menu = self.btn_retry, self.btn_menu
+        result_screen = self.result_screen
+        boss_bg_image = self.boss_bg_image
+        current_bg_image = self.stage_bg_image
+        profiler = self.profiler
+        profiler_overlay = self.profiler_overlay
+        profiler.clear()
+
+        # [렌더러] config.RENDER_MODE 에 따라 더티 렉트 / 전체 갱신
+        renderer = create_renderer(screen, current_bg_image)
+
+        # [리플레이] 시드 + (틱, 버튼) 입력만 기록해 두면 같은 판을 헤드리스로 재현할 수 있다
+        recorder = ReplayRecorder(gm)
+
+        # [처리량 기록] 엔드리스 모드: 1초마다 유닛 수 / update ms / draw ms 를 CSV 로
+        telemetry = self.open_telemetry(stage_level) if gm.endless and config.ENDLESS_TELEMETRY else None
+
+        # [체크포인트] F5 로 전투 상태 저장, F9 로 즉시 되돌리기 (결과 화면에서도 가능)
+        checkpoint = None
+
+        running = True
+        next_action = "QUIT"
+        video_played = False # 비디오 재생 여부 체크
+
+        # 메뉴에 머물던 시간이 첫 프레임 dt 로 들어가지 않도록 시계를 맞춘다
+        pacer.reset()
+        fx_blits = []
+        hud_key = None
+
+        # ==============================
+        # [1] 게임 플레이 루프
+        # ==============================
+        while running:
+            # [프로파일] 대기 -> 이벤트 -> 시뮬레이션(세부 구간은 GameManager.update) -> UI -> 그리기 -> 화면 반영
+            t = profiler.begin_frame()
+            dt = pacer.wait()
+            t = profiler.record("wait", t)
+            dt_sec = dt / 1000.0
+            # 입력/버튼 쿨타임도 시뮬레이션 시계 기준 (렌더 FPS 가 바뀌어도 같은 결과)
+            current_time = gm.sim_time
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                    next_action = "QUIT"
+
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    pos = pygame.mouse.get_pos()
+                    
+                    if not gm.game_over:
+                        for unit_type, btn in ((1, btn_c1), (2, btn_c2), (3, btn_c3)):
+                            if btn.is_clicked(pos) and btn.is_available(gm.money):
+                                recorder.record(gm.tick, unit_type)
+                                if gm.spawn_player_unit(unit_type): btn.use(current_time, gm.scheduler)
+                                break
+                    else:
+                        if btn_retry.is_clicked(pos):
+                            running = False
+                            next_action = "RETRY"
+                        elif btn_menu.is_clicked(pos):
+                            running = False
+                            next_action = "MENU"
+
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_F5 and not gm.game_over:
+                        checkpoint = gm.snapshot()
+                    elif event.key == pygame.K_F9 and checkpoint is not None:
+                        gm.restore(checkpoint)
+                        # 버튼 쿨타임은 스냅샷에 들어가지 않으므로 모두 풀어 준다
+                        for btn in (btn_c1, btn_c2, btn_c3):
+                            btn.reset()
+                        result_screen.reset()
+                        current_bg_image = boss_bg_image if (gm.boss_spawned and boss_bg_image) else self.stage_bg_image
+                        renderer.set_background(current_bg_image)
+                        renderer.invalidate()
+                        # 되감은 판은 시드 + 입력만으로 재현되지 않으므로 이번 판 리플레이는 저장하지 않는다
+                        recorder.discard()
+                    elif event.key == pygame.K_F3:
+                        self.show_profiler = not self.show_profiler
+                        renderer.invalidate()  # 패널을 끈 자리를 배경으로 다시 채운다
+                    elif event.key == pygame.K_F4:
+                        self.save_trace(stage_level)
+            t = profiler.record("events", t)
+
+            # [고정 스텝] 누적된 시간만큼 시뮬레이션 진행, 남은 비율은 그리기 보간에 사용
+            alpha = gm.advance(dt_sec)
+            t = profiler.record("sim", t)
+
+            if stage_level == 3 and gm.boss_spawned and boss_bg_image:
+                if current_bg_image != boss_bg_image:
+                    current_bg_image = boss_bg_image
+                    renderer.set_background(current_bg_image)
+
+            # ==============================
+            # [2] 게임 종료(클리어) 체크
+            # ==============================
+            if gm.game_over:
+                # (1) 만약 3스테이지고 + 승리했다면 + 아직 비디오를 안 봤다면?
+                if stage_level == 3 and "VICTORY" in gm.result_message:
+                    if not video_played:
+                        # ---> 여기서 비디오가 재생됩니다! <---
+                        play_video(screen, config.VID_ENDING)
+                        video_played = True 
+                        
+                        # 비디오 끝나고 화면 전체 복구 (재생 시간은 프레임 비용 / 간격에 넣지 않는다)
+                        renderer.invalidate()
+                        pacer.reset()
+
+            # ==============================
+            # [3] 그리기 (유닛/이펙트 -> 버튼 -> HUD -> 결과 화면)
+            # ==============================
+            # 과부하 단계에서는 N 프레임에 한 번만 그린다 (시뮬레이션 스텝은 건너뛰지 않는다)
+            rendered = pacer.should_render()
+            if rendered:
+                # 반속도 단계: 이펙트 위치 / HUD 값은 두 번 그릴 때 한 번만 새로 계산
+                if pacer.fresh_fx():
+                    fx_blits = gm.effects.blit_list(alpha)
+                    hud_key = gm.hud_key()
+                money = gm.money
+                widgets = [
+                    (btn.state_key(money), btn.rect,
+                     lambda surface, btn=btn: btn.draw(surface, font, money))
+                    for btn in (btn_c1, btn_c2, btn_c3)
+                ]
+                widgets.append((hud_key, self.hud_rect, lambda surface: gm.draw_hud(surface, font)))
+                pacing = pacer.status()
+                widgets.append((pacing, self.pacing_rect, lambda surface: self.draw_pacing(surface, pacing)))
+                if gm.game_over:
+                    widgets.append((gm.result_message, screen.get_rect(),
+                                    lambda surface: result_screen.draw(surface, gm.result_message, font)))
+                if self.show_profiler:
+                    profiler_overlay.update()
+                    widgets.append((profiler_overlay.key(), profiler_overlay.rect, profiler_overlay.draw))
+                blit_list = gm.unit_blit_list(alpha, effects=False) + fx_blits
+                t = profiler.record("ui", t)
+
+                renderer.draw(blit_list, widgets)
+                t = profiler.record("draw", t)
+                renderer.present()
+                profiler.record("present", t)
+            profiler.end_frame(players=len(gm.player_units), enemies=len(gm.enemy_units),
+                               effects=len(gm.effects), pacing=pacer.level)
+            update_ms = profiler.last("events") + profiler.last("sim")
+            draw_ms = profiler.last("ui") + profiler.last("draw") + profiler.last("present") if rendered else None
+            pacer.end_frame(update_ms, draw_ms)
+            if telemetry and not gm.game_over:  # 결과 화면 프레임은 기록하지 않는다
+                telemetry.frame(time.perf_counter(), gm, profiler.last("sim"),
+                                profiler.last("draw") + profiler.last("present") if rendered else None)
+
+        if telemetry:
+            telemetry.close(time.perf_counter(), gm)
+            print(telemetry.summary())
+        self.save_replay(recorder.finish(gm))
+        return next_action
+
+    def draw_pacing(self, surface, text):
+        """그리기를 줄이고 있으면 그 단계를 HUD 에 표시 (정상이면 아무것도 그리지 않는다)"""
+        if text:
+            surface.blit(text_cache.render(self.font, text, config.RED), self.pacing_rect)
+
+    def save_replay(self, replay):
+        """방금 끝난 판의 리플레이를 REPLAY_DIR 에 저장 (실패해도 게임은 계속)"""
+        if replay is None or not config.RECORD_REPLAYS:
+            return
+        name = f"stage{replay.stage_level}_{time.strftime('%Y%m%d_%H%M%S')}.rpl"
+        try:
+            os.makedirs(config.REPLAY_DIR, exist_ok=True)
+            replay.save(os.path.join(config.REPLAY_DIR, name))
+        except OSError as e:
+            print(f"[경고] 리플레이 저장 실패: {e}")
+
+    def open_telemetry(self, stage_level):
+        """TELEMETRY_DIR 에 이번 판의 처리량 CSV 를 연다 (폴더를 못 만들면 메모리에만 기록)"""
+        path = os.path.join(config.TELEMETRY_DIR, f"stage{stage_level}_{time.strftime('%Y%m%d_%H%M%S')}.csv")
+        try:
+            os.makedirs(config.TELEMETRY_DIR, exist_ok=True)
+        except OSError as e:
+            print(f"[경고] 처리량 기록 폴더를 만들 수 없음: {e}")
+            path = None
+        return ThroughputLog(path)
+
+    def save_trace(self, stage_level):
+        """최근 프레임들의 구간 기록을 TRACE_DIR 에 Chrome 트레이스 JSON 으로 저장 (F4)"""
+        path = os.path.join(config.TRACE_DIR, f"trace_stage{stage_level}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            os.makedirs(config.TRACE_DIR, exist_ok=True)
+            count = self.profiler.dump_trace(path)
+        except OSError as e:
+            print(f"[경고] 트레이스 저장 실패: {e}")
+            return
+        print(f"[프로파일] 트레이스 {count}개 이벤트 -> {path}")
+        print(self.profiler.report())
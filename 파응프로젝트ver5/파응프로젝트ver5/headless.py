@@ -0,0 +1,193 @@
+import argparse
+import time
+import config
+from assets import assets
+from game_manager import GameManager
+from telemetry import ThroughputLog
+
+# ==========================================
+# 헤드리스 시뮬레이션 (화면 / 믹서 / Tk 없음)
+# ==========================================
+# pygame.init() / display.set_mode() 를 호출하지 않고, GameManager.step() (고정 스텝)만 연속으로 돌린다.
+# 실제 시간으로 몇 분 걸리는 스테이지를 수 밀리초~수백 밀리초 안에 끝낼 수 있어
+# 디스플레이가 없는 CI 머신에서 스테이지/밸런스를 대량으로 평가할 때 쓴다.
+
+def spawn_cooldown_ms(unit_type):
+    """유닛 번호별 버튼 쿨타임 (game_runtime.py 의 UI_Button 과 같은 config 값, 실행 중 변경도 반영)"""
+    return getattr(config, f"COOLTIME_C{unit_type}") * 1000
+
+
+class SpawnPolicy:
+    """소환 정책 기본 클래스 - 버튼 쿨타임 관리는 여기서, 무엇을 누를지는 자식 클래스가 결정"""
+    def __init__(self):
+        self.cooling = set()  # 쿨타임 중인 유닛 번호 (해제는 GameManager 스케줄러가 예약 시각에)
+        self.spawn_count = 0
+
+    def is_ready(self, unit_type):
+        return unit_type not in self.cooling
+
+    def try_spawn(self, gm, unit_type, current_time):
+        """버튼 클릭과 동일: 쿨타임 확인 -> 소환 시도 -> 성공 시 쿨타임 시작"""
+        if self.is_ready(unit_type) and gm.spawn_player_unit(unit_type):
+            self.cooling.add(unit_type)
+            gm.scheduler.after(current_time, spawn_cooldown_ms(unit_type), self._unlock, unit_type)
+            self.spawn_count += 1
+            return True
+        return False
+
+    def _unlock(self, now, unit_type):
+        self.cooling.discard(unit_type)
+
+    def act(self, gm, current_time):
+        pass
+
+
+class GreedySpawnPolicy(SpawnPolicy):
+    """살 수 있는 유닛 중 우선순위가 가장 높은 것을 한 틱에 하나씩 소환"""
+    def __init__(self, priority=(3, 2, 1)):
+        super().__init__()
+        self.priority = priority
+
+    def act(self, gm, current_time):
+        for unit_type in self.priority:
+            if self.try_spawn(gm, unit_type, current_time):
+                return
+
+
+class ScriptedSpawnPolicy(SpawnPolicy):
+    """(시간ms, 유닛번호) 목록대로 소환. 시간이 되었는데 못 사면 살 수 있을 때까지 계속 시도"""
+    def __init__(self, schedule):
+        super().__init__()
+        self.schedule = sorted(schedule)
+        self.next_index = 0
+
+    def act(self, gm, current_time):
+        if self.next_index >= len(self.schedule):
+            return
+        due_time, unit_type = self.schedule[self.next_index]
+        if current_time >= due_time and self.try_spawn(gm, unit_type, current_time):
+            self.next_index += 1
+
+
+class StressSpawnPolicy(SpawnPolicy):
+    """부하 테스트용: 돈 / 버튼 쿨타임과 상관없이 every_ticks 마다 아군을 C1 -> C2 -> C3 순서로 소환"""
+    def __init__(self, every_ticks=20):
+        super().__init__()
+        self.every_ticks = every_ticks
+
+    def act(self, gm, current_time):
+        if gm.tick % self.every_ticks:
+            return
+        gm.money = config.MAX_MONEY
+        if gm.spawn_player_unit(self.spawn_count % 3 + 1):
+            self.spawn_count += 1
+
+
+def run_headless(stage_level, policy=None, seed=None, engine="object", max_time_sec=600, telemetry=None,
+                 base_hp=None):
+    """스테이지 하나를 끝까지(또는 max_time_sec 까지) 시뮬레이션하고 결과 딕셔너리 반환
+
+    telemetry: ThroughputLog 를 주면 시뮬레이션 1초마다 유닛 수 / 스텝 ms 를 기록한다
+    base_hp: 시작 기지 HP 덮어쓰기 (부하 테스트에서 끝나지 않게 할 때)
+    """
+    if policy is None:
+        policy = GreedySpawnPolicy()
+
+    with assets.headless_mode():
+        gm = GameManager(stage_level, engine=engine, seed=seed)
+        if gm.engine:
+            gm.engine.sync_views = False
+        if base_hp is not None:
+            gm.player_base_hp = base_hp
+
+        wall_ms = simulate(gm, policy, int(max_time_sec * 1000 / config.SIM_STEP_MS), telemetry)
+    if telemetry:
+        telemetry.close(gm.sim_time / 1000, gm)
+    return summarize(gm, policy, seed, wall_ms)
+
+
+def run_branches(stage_level, branch_tick, policies, prefix_policy=None, seed=None, engine="object",
+                 max_time_sec=600):
+    """branch_tick 까지 prefix_policy 로 진행한 뒤, 그 시점 스냅샷에서 정책마다 갈라져 끝까지 시뮬레이션
+
+    앞부분을 정책 수만큼 다시 돌리지 않으므로 중반 이후 전략 비교(분기 탐색)가 빠르다.
+    버튼 쿨타임은 스냅샷에 들어가지 않으므로 각 분기는 모든 버튼이 사용 가능한 상태에서 시작한다.
+    """
+    with assets.headless_mode():
+        gm = GameManager(stage_level, engine=engine, seed=seed)
+        if gm.engine:
+            gm.engine.sync_views = False
+
+        simulate(gm, prefix_policy or GreedySpawnPolicy(), branch_tick)
+        branch_point = gm.snapshot()
+        max_ticks = int(max_time_sec * 1000 / config.SIM_STEP_MS)
+
+        results = []
+        for policy in policies:
+            gm.restore(branch_point)
+            wall_ms = simulate(gm, policy, max_ticks)
+            results.append(summarize(gm, policy, seed, wall_ms))
+    return results
+
+
+def simulate(gm, policy, max_ticks, telemetry=None):
+    """게임이 끝나거나 max_ticks 가 될 때까지 진행. 걸린 실제 시간(ms) 반환"""
+    # 실제 시간을 기다리지 않고 고정 스텝을 연속 실행 (입력은 run_game 과 같이 스텝 사이에 처리)
+    wall_start = time.perf_counter()
+    while not gm.game_over and gm.tick < max_ticks:
+        policy.act(gm, gm.sim_time)
+        if telemetry:
+            start = time.perf_counter()
+            gm.step()
+            telemetry.frame(gm.sim_time / 1000, gm, (time.perf_counter() - start) * 1000)
+        else:
+            gm.step()
+    return (time.perf_counter() - wall_start) * 1000
+
+
+def summarize(gm, policy, seed, wall_ms):
+    if not gm.game_over:
+        result = "TIMEOUT"
+    elif "VICTORY" in gm.result_message:
+        result = "VICTORY"
+    else:
+        result = "DEFEAT"
+
+    return {
+        "stage": gm.stage_level,
+        "seed": seed,
+        "engine": gm.engine_mode,
+        "result": result,
+        "ticks": gm.tick,
+        "sim_time_sec": round(gm.sim_time / 1000, 3),
+        "base_hp": gm.player_base_hp,
+        "money": gm.money,
+        "units_spawned": policy.spawn_count,
+        "wall_ms": round(wall_ms, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="헤드리스 스테이지 시뮬레이션")
+    parser.add_argument("--stage", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--engine", choices=["object", "array"], default="object")
+    parser.add_argument("--max-time", type=float, default=600, help="시뮬레이션 최대 시간(초)")
+    parser.add_argument("--telemetry", default=None, help="처리량 CSV 저장 경로")
+    parser.add_argument("--stress", action="store_true",
+                        help="기지 HP 무한 + 돈/쿨타임 없이 아군 소환 (부하 테스트, 보통 --stage %d 와 함께)"
+                             % config.ENDLESS_STAGE)
+    args = parser.parse_args()
+
+    for i in range(args.runs):
+        telemetry = None
+        if args.telemetry:
+            path = args.telemetry if args.runs == 1 else args.telemetry.replace(".csv", f"_{i}.csv")
+            telemetry = ThroughputLog(path)
+        policy = StressSpawnPolicy() if args.stress else None
+        print(run_headless(args.stage, policy=policy, seed=args.seed + i, engine=args.engine,
+                           max_time_sec=args.max_time, telemetry=telemetry,
+                           base_hp=10 ** 9 if args.stress else None))
+        if telemetry:
+            print(telemetry.summary())
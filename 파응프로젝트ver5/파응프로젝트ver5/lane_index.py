@@ -0,0 +1,106 @@
+import pygame
+from bisect import bisect_left, bisect_right
+
+# ==========================================
+# 1차원 레인 인덱스 (x좌표 정렬 스프라이트 그룹)
+# ==========================================
+class LaneGroup(pygame.sprite.Group):
+    """유닛을 rect.centerx 순서로 정렬해 두는 스프라이트 그룹
+
+    모든 유닛이 한 줄(레인) 위에서만 움직이므로, x좌표로 정렬해 두면
+    가장 가까운 상대 / 사거리 안의 상대를 이분 탐색(O(log n))으로 찾을 수 있다.
+    정렬 키는 (centerx, 추가 순번)이다. 거리가 같은 후보가 여럿이면 먼저 추가된 유닛을
+    고르는데, 이는 기존 그룹 전체 순회(find_nearest_target)와 같은 결과를 내기 위함이다.
+
+    유닛이 움직이면 GameEntity.move 에서 reposition()을 호출해 위치만 갱신한다.
+    """
+    def __init__(self, *sprites):
+        self._keys = []   # 정렬된 (centerx, seq) 목록
+        self._units = []  # _keys 와 같은 순서의 유닛 목록
+        self._seq = 0
+        super().__init__(*sprites)
+
+    # ------------------------------
+    # 그룹 내부 훅 (add / kill 시 자동 호출)
+    # ------------------------------
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._seq += 1
+        key = (sprite.rect.centerx, self._seq)
+        i = bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._units.insert(i, sprite)
+        sprite.lane = self
+        sprite.lane_key = key
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        i = bisect_left(self._keys, sprite.lane_key)
+        del self._keys[i]
+        del self._units[i]
+        sprite.lane = None
+
+    def reposition(self, sprite):
+        """유닛이 이동한 뒤 정렬 위치를 갱신"""
+        old_key = sprite.lane_key
+        new_x = sprite.rect.centerx
+        if new_x == old_key[0]:
+            return
+        new_key = (new_x, old_key[1])
+        keys = self._keys
+        i = bisect_left(keys, old_key)
+
+        # 이웃과의 순서가 그대로면 제자리에서 키만 교체 (대부분의 프레임)
+        if (i == 0 or keys[i - 1] < new_key) and (i == len(keys) - 1 or new_key < keys[i + 1]):
+            keys[i] = new_key
+        else:
+            del keys[i]
+            del self._units[i]
+            j = bisect_left(keys, new_key)
+            keys.insert(j, new_key)
+            self._units.insert(j, sprite)
+        sprite.lane_key = new_key
+
+    # ------------------------------
+    # 질의
+    # ------------------------------
+    def nearest(self, x):
+        """x에서 가장 가까운 유닛 (없으면 None)"""
+        keys = self._keys
+        if not keys:
+            return None
+
+        # i: centerx >= x 인 첫 유닛 (같은 x 중에서는 가장 먼저 추가된 유닛)
+        i = bisect_left(keys, (x,))
+        right = i if i < len(keys) else None
+
+        left = None
+        if i > 0:
+            # 왼쪽에서 가장 가까운 x 값을 가진 유닛들 중 가장 먼저 추가된 유닛
+            left = bisect_left(keys, (keys[i - 1][0],))
+
+        if left is None:
+            return self._units[right]
+        if right is None:
+            return self._units[left]
+
+        dist_left = x - keys[left][0]
+        dist_right = keys[right][0] - x
+        if dist_left < dist_right:
+            return self._units[left]
+        if dist_right < dist_left:
+            return self._units[right]
+        # 거리가 같으면 먼저 추가된 유닛 (기존 순회 방식과 동일)
+        return self._units[left] if keys[left][1] < keys[right][1] else self._units[right]
+
+    def in_range(self, x, attack_range):
+        """|centerx - x| <= attack_range 인 유닛 목록 (x좌표 오름차순)"""
+        lo = bisect_left(self._keys, (x - attack_range,))
+        hi = bisect_right(self._keys, (x + attack_range, float('inf')))
+        return self._units[lo:hi]
+
+    def leftmost(self):
+        return self._units[0] if self._units else None
+
+    def rightmost(self):
+        return self._units[-1] if self._units else None
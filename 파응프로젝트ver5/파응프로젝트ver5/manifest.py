@@ -0,0 +1,60 @@
+import config
+from entity import UNIT_IMAGES
+from game_manager import stage_unit_types
+
+# ==========================================
+# 스테이지 에셋 목록 (manifest)
+# ==========================================
+# 한 스테이지에 필요한 이미지 / 사운드를 config 값으로부터 모아 둔다.
+# 런처의 스테이지 선택 깜빡임 동안 assets.preload() 로 미리 디코드하고,
+# 화면이 만들어진 뒤 assets.warm_up() 으로 변환까지 끝내서
+# 첫 프레임과 유닛 첫 소환에서 디스크 I/O 가 없도록 한다.
+#
+# 이미지 항목은 assets.image() 인자와 같은 (경로, 크기, 알파) 튜플이다.
+
+def stage_background(stage_level):
+    """스테이지 배경 이미지 경로 (없으면 기본 배경)"""
+    return getattr(config, f"IMG_BG_STAGE{stage_level}", config.IMG_BACKGROUND)
+
+
+def boss_background(stage_level):
+    """보스 등장 후 배경 이미지 경로 (Stage 3 만)"""
+    if stage_level == 3:
+        return getattr(config, 'IMG_BG_STAGE3_B', None)
+    return None
+
+
+def unit_image_specs(name):
+    image_attr, attack_attr, size_attr = UNIT_IMAGES[name]
+    size = getattr(config, size_attr)
+    return [(getattr(config, image_attr), size, True), (getattr(config, attack_attr), size, True)]
+
+
+def common_image_specs():
+    """모든 스테이지가 쓰는 UI 이미지 (소환 버튼, 결과 화면, 사망 이펙트)"""
+    specs = []
+    for n in (1, 2, 3):
+        specs.append((getattr(config, f"IMG_BTN_C{n}", None), config.BUTTON_SIZE, True))
+        specs.append((getattr(config, f"IMG_BTN_C{n}_LOCK", None), config.BUTTON_SIZE, True))
+    specs.append((config.IMG_RESULT_VIC, config.RESULT_IMAGE_SIZE, True))
+    specs.append((config.IMG_RESULT_DEF, config.RESULT_IMAGE_SIZE, True))
+    specs.append((config.IMG_C_DIE, config.DEATH_EFFECT_SIZE, True))
+    return specs
+
+
+def stage_manifest(stage_level):
+    """스테이지 하나에 필요한 에셋 목록 {"images": [...], "sounds": [(경로, 볼륨)]}"""
+    screen_size = (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+    images = [(stage_background(stage_level), screen_size, False)]
+    boss_bg = boss_background(stage_level)
+    if boss_bg:
+        images.append((boss_bg, screen_size, False))
+    images += common_image_specs()
+
+    for unit_type in stage_unit_types(stage_level):
+        images += unit_image_specs(unit_type.name)
+
+    # 중복 제거 (순서 유지, 경로가 없는 항목 제외)
+    images = [spec for spec in dict.fromkeys(images) if spec[0]]
+    sounds = [(config.SND_SWING, 0.4)]
+    return {"images": images, "sounds": sounds}
@@ -0,0 +1,187 @@
+import argparse
+import hashlib
+import os
+import time
+import tkinter as tk
+import config
+
+# ==========================================
+# 런처 메뉴 이미지 캐시 (디스크)
+# ==========================================
+# 메뉴 PNG 를 PIL 로 열어 LANCZOS 로 줄이는 일을 실행할 때마다 하지 않도록,
+# 표시 크기로 만든 결과를 Tk 가 직접 읽는 형식으로 MENU_CACHE_DIR 에 저장해 둔다.
+#   - 불투명 이미지 : PPM (P6, 무압축 RGB)
+#   - 투명도가 있는 이미지 : PNG (압축 레벨 1, Tk 8.6 내장 디코더)
+# 캐시 파일 이름은 (원본 경로, 원본 수정 시각, 원본 크기, 표시 크기) 의 해시라서
+# 원본을 고치면 자동으로 새로 만들어진다. 캐시가 있으면 PIL 은 import 조차 하지 않는다.
+#
+# 사용 예)
+#   python menu_cache.py            # 모든 메뉴 이미지 캐시 생성 (오래된 캐시 파일은 삭제)
+
+# 런처 메뉴 이미지: 이름 -> (config 속성, 표시 크기). None 이면 원본 크기 그대로
+MENU_IMAGES = {
+    "bg": ("IMG_MENU_BG", (1024, 572)),
+    "enter": ("IMG_TXT_ENTER", None),
+    "stage1": ("IMG_BTN_STAGE1", (300, 80)),
+    "stage2": ("IMG_BTN_STAGE2", (300, 80)),
+    "stage3": ("IMG_BTN_STAGE3", (300, 80)),
+}
+
+# 스테이지 선택 화면의 반투명 검은 막 (크기, RGBA)
+OVERLAY = ((1024, 572), (0, 0, 0, 150))
+
+
+class MenuImageCache:
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._write_failed = False
+
+    def cache_path(self, path, size=None):
+        """원본이 없으면 None. 확장자 없는 캐시 경로 (저장할 때 .ppm / .png 가 붙는다)"""
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        size_text = f"{size[0]}x{size[1]}" if size else "orig"
+        key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{size_text}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, f"{stem}_{size_text}_{digest}")
+
+    @staticmethod
+    def _existing(base):
+        for ext in (".ppm", ".png"):
+            if os.path.exists(base + ext):
+                return base + ext
+        return None
+
+    def photo(self, path, size=None):
+        """표시 크기의 tk.PhotoImage (Tk 루트가 있어야 한다). 원본을 못 읽으면 None"""
+        base = self.cache_path(path, size)
+        if base is None:
+            return None
+        cached = self._existing(base)
+        if cached:
+            try:
+                image = tk.PhotoImage(file=cached)
+                self.hits += 1
+                return image
+            except tk.TclError:
+                pass  # 깨진 캐시 파일: 원본에서 다시 만든다
+
+        self.misses += 1
+        image = self._render(path, size)
+        if image is None:
+            return None
+        cached = self._store(image, base)
+        if cached:
+            return tk.PhotoImage(file=cached)
+        from PIL import ImageTk
+        return ImageTk.PhotoImage(image)
+
+    def overlay(self, size, rgba):
+        """단색 반투명 이미지 (원본 파일 없음, 크기와 색으로 캐시)"""
+        base = os.path.join(self.cache_dir, "overlay_{}x{}_{}_{}_{}_{}".format(*size, *rgba))
+        cached = self._existing(base)
+        if cached:
+            try:
+                image = tk.PhotoImage(file=cached)
+                self.hits += 1
+                return image
+            except tk.TclError:
+                pass
+
+        self.misses += 1
+        from PIL import Image, ImageTk
+        image = Image.new("RGBA", size, rgba)
+        cached = self._store(image, base)
+        return tk.PhotoImage(file=cached) if cached else ImageTk.PhotoImage(image)
+
+    @staticmethod
+    def _render(path, size):
+        """PIL 로 열어서 표시 크기로 (이미 그 크기면 다시 샘플링하지 않는다)"""
+        try:
+            from PIL import Image
+            image = Image.open(path)
+            if size and image.size != tuple(size):
+                image = image.resize(size, Image.Resampling.LANCZOS)
+            image.load()
+            return image
+        except Exception:
+            return None
+
+    def _store(self, image, base):
+        """투명도가 있으면 PNG, 없으면 PPM 으로 저장. 저장한 경로 (실패하면 None)"""
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        if has_alpha:
+            image = image.convert("RGBA")
+            has_alpha = image.getextrema()[3][0] < 255
+        path = base + (".png" if has_alpha else ".ppm")
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if has_alpha:
+                image.save(tmp_path, "PNG", compress_level=1)
+            else:
+                image.convert("RGB").save(tmp_path, "PPM")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            if not self._write_failed:
+                print(f"[경고] 메뉴 이미지 캐시 저장 실패: {e}")
+                self._write_failed = True
+            return None
+        return path
+
+    def prewarm(self):
+        """모든 메뉴 이미지 + 반투명 막의 캐시를 만든다 (Tk 창 없이). [(이름, 캐시 경로 또는 None, ms)]"""
+        results = []
+        for name, (attr, size) in MENU_IMAGES.items():
+            start = time.perf_counter()
+            path = getattr(config, attr, None)
+            base = self.cache_path(path, size)
+            cached = self._existing(base) if base else None
+            if base and not cached:
+                image = self._render(path, size)
+                cached = self._store(image, base) if image is not None else None
+            results.append((name, cached, (time.perf_counter() - start) * 1000))
+
+        start = time.perf_counter()
+        size, rgba = OVERLAY
+        base = os.path.join(self.cache_dir, "overlay_{}x{}_{}_{}_{}_{}".format(*size, *rgba))
+        cached = self._existing(base)
+        if not cached:
+            from PIL import Image
+            cached = self._store(Image.new("RGBA", size, rgba), base)
+        results.append(("overlay", cached, (time.perf_counter() - start) * 1000))
+        return results
+
+    def prune(self, keep):
+        """keep 에 없는 캐시 파일 삭제 (원본이 바뀌어 쓰이지 않게 된 것들). 삭제한 개수"""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        keep = {os.path.abspath(path) for path in keep if path}
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            path = os.path.abspath(os.path.join(self.cache_dir, name))
+            if name.endswith((".ppm", ".png")) and path not in keep:
+                os.remove(path)
+                removed += 1
+        return removed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="런처 메뉴 이미지 캐시 미리 만들기")
+    parser.add_argument("--cache-dir", default=config.MENU_CACHE_DIR)
+    parser.add_argument("--keep-stale", action="store_true", help="쓰이지 않는 옛 캐시 파일을 지우지 않는다")
+    args = parser.parse_args()
+
+    cache = MenuImageCache(args.cache_dir)
+    results = cache.prewarm()
+    for name, cached, ms in results:
+        print(f"[메뉴 캐시] {name:<8} {ms:7.1f} ms  -> {cached or '원본 없음 (건너뜀)'}")
+    if not args.keep_stale:
+        removed = cache.prune(cached for _, cached, _ in results)
+        if removed:
+            print(f"[메뉴 캐시] 옛 캐시 파일 {removed}개 삭제")
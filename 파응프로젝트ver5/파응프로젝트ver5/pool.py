@@ -0,0 +1,51 @@
+# ==========================================
+# 클래스별 오브젝트 풀
+# ==========================================
+class ObjectPool:
+    """죽은 유닛을 버리지 않고 클래스별로 모아 두었다가 다시 쓰는 풀
+
+    acquire(cls, ...) : 같은 클래스의 쉬는 객체가 있으면 reset(...) 해서 돌려주고, 없으면 새로 만든다.
+    release(obj)      : 객체를 풀로 돌려준다 (보통 obj.despawn() 이 호출).
+    풀에 들어가는 클래스는 생성자와 같은 인자를 받는 reset() 을 가지고 있어야 한다.
+    """
+    def __init__(self, max_free_per_class=256):
+        self.max_free_per_class = max_free_per_class
+        self._free = {}   # 클래스 -> 쉬는 객체 목록
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, cls, *args):
+        free = self._free.get(cls)
+        if free:
+            obj = free.pop()
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = cls(*args)
+            self.created += 1
+        obj.pool = self
+        return obj
+
+    def release(self, obj):
+        free = self._free.setdefault(type(obj), [])
+        if len(free) < self.max_free_per_class:
+            free.append(obj)
+        obj.pool = None
+
+    def free_count(self):
+        return sum(len(free) for free in self._free.values())
+
+    def clear(self):
+        self._free.clear()
+
+
+class Poolable:
+    """풀에 들어갈 수 있는 객체용 믹스인 (ObjectPool.acquire 가 pool 을 채워 넣는다)"""
+    __slots__ = ()  # __slots__ 를 쓰는 자식 클래스가 __dict__ 를 갖지 않도록
+    pool = None
+
+    def despawn(self):
+        """그룹에서 빼고 풀로 돌려준다 (풀에서 나온 객체가 아니면 kill() 과 같다)"""
+        self.kill()
+        if self.pool is not None:
+            self.pool.release(self)
@@ -0,0 +1,235 @@
+import json
+import math
+from array import array
+from time import perf_counter
+import pygame
+
+# ==========================================
+# 프레임 시간 프로파일러
+# ==========================================
+# 게임 루프 한 프레임을 구간(대기 / 이벤트 / 시뮬레이션 / 그리기 / 화면 반영 ...)별로 잰다.
+#   - 구간별 최근 N 프레임 시간(ms)을 고정 크기 링 버퍼에 보관 -> p50 / p99
+#   - 구간 하나하나의 (시작, 길이) 를 이벤트 링 버퍼에 남겨 트레이스 파일로 저장
+# 측정은 perf_counter 한 번 + 배열 대입뿐이라 켜 둔 채로 플레이해도 부담이 거의 없다.
+#
+# 사용법
+#   t = profiler.begin_frame()
+#   ...이벤트 처리...
+#   t = profiler.record("events", t)   # t 부터 지금까지를 "events" 로 기록하고 지금 시각을 반환
+#   ...
+#   profiler.end_frame(players=..., enemies=...)   # 카운터(유닛 수 등)도 함께 기록
+#
+# "sim.players" 처럼 점이 들어간 이름은 "sim" 구간 안쪽의 세부 구간이다 (한 프레임에 여러 스텝이면 합산).
+# 트레이스는 Chrome Trace Event 형식 JSON (chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)
+
+def percentile(values, q):
+    """정렬된 목록의 q 분위수 (nearest-rank, 0 < q <= 1)"""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+
+class FrameProfiler:
+    def __init__(self, capacity=600, trace_capacity=32768):
+        self.capacity = capacity              # 구간별로 보관하는 최근 프레임 수
+        self.trace_capacity = trace_capacity  # 트레이스로 남기는 최근 구간 이벤트 수
+        self.origin = perf_counter()
+        self.clear()
+
+    def clear(self):
+        """기록을 모두 비운다 (구간 이름 목록도 새로 만든다)"""
+        capacity = self.capacity
+        self.frames = 0
+        self.names = []
+        self._index = {}
+        self._history = []  # 구간 번호 -> 프레임별 ms 링 버퍼
+        self._current = []  # 구간 번호 -> 이번 프레임 누적 초
+        self.frame_ms = array("d", bytes(8 * capacity))
+        self.frame_start = array("d", bytes(8 * capacity))
+        self.counters = {}
+        self._counter_history = {}
+        self._frame_begin = perf_counter()
+
+        self._events = 0
+        self._ev_section = array("H", bytes(2 * self.trace_capacity))
+        self._ev_start = array("d", bytes(8 * self.trace_capacity))
+        self._ev_dur = array("d", bytes(8 * self.trace_capacity))
+
+    def _add_section(self, name):
+        index = len(self.names)
+        self.names.append(name)
+        self._index[name] = index
+        self._history.append(array("d", bytes(8 * self.capacity)))
+        self._current.append(0.0)
+        return index
+
+    # ------------------------------------------
+    # 측정
+    # ------------------------------------------
+    def begin_frame(self):
+        self._frame_begin = now = perf_counter()
+        return now
+
+    def record(self, name, start):
+        """start 부터 지금까지를 name 구간으로 기록. 지금 시각을 반환 (다음 구간의 start 로 이어 쓴다)"""
+        now = perf_counter()
+        index = self._index.get(name)
+        if index is None:
+            index = self._add_section(name)
+        self._current[index] += now - start
+
+        slot = self._events % self.trace_capacity
+        self._ev_section[slot] = index
+        self._ev_start[slot] = start
+        self._ev_dur[slot] = now - start
+        self._events += 1
+        return now
+
+    def end_frame(self, **counters):
+        """프레임 마감: 구간별 누적 시간을 링 버퍼에 넣고 카운터(유닛 수 등)를 기록"""
+        now = perf_counter()
+        slot = self.frames % self.capacity
+        self.frame_ms[slot] = (now - self._frame_begin) * 1000
+        self.frame_start[slot] = self._frame_begin
+        for index, history in enumerate(self._history):
+            history[slot] = self._current[index] * 1000
+            self._current[index] = 0.0
+        for name, value in counters.items():
+            history = self._counter_history.get(name)
+            if history is None:
+                history = self._counter_history[name] = array("d", bytes(8 * self.capacity))
+            history[slot] = value
+        self.counters = counters
+        self.frames += 1
+
+    # ------------------------------------------
+    # 통계
+    # ------------------------------------------
+    def _recent(self, ring):
+        """링 버퍼에서 채워진 부분만 (순서는 상관없음)"""
+        return ring[:min(self.frames, self.capacity)]
+
+    def last(self, name="frame"):
+        """마지막으로 끝난 프레임의 name 구간 ms (기록된 적 없는 구간이면 0)"""
+        if self.frames == 0 or (name != "frame" and name not in self._index):
+            return 0.0
+        ring = self.frame_ms if name == "frame" else self._history[self._index[name]]
+        return ring[(self.frames - 1) % self.capacity]
+
+    def stats(self, name="frame"):
+        """최근 프레임 기준 (p50, p99, 최대) ms. name="frame" 이면 프레임 전체 시간"""
+        ring = self.frame_ms if name == "frame" else self._history[self._index[name]]
+        values = sorted(self._recent(ring))
+        if not values:
+            return 0.0, 0.0, 0.0
+        return percentile(values, 0.50), percentile(values, 0.99), values[-1]
+
+    def busy_stats(self, idle="wait"):
+        """대기 구간(clock.tick 등)을 뺀 실제 작업 시간의 (p50, p99, 최대) ms"""
+        if idle not in self._index:
+            return self.stats("frame")
+        idle_ms = self._recent(self._history[self._index[idle]])
+        values = sorted(frame - wait for frame, wait in zip(self._recent(self.frame_ms), idle_ms))
+        if not values:
+            return 0.0, 0.0, 0.0
+        return percentile(values, 0.50), percentile(values, 0.99), values[-1]
+
+    def section_names(self):
+        """표시 순서: 처음 기록된 순서, 세부 구간("sim.players")은 바깥 구간("sim") 바로 뒤"""
+        order = {name: i for i, name in enumerate(self.names)}
+
+        def sort_key(name):
+            parent = name.split(".", 1)[0]
+            return (order.get(parent, order[name]), parent != name, order[name])
+        return sorted(self.names, key=sort_key)
+
+    def report(self):
+        lines = [f"[프로파일] 최근 {min(self.frames, self.capacity)}프레임 (p50 / p99 / 최대 ms)"]
+        for name in ["frame"] + self.section_names():
+            p50, p99, worst = self.stats(name)
+            lines.append(f"  {name:<16} {p50:7.2f} {p99:7.2f} {worst:7.2f}")
+        return "\n".join(lines)
+
+    # ------------------------------------------
+    # 트레이스 파일
+    # ------------------------------------------
+    def dump_trace(self, path):
+        """남아 있는 구간 이벤트 + 프레임 + 카운터를 Chrome Trace Event JSON 으로 저장. 이벤트 수 반환"""
+        def us(t):
+            return round((t - self.origin) * 1e6, 1)
+
+        events = [{"name": "thread_name", "ph": "M", "pid": 0, "tid": 0, "args": {"name": "game loop"}}]
+        n_frames = min(self.frames, self.capacity)
+        for i in range(self.frames - n_frames, self.frames):
+            slot = i % self.capacity
+            start = self.frame_start[slot]
+            events.append({"name": "frame", "ph": "X", "pid": 0, "tid": 0, "ts": us(start),
+                           "dur": round(self.frame_ms[slot] * 1000, 1), "args": {"frame": i}})
+            for name, history in self._counter_history.items():
+                events.append({"name": name, "ph": "C", "pid": 0, "tid": 0, "ts": us(start),
+                               "args": {name: history[slot]}})
+
+        n_events = min(self._events, self.trace_capacity)
+        for i in range(self._events - n_events, self._events):
+            slot = i % self.trace_capacity
+            events.append({"name": self.names[self._ev_section[slot]], "ph": "X", "pid": 0, "tid": 0,
+                           "ts": us(self._ev_start[slot]), "dur": round(self._ev_dur[slot] * 1e6, 1)})
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return len(events)
+
+
+# ==========================================
+# 화면 표시 (p50 / p99 + 구간별 시간 + 유닛 수)
+# ==========================================
+class ProfilerOverlay:
+    """프로파일러 값을 반투명 패널로 그린다. 글자는 refresh_frames 마다 한 번만 다시 래스터화
+
+    렌더러 위젯으로 넘길 때 key() 가 바뀐 경우에만 다시 그려진다.
+    """
+    def __init__(self, profiler, font, pos, width=260, max_lines=16, refresh_frames=30):
+        self.profiler = profiler
+        self.font = font
+        self.refresh_frames = refresh_frames
+        self.line_height = font.get_linesize()
+        self.rect = pygame.Rect(pos, (width, self.line_height * max_lines + 8))
+        self.panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.version = 0
+        self._refreshed_at = None
+
+    def key(self):
+        return self.version
+
+    def update(self):
+        """refresh_frames 가 지났으면 표시 내용을 새로 만든다"""
+        frames = self.profiler.frames
+        if self._refreshed_at is not None and frames - self._refreshed_at < self.refresh_frames:
+            return
+        self._refreshed_at = frames
+        self.version += 1
+
+        prof = self.profiler
+        p50, p99, _ = prof.stats("frame")
+        lines = [f"frame  p50 {p50:5.2f}  p99 {p99:5.2f} ms"]
+        if "wait" in prof.names:
+            p50, p99, _ = prof.busy_stats("wait")
+            lines.append(f"work   p50 {p50:5.2f}  p99 {p99:5.2f} ms")
+        for name in prof.section_names():
+            if name == "wait":
+                continue
+            p50, p99, _ = prof.stats(name)
+            label = ("  " + name.split(".", 1)[1]) if "." in name else name
+            lines.append(f"{label:<12} {p50:5.2f} / {p99:5.2f}")
+        counters = prof.counters
+        if counters:
+            lines.append("  ".join(f"{name} {value}" for name, value in counters.items()))
+
+        panel = self.panel
+        panel.fill((0, 0, 0, 170))
+        max_lines = (self.rect.height - 8) // self.line_height
+        for i, line in enumerate(lines[:max_lines]):
+            panel.blit(self.font.render(line, True, (255, 255, 255)), (6, 4 + i * self.line_height))
+
+    def draw(self, surface):
+        surface.blit(self.panel, self.rect)
@@ -0,0 +1,212 @@
+import pygame
+import config
+from assets import assets
+
+# ==========================================
+# 전투 화면 렌더러
+# ==========================================
+# run_game 은 매 프레임 아래 두 가지를 넘긴다.
+#   blit_list : 유닛/이펙트처럼 매 프레임 움직이는 것들 [(Surface, (x, y)), ...]
+#   widgets   : 버튼/HUD 처럼 대부분 정지해 있는 UI [(상태키, Rect, 그리기함수), ...]
+# 위젯은 상태키가 바뀌었을 때만 다시 그릴 필요가 있다.
+# render() = draw() (화면 Surface 에 그리기) + present() (디스플레이에 반영). 프로파일러는 둘을 따로 잰다.
+
+class FullRenderer:
+    """기존 방식: 매 프레임 배경부터 전부 다시 그리고 display.flip()"""
+    def __init__(self, screen, background=None):
+        self.screen = screen
+        self.background = background
+
+    def set_background(self, background):
+        self.background = background
+
+    def invalidate(self):
+        pass
+
+    def render(self, blit_list, widgets):
+        self.draw(blit_list, widgets)
+        self.present()
+
+    def draw(self, blit_list, widgets):
+        self.screen.fill(config.WHITE)
+        if self.background: self.screen.blit(self.background, (0, 0))
+        self.screen.blits(blit_list, doreturn=False)
+        for _, _, draw in widgets:
+            draw(self.screen)
+
+    def present(self):
+        pygame.display.flip()
+
+
+class DirtyRenderer:
+    """바뀐 영역(더티 렉트)만 지우고 다시 그려서 display.update(rects) 로 올리는 렌더러
+
+    - 지난 프레임에 유닛/이펙트를 그린 영역은 배경으로 지운다.
+    - 위젯은 상태키가 바뀌었거나, 지워지거나 새로 그려지는 영역과 겹칠 때만 다시 그린다.
+      (위젯 영역도 먼저 배경으로 지운 뒤 그려야 반투명 가장자리가 겹쳐 진해지지 않는다)
+    - 배경 교체 / 동영상 재생 직후 등은 invalidate() 로 한 번 전체를 다시 그린다.
+    - 지울 영역(지난 프레임 + 이번 프레임 유닛 영역)의 넓이 합이 화면의 DIRTY_MAX_AREA_RATIO 배를 넘으면
+      그 프레임은 전체를 다시 그린다 (유닛이 수백 마리면 조각조각 지우는 쪽이 더 느리다).
+    """
+    def __init__(self, screen, background=None):
+        self.screen = screen
+        self.background = background
+        self._prev_rects = []    # 지난 프레임에 유닛/이펙트를 그린 영역
+        self._widget_keys = {}   # 위젯 Rect 위치 -> 지난 상태키
+        self._prev_blits = None
+        self._prev_widget_keys = None
+        self._full = True
+        self._pending = None     # present() 에서 반영할 것: "flip" / 더티 렉트 목록 / None(변화 없음)
+        self.max_dirty_area = screen.get_width() * screen.get_height() * config.DIRTY_MAX_AREA_RATIO
+
+    def set_background(self, background):
+        if background is not self.background:
+            self.background = background
+            self._full = True
+
+    def invalidate(self):
+        self._full = True
+
+    def _erase(self, rect):
+        if self.background:
+            self.screen.blit(self.background, rect, rect)
+        else:
+            self.screen.fill(config.WHITE, rect)
+
+    def render(self, blit_list, widgets):
+        self.draw(blit_list, widgets)
+        self.present()
+
+    def present(self):
+        pending, self._pending = self._pending, None
+        if pending == "flip":
+            pygame.display.flip()
+        elif pending:
+            pygame.display.update(pending)
+
+    def draw(self, blit_list, widgets):
+        screen = self.screen
+        new_rects = [pygame.Rect(pos, surf.get_size()) for surf, pos in blit_list]
+
+        if self._full:
+            self._draw_full(blit_list, widgets, new_rects)
+            return
+
+        # 0. 유닛/이펙트도 그대로고 위젯 상태도 그대로면 이번 프레임은 할 일이 없다 (결과 화면 등)
+        widget_keys = [key for key, _, _ in widgets]
+        if blit_list == self._prev_blits and widget_keys == self._prev_widget_keys:
+            return
+
+        # 움직이는 영역이 화면 대부분이면 전체 다시 그리기가 더 싸다
+        dirty_area = sum(r.w * r.h for r in self._prev_rects) + sum(r.w * r.h for r in new_rects)
+        if dirty_area > self.max_dirty_area:
+            self._draw_full(blit_list, widgets, new_rects)
+            return
+        self._prev_blits = list(blit_list)
+        self._prev_widget_keys = widget_keys
+
+        # 1. 다시 그릴 위젯 결정 (상태 변화 또는 움직이는 것과 겹침)
+        erase_rects = list(self._prev_rects)
+        moving = self._prev_rects + new_rects
+        redraw = [False] * len(widgets)
+        for i, (key, rect, _) in enumerate(widgets):
+            if self._widget_keys.get(tuple(rect)) != key or rect.collidelist(moving) != -1:
+                redraw[i] = True
+                erase_rects.append(rect)
+
+        # 지워지는 위젯 영역과 겹치는 다른 위젯도 다시 그려야 한다 (더 늘지 않을 때까지)
+        changed = True
+        while changed:
+            changed = False
+            for i, (_, rect, _) in enumerate(widgets):
+                if not redraw[i] and rect.collidelist(erase_rects) != -1:
+                    redraw[i] = True
+                    erase_rects.append(rect)
+                    changed = True
+
+        # 2. 지우기: 지난 프레임 유닛 영역 + 다시 그릴 위젯 영역
+        for rect in erase_rects:
+            self._erase(rect)
+
+        # 3. 유닛/이펙트 -> 위젯 순서로 그리기 (기존 그리기 순서와 동일)
+        screen.blits(blit_list, doreturn=False)
+        for i, (key, rect, draw) in enumerate(widgets):
+            if redraw[i]:
+                draw(screen)
+                self._widget_keys[tuple(rect)] = key
+
+        # 4. 바뀐 영역만 화면에 반영 (present 에서)
+        screen_rect = screen.get_rect()
+        self._pending = [r.clip(screen_rect) for r in erase_rects + new_rects]
+        self._prev_rects = new_rects
+
+    def _draw_full(self, blit_list, widgets, new_rects):
+        screen = self.screen
+        self._full = False
+        self._erase(screen.get_rect())
+        screen.blits(blit_list, doreturn=False)
+        for key, rect, draw in widgets:
+            draw(screen)
+            self._widget_keys[tuple(rect)] = key
+        self._prev_rects = new_rects
+        self._prev_blits = list(blit_list)
+        self._prev_widget_keys = [key for key, _, _ in widgets]
+        self._pending = "flip"
+
+
+# ==========================================
+# 게임 종료(승리/패배) 화면
+# ==========================================
+class ResultScreen:
+    """승리/패배 결과 화면 레이어
+
+    오버레이 Surface 와 결과 이미지는 스테이지마다 한 번만 준비하고,
+    게임이 끝난 뒤에는 전투 화면이 더 이상 변하지 않으므로
+    처음 합성한 결과 프레임을 저장해 두었다가 이후에는 그대로 한 번만 blit 한다.
+    (매 프레임 이미지 로드 / 전체 화면 Surface 생성이 없어진다)
+    """
+    def __init__(self, buttons=()):
+        size = (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        # 기존 화면 구성 그대로: 반투명 150 + 이미지, 그 위에 반투명 180 + 이미지(20px 위)
+        self.overlays = []
+        for alpha in (150, 180):
+            overlay = pygame.Surface(size)
+            overlay.set_alpha(alpha)
+            overlay.fill(config.BLACK)
+            self.overlays.append(overlay)
+        self.img_victory = assets.image(config.IMG_RESULT_VIC, config.RESULT_IMAGE_SIZE)
+        self.img_defeat = assets.image(config.IMG_RESULT_DEF, config.RESULT_IMAGE_SIZE)
+        if self.img_victory is None or self.img_defeat is None:
+            print("결과 이미지 로드 실패")
+        self.buttons = buttons
+        self._frame = None
+        self._message = None
+
+    def reset(self):
+        self._frame = None
+        self._message = None
+
+    def draw(self, surface, message, font):
+        if self._frame is not None and message == self._message:
+            surface.blit(self._frame, (0, 0))
+            return
+
+        image = self.img_victory if "VICTORY" in message else self.img_defeat
+        for overlay, y_offset in zip(self.overlays, (0, -20)):
+            surface.blit(overlay, (0, 0))
+            if image:
+                img_x = config.SCREEN_WIDTH // 2 - image.get_width() // 2
+                img_y = config.SCREEN_HEIGHT // 2 - image.get_height() // 2 + y_offset
+                surface.blit(image, (img_x, img_y))
+        for button in self.buttons:
+            button.draw(surface, font)
+
+        # 합성된 최종 화면을 저장 (이후 프레임은 이것만 blit)
+        self._frame = surface.copy()
+        self._message = message
+
+
+def create_renderer(screen, background=None):
+    if config.RENDER_MODE == "dirty":
+        return DirtyRenderer(screen, background)
+    return FullRenderer(screen, background)
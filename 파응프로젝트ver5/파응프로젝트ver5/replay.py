@@ -0,0 +1,178 @@
+import argparse
+import os
+import struct
+import time
+from bisect import bisect_left
+import config
+from assets import assets
+from game_manager import GameManager, PLAYER_UNIT_TYPES
+
+# ==========================================
+# 리플레이 기록 / 재생
+# ==========================================
+# 한 판은 (스테이지, 엔진, 난수 시드) + 플레이어 입력 (틱, 행동) 목록만으로 완전히 재현된다.
+# (시뮬레이션은 고정 스텝이고, 난수는 GameManager 자기 시드의 Random 만 쓰기 때문)
+#
+# 파일 형식 (리틀 엔디언)
+#   헤더 14바이트 : "RPL1", 버전, 스테이지, 엔진(0=object, 1=array), 패딩, 시드(u32), SIM_HZ(u16)
+#   기록 5바이트씩: 틱(u32), 행동(u8)   - 행동 1~3 = 해당 번호 유닛 소환 버튼
+#   꼬리 9바이트  : 마지막 틱(u32), 상태 체크섬(u32), 결과(0=진행 중, 1=승리, 2=패배)
+#
+# 사용 예)
+#   python replay.py replays/stage1_20250101_120000.rpl            # 끝까지 재생 후 체크섬 확인
+#   python replay.py replays/stage1_20250101_120000.rpl --seek 3000
+#
+# 형식(HEADER / RECORD / FOOTER, snapshot.py 포함)을 바꾸면 VERSION 을 올리고 replay_check.py 의 표를 갱신할 것.
+# 왕복 검사는 pytest (tests/test_replay_format.py) 가 돌린다.
+
+MAGIC = b"RPL1"
+VERSION = 2  # 2: 체크섬을 snapshot.sim_checksum 으로 계산
+HEADER = struct.Struct("<4sBBBxIH")
+RECORD = struct.Struct("<IB")
+FOOTER = struct.Struct("<IIB")
+
+ENGINE_CODES = {"object": 0, "array": 1}
+RESULT_CODES = {"": 0, "VICTORY!!": 1, "DEFEAT...": 2}
+
+
+class Replay:
+    """리플레이 한 판의 데이터 (헤더 + 입력 기록 + 마지막 상태)"""
+    def __init__(self, stage_level, engine, seed, records=None, final_tick=0, checksum=0, result=""):
+        self.stage_level = stage_level
+        self.engine = engine
+        self.seed = seed
+        self.records = records if records is not None else []  # (틱, 행동) 목록, 틱 오름차순
+        self.final_tick = final_tick
+        self.checksum = checksum
+        self.result = result
+
+    def to_bytes(self):
+        data = bytearray(HEADER.pack(MAGIC, VERSION, self.stage_level, ENGINE_CODES[self.engine],
+                                     self.seed, config.SIM_HZ))
+        for tick, action in self.records:
+            data += RECORD.pack(tick, action)
+        data += FOOTER.pack(self.final_tick, self.checksum, RESULT_CODES.get(self.result, 0))
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, stage_level, engine_code, seed, sim_hz = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("리플레이 파일 형식이 아닙니다")
+        if sim_hz != config.SIM_HZ:
+            raise ValueError(f"SIM_HZ 가 다른 리플레이입니다 ({sim_hz} != {config.SIM_HZ})")
+        body_end = len(data) - FOOTER.size
+        records = [RECORD.unpack_from(data, offset) for offset in range(HEADER.size, body_end, RECORD.size)]
+        final_tick, checksum, result_code = FOOTER.unpack_from(data, body_end)
+        engine = {code: name for name, code in ENGINE_CODES.items()}[engine_code]
+        result = {code: text for text, code in RESULT_CODES.items()}[result_code]
+        return cls(stage_level, engine, seed, records, final_tick, checksum, result)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def apply_action(gm, action):
+    """기록된 행동 하나를 GameManager 에 적용 (실제 게임의 버튼 클릭과 같은 호출)"""
+    if action in PLAYER_UNIT_TYPES:
+        gm.spawn_player_unit(action)
+
+
+class ReplayRecorder:
+    """게임 루프에서 입력을 (틱, 행동) 으로 기록 - 쿨타임/비용 확인을 통과한 클릭만 넘겨준다"""
+    def __init__(self, gm):
+        self.replay = Replay(gm.stage_level, gm.engine_mode, gm.seed)
+
+    def record(self, tick, action):
+        if self.replay is not None:
+            self.replay.records.append((tick, action))
+
+    def discard(self):
+        """이번 판은 기록하지 않는다 (체크포인트로 되감은 경우)"""
+        self.replay = None
+
+    def finish(self, gm):
+        """판이 끝났을 때(또는 중간에 나갈 때) 마지막 틱과 체크섬 기록. 기록을 버렸으면 None"""
+        if self.replay is None:
+            return None
+        self.replay.final_tick = gm.tick
+        self.replay.checksum = gm.checksum()
+        self.replay.result = gm.result_message
+        return self.replay
+
+
+class ReplayPlayer:
+    """리플레이를 헤드리스로 최대 속도 재생 (빨리 감기 / 스냅샷 기반 탐색 / 체크섬 검증)"""
+    def __init__(self, replay, snapshot_interval=600):
+        self.replay = replay
+        self.snapshot_interval = snapshot_interval  # 이 틱마다 상태 스냅샷 저장 (탐색용)
+        self.gm = GameManager(replay.stage_level, engine=replay.engine, seed=replay.seed)
+        if self.gm.engine:
+            self.gm.engine.sync_views = False
+        self.ticks = [tick for tick, _ in replay.records]
+        self.next_record = 0
+        self.snapshots = {0: self.gm.snapshot()}
+
+    def _apply_actions(self):
+        """현재 틱에 기록된 입력 적용 (실제 게임처럼 다음 스텝 전에)"""
+        records = self.replay.records
+        while self.next_record < len(records) and records[self.next_record][0] <= self.gm.tick:
+            apply_action(self.gm, records[self.next_record][1])
+            self.next_record += 1
+
+    def step_to(self, tick):
+        """빨리 감기: tick 까지 스텝 진행 (중간중간 스냅샷 저장)"""
+        gm = self.gm
+        while gm.tick < tick and not gm.game_over:
+            self._apply_actions()
+            gm.step()
+            if gm.tick % self.snapshot_interval == 0 and gm.tick not in self.snapshots:
+                self.snapshots[gm.tick] = gm.snapshot()
+
+    def seek(self, tick):
+        """tick 시점으로 이동. 뒤로 가거나 멀리 앞이면 가장 가까운 이전 스냅샷에서 다시 진행"""
+        base = max(t for t in self.snapshots if t <= tick)
+        if not (base <= self.gm.tick <= tick):
+            self.gm.restore(self.snapshots[base])
+            self.next_record = bisect_left(self.ticks, base)
+        self.step_to(tick)
+
+    def run(self):
+        """끝까지 재생하고 기록된 체크섬과 비교. 일치하면 True"""
+        self.seek(self.replay.final_tick)
+        self._apply_actions()
+        return self.verify()
+
+    def verify(self):
+        return self.gm.tick == self.replay.final_tick and self.gm.checksum() == self.replay.checksum
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="리플레이 헤드리스 재생 / 검증")
+    parser.add_argument("path")
+    parser.add_argument("--seek", type=int, default=None, help="이 틱까지만 진행한 상태를 출력")
+    parser.add_argument("--snapshot-interval", type=int, default=600)
+    args = parser.parse_args()
+
+    with assets.headless_mode():
+        replay = Replay.load(args.path)
+        print(f"[리플레이] 스테이지 {replay.stage_level} / {replay.engine} / 시드 {replay.seed}, "
+              f"입력 {len(replay.records)}개, {replay.final_tick}틱 ({os.path.getsize(args.path)} 바이트)")
+
+        player = ReplayPlayer(replay, snapshot_interval=args.snapshot_interval)
+        start = time.perf_counter()
+        if args.seek is not None:
+            player.seek(args.seek)
+            gm = player.gm
+            print(f"[탐색] {gm.tick}틱: 돈 {gm.money}, 기지 HP {gm.player_base_hp}, "
+                  f"아군 {len(gm.player_units)} / 적 {len(gm.enemy_units)}")
+        else:
+            ok = player.run()
+            print(f"[재생] {player.gm.result_message or '진행 중'}, 체크섬 {'일치' if ok else '불일치!'}")
+        print(f"[재생] {(time.perf_counter() - start) * 1000:.1f} ms")
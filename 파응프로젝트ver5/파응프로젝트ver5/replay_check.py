@@ -0,0 +1,127 @@
+import argparse
+import sys
+import config
+import replay as replay_format
+import snapshot as snapshot_codec
+from assets import assets
+from game_manager import GameManager
+from headless import GreedySpawnPolicy, simulate
+from replay import Replay, ReplayRecorder, ReplayPlayer
+
+# ==========================================
+# 스냅샷 / 리플레이 형식 검사
+# ==========================================
+# 바이너리 형식(snapshot.py 헤더, replay.py 파일)의 왕복 검사.
+# pytest 가 tests/test_replay_format.py 에서 스테이지 1~3 / 두 엔진으로 자동 실행하고,
+# 이 파일을 직접 실행하면 더 긴 판이나 다른 스테이지를 손으로 확인할 수 있다 (실패하면 종료 코드 1).
+#   1) 형식 고정: 버전 번호마다 struct 형식 문자열을 적어 둔다.
+#      VERSION 을 올리지 않고 헤더만 바꾸면 (예전 파일을 조용히 잘못 읽게 되므로) 여기서 걸린다.
+#      형식을 바꿀 때는 VERSION 을 올리고 아래 표에 새 항목을 추가한다.
+#   2) 스냅샷: 진행 중 여러 시점에서 snapshot -> 새 GameManager 에 restore -> 다시 snapshot 이 같은 바이트인지
+#   3) 리플레이: 헤드리스로 한 판 기록 -> bytes -> 다시 읽기 -> 끝까지 재생해 체크섬 일치 확인,
+#      그리고 뒤로 탐색(seek)했을 때 기록 중에 본 체크섬과 같은지
+#
+# 사용 예)
+#   python replay_check.py                      # 스테이지 1~3, 두 엔진 모두
+#   python replay_check.py --stages 1 --engines array
+
+SNAPSHOT_FORMATS = {
+    2: ("<BBBIddddd??BIddIIIIII", "<Bddiiddd?"),
+}
+REPLAY_FORMATS = {
+    2: ("<4sBBBxIH", "<IB", "<IIB"),
+}
+
+
+class RecordingPolicy(GreedySpawnPolicy):
+    """GreedySpawnPolicy 와 같이 소환하면서, 성공한 클릭을 게임 루프처럼 (틱, 버튼) 으로 기록"""
+    def __init__(self, recorder):
+        super().__init__()
+        self.recorder = recorder
+
+    def try_spawn(self, gm, unit_type, current_time):
+        if super().try_spawn(gm, unit_type, current_time):
+            self.recorder.record(gm.tick, unit_type)
+            return True
+        return False
+
+
+def check_formats():
+    errors = []
+    if snapshot_codec.VERSION not in SNAPSHOT_FORMATS:
+        errors.append(f"스냅샷 버전 {snapshot_codec.VERSION} 의 형식이 표에 없음")
+    elif (snapshot_codec.HEADER.format, snapshot_codec.UNIT.format) != SNAPSHOT_FORMATS[snapshot_codec.VERSION]:
+        errors.append(f"스냅샷 형식이 바뀌었는데 VERSION({snapshot_codec.VERSION}) 이 그대로")
+    current = (replay_format.HEADER.format, replay_format.RECORD.format, replay_format.FOOTER.format)
+    if replay_format.VERSION not in REPLAY_FORMATS:
+        errors.append(f"리플레이 버전 {replay_format.VERSION} 의 형식이 표에 없음")
+    elif current != REPLAY_FORMATS[replay_format.VERSION]:
+        errors.append(f"리플레이 형식이 바뀌었는데 VERSION({replay_format.VERSION}) 이 그대로")
+    return errors
+
+
+def check_stage(stage_level, engine, seed, max_ticks, sample_every):
+    """한 판 기록 + 스냅샷 / 리플레이 왕복 검사. 문제 목록 반환 (비어 있으면 통과)"""
+    errors = []
+    gm = GameManager(stage_level, engine=engine, seed=seed)
+    if gm.engine:
+        gm.engine.sync_views = False
+    recorder = ReplayRecorder(gm)
+    policy = RecordingPolicy(recorder)
+
+    # 기록하면서 sample_every 틱마다 체크섬 / 스냅샷을 모은다
+    checksums = {}
+    while not gm.game_over and gm.tick < max_ticks:
+        simulate(gm, policy, min(gm.tick + sample_every, max_ticks))
+        checksums[gm.tick] = gm.checksum()
+        data = gm.snapshot()
+        other = GameManager(stage_level, engine=engine, seed=seed)
+        other.restore(data)
+        if other.snapshot() != data:
+            errors.append(f"{gm.tick}틱: restore 후 snapshot 이 다름")
+        if other.checksum() != checksums[gm.tick]:
+            errors.append(f"{gm.tick}틱: restore 후 체크섬이 다름")
+
+    original = recorder.finish(gm)
+    data = original.to_bytes()
+    loaded = Replay.from_bytes(data)
+    if loaded.to_bytes() != data:
+        errors.append("리플레이 bytes -> 읽기 -> bytes 가 다름")
+
+    player = ReplayPlayer(loaded, snapshot_interval=sample_every)
+    if not player.run():
+        errors.append(f"끝까지 재생한 체크섬 불일치 ({player.gm.tick}틱)")
+    # 끝에서부터 뒤로 탐색: 스냅샷에서 다시 진행한 결과가 기록 때와 같아야 한다
+    for tick in sorted(checksums, reverse=True):
+        player.seek(tick)
+        if player.gm.checksum() != checksums[tick]:
+            errors.append(f"{tick}틱으로 뒤로 탐색한 체크섬 불일치")
+    return errors, gm.tick, len(original.records)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="스냅샷 / 리플레이 형식 왕복 검사")
+    parser.add_argument("--stages", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--engines", nargs="+", choices=["object", "array"], default=["object", "array"])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-time", type=float, default=300, help="판마다 시뮬레이션 최대 시간(초)")
+    parser.add_argument("--sample-every", type=int, default=600, help="체크섬 / 스냅샷을 확인할 틱 간격")
+    args = parser.parse_args()
+
+    failed = False
+    for error in check_formats():
+        print(f"[형식] {error}")
+        failed = True
+
+    max_ticks = int(args.max_time * 1000 / config.SIM_STEP_MS)
+    with assets.headless_mode():
+        for stage_level in args.stages:
+            for engine in args.engines:
+                errors, ticks, inputs = check_stage(stage_level, engine, args.seed, max_ticks, args.sample_every)
+                status = "통과" if not errors else "실패"
+                print(f"[검사] 스테이지 {stage_level} / {engine}: {ticks}틱, 입력 {inputs}개 - {status}")
+                for error in errors:
+                    print(f"    {error}")
+                failed = failed or bool(errors)
+
+    sys.exit(1 if failed else 0)
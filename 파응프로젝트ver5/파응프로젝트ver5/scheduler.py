@@ -0,0 +1,71 @@
+import heapq
+import itertools
+
+# ==========================================
+# 시뮬레이션 시각 기준 이벤트 스케줄러
+# ==========================================
+class Scheduler:
+    """(시각ms, 콜백) 을 힙에 넣어 두고, 시각이 된 것만 꺼내 실행하는 우선순위 큐
+
+    매 틱마다 '시간이 됐나?' 를 타이머마다 검사하지 않고,
+    다음 이벤트 시각 하나만 비교해서 할 일이 없으면 바로 돌아간다.
+    콜백은 callback(now, *args) 로 호출되며, 실행 중에 새로 넣은 이벤트는 시각이 지났더라도
+    다음 run_due() 에서 실행된다 (같은 틱 안에서 무한 반복되지 않도록).
+    """
+    def __init__(self):
+        self._heap = []
+        self._seq = itertools.count()  # 같은 시각이면 먼저 넣은 것부터
+
+    def at(self, due, callback, *args):
+        """due(ms) 가 되면 callback(now, *args) 실행. 취소용 핸들을 돌려준다"""
+        event = [due, next(self._seq), callback, args, None, 0, False]
+        heapq.heappush(self._heap, event)
+        return event
+
+    def after(self, start, delay, callback, *args, strict=False, slack=0.0):
+        """start 시각부터 delay(ms) 가 지나면 callback(now, *args) 실행
+
+        실행 직전에 'now - start >= delay' (strict 면 >) 를 다시 확인한다.
+        기존 폴링 코드와 같은 식으로 비교해야 부동소수 경계에서도 같은 스텝에 실행되기 때문.
+        slack: 힙에서 이만큼(ms) 먼저 꺼내 본다. start + delay 가 반올림으로 now 보다 살짝 커져도
+        'now - start >= delay' 가 참인 스텝을 놓치지 않게 (폴링을 그대로 대신해야 하는 이벤트용)
+        """
+        event = [start + delay - slack, next(self._seq), callback, args, start, delay, strict]
+        heapq.heappush(self._heap, event)
+        return event
+
+    def cancel(self, event):
+        """예약 취소 (힙에서 바로 빼지 않고 표시만 해 두었다가 꺼낼 때 버린다)"""
+        event[2] = None
+
+    def run_due(self, now):
+        """now 이하 시각의 이벤트를 시각 순으로 실행. 실행한 개수 반환"""
+        heap = self._heap
+        if not heap or heap[0][0] > now:
+            return 0
+        due_events = []
+        while heap and heap[0][0] <= now:
+            due_events.append(heapq.heappop(heap))
+        count = 0
+        for event in due_events:
+            _, _, callback, args, start, delay, strict = event
+            if callback is None:
+                continue
+            if start is not None:
+                elapsed = now - start
+                if elapsed < delay or (strict and elapsed == delay):
+                    heapq.heappush(heap, event)  # 경계값: 다음 run_due 에서 다시 확인
+                    continue
+            callback(now, *args)
+            count += 1
+        return count
+
+    def next_due(self):
+        """가장 가까운 예약 시각 (없으면 None)"""
+        return self._heap[0][0] if self._heap else None
+
+    def clear(self):
+        self._heap.clear()
+
+    def __len__(self):
+        return len(self._heap)
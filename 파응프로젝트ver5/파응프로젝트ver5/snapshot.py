@@ -0,0 +1,113 @@
+import struct
+import zlib
+from array import array
+
+# ==========================================
+# GameManager 상태 <-> 압축 바이트 버퍼
+# ==========================================
+# GameManager.snapshot() / restore() 가 쓰는 직렬화 형식 (리틀 엔디언, 버전 2)
+#   헤더   : 스칼라 상태 (틱, 시각, 돈, 기지 HP, 웨이브 카운터, 난수 시드, 엔드리스 웨이브 / 대기열 ...)
+#            + 유닛/이펙트 개수
+#   난수   : Mersenne Twister 상태 625워드 (u32)
+#   유닛   : 아군 -> 적 순서, 한 유닛당 50바이트 (종류 번호, 위치, HP, 타이머, 공격 중 여부)
+#   이펙트 : x(i32) / y / 직전 y / 알파(f64) 배열
+# 에셋, Surface, 콜백은 담지 않는다. 유닛 종류는 이름 대신 UNIT_TYPES 의 순번으로 저장한다.
+
+VERSION = 2
+HEADER = struct.Struct("<BBBIddddd??BIddIIIIII")
+UNIT = struct.Struct("<Bddiiddd?")
+RNG_WORDS = 625
+
+RESULT_MESSAGES = ("", "VICTORY!!", "DEFEAT...")
+ENGINE_MODES = ("object", "array")
+
+
+def _number(value):
+    """f64 로 저장한 돈/HP 를 원래 정수였으면 정수로 (HUD 표시가 "100.0" 이 되지 않도록)"""
+    return int(value) if value.is_integer() else value
+
+
+def pack(state, type_names):
+    """GameManager 상태 딕셔너리 -> bytes (type_names: 유닛 종류 이름 목록, 순번이 저장된다)"""
+    type_index = {name: i for i, name in enumerate(type_names)}
+    players, enemies = state["players"], state["enemies"]
+    xs, ys, prev_ys, alphas = state["effects"]
+    rng_words = state["rng"][1]
+
+    size = HEADER.size + RNG_WORDS * 4 + UNIT.size * (len(players) + len(enemies)) + len(xs) * 28
+    buf = bytearray(size)
+    HEADER.pack_into(buf, 0, VERSION, state["stage_level"], ENGINE_MODES.index(state["engine"]),
+                     state["tick"], state["sim_time"], state["accumulator"], state["money"],
+                     state["income_time"], state["player_base_hp"], state["game_over"], state["boss_spawned"],
+                     RESULT_MESSAGES.index(state["result_message"]), state["enemies_spawned_count"],
+                     state["spawn_timer"], state["spawn_interval"], state["seed"],
+                     state["wave"], state["spawn_backlog"], len(players), len(enemies), len(xs))
+    offset = HEADER.size
+    buf[offset:offset + RNG_WORDS * 4] = array("I", rng_words).tobytes()
+    offset += RNG_WORDS * 4
+
+    pack_unit = UNIT.pack_into
+    for units in (players, enemies):
+        for name, x, prev_x, rect_x, bottom, hp, last_attack, anim_start, unit_state in units:
+            pack_unit(buf, offset, type_index[name], x, prev_x, rect_x, bottom, hp,
+                      last_attack, anim_start, unit_state == "attack")
+            offset += UNIT.size
+
+    for values, code in ((xs, "i"), (ys, "d"), (prev_ys, "d"), (alphas, "d")):
+        raw = array(code, values).tobytes()
+        buf[offset:offset + len(raw)] = raw
+        offset += len(raw)
+    return bytes(buf)
+
+
+def unpack(data, type_names):
+    """pack() 결과 -> 상태 딕셔너리 (GameManager.restore 용)"""
+    (version, stage_level, engine_code, tick, sim_time, accumulator, money, income_time, player_base_hp,
+     game_over, boss_spawned, result_code, enemies_spawned_count, spawn_timer, spawn_interval, seed,
+     wave, spawn_backlog, n_players, n_enemies, n_effects) = HEADER.unpack_from(data, 0)
+    if version != VERSION:
+        raise ValueError(f"스냅샷 버전이 다릅니다 ({version})")
+    offset = HEADER.size
+    rng_words = array("I")
+    rng_words.frombytes(data[offset:offset + RNG_WORDS * 4])
+    offset += RNG_WORDS * 4
+
+    teams = []
+    for count in (n_players, n_enemies):
+        units = []
+        for type_i, x, prev_x, rect_x, bottom, hp, last_attack, anim_start, attacking in UNIT.iter_unpack(
+                data[offset:offset + UNIT.size * count]):
+            units.append((type_names[type_i], x, prev_x, rect_x, bottom, hp, last_attack, anim_start,
+                          "attack" if attacking else "move"))
+        teams.append(units)
+        offset += UNIT.size * count
+
+    effects = []
+    for code in ("i", "d", "d", "d"):
+        values = array(code)
+        values.frombytes(data[offset:offset + values.itemsize * n_effects])
+        effects.append(values.tolist())
+        offset += values.itemsize * n_effects
+
+    return {
+        "stage_level": stage_level, "engine": ENGINE_MODES[engine_code],
+        "tick": tick, "sim_time": sim_time, "accumulator": accumulator,
+        "money": _number(money), "income_time": income_time, "player_base_hp": _number(player_base_hp),
+        "game_over": game_over, "result_message": RESULT_MESSAGES[result_code], "boss_spawned": boss_spawned,
+        "enemies_spawned_count": enemies_spawned_count, "spawn_timer": spawn_timer,
+        "spawn_interval": spawn_interval, "wave": wave, "spawn_backlog": spawn_backlog, "seed": seed, "rng": (3, tuple(rng_words), None),
+        "players": teams[0], "enemies": teams[1], "effects": tuple(effects),
+    }
+
+
+def sim_checksum(state, type_names):
+    """시뮬레이션 결과를 좌우하는 값만의 CRC32 (직전 위치 / 이펙트 / 시간 누적값 등 그리기용은 제외)"""
+    type_index = {name: i for i, name in enumerate(type_names)}
+    crc = zlib.crc32(struct.pack("<Iddii?", state["tick"], state["money"], state["player_base_hp"],
+                                 state["enemies_spawned_count"], RESULT_MESSAGES.index(state["result_message"]),
+                                 state["boss_spawned"]))
+    for units in (state["players"], state["enemies"]):
+        for name, x, _, rect_x, bottom, hp, last_attack, anim_start, unit_state in units:
+            crc = zlib.crc32(UNIT.pack(type_index[name], x, 0.0, rect_x, bottom, hp,
+                                       last_attack, anim_start, unit_state == "attack"), crc)
+    return crc
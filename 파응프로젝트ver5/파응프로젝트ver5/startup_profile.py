@@ -0,0 +1,83 @@
+import builtins
+import sys
+import threading
+from time import perf_counter
+
+# ==========================================
+# 시작 시간 측정 (python main.py --profile-startup)
+# ==========================================
+# builtins.__import__ 를 감싸서 새로 로드된 모듈마다 자기 시간 / 누적 시간을 잰다.
+# 출력은 python -X importtime 과 같은 형식 (µs, 자식 모듈이 부모보다 먼저, 깊이만큼 들여쓰기)이고,
+# mark() 로 남긴 단계(런처 창 표시, 게임 모듈 로드 완료 등)까지 걸린 시간도 함께 보여 준다.
+# importlib.import_module 처럼 import 문을 거치지 않는 로드는 부르는 쪽 자기 시간에 합산된다.
+
+class StartupProfiler:
+    def __init__(self):
+        self.start = perf_counter()
+        self.records = []  # (깊이, 모듈 이름, 자기 시간 s, 누적 시간 s, 스레드 이름) - 로드가 끝난 순서
+        self.marks = []    # (단계 이름, 시작부터 s)
+        self._local = threading.local()
+        self._original_import = None
+
+    def install(self):
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        loaded_before = len(sys.modules)
+        stack.append(0.0)  # 이 import 안에서 새로 로드된 자식 모듈들의 누적 시간
+        start = perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = perf_counter() - start
+            children = stack.pop()
+            if len(sys.modules) > loaded_before:
+                self.records.append((len(stack), self._label(name, globals, fromlist, level),
+                                     elapsed - children, elapsed, threading.current_thread().name))
+                if stack:
+                    stack[-1] += elapsed
+
+    @staticmethod
+    def _label(name, globals, fromlist, level):
+        """상대 import 는 절대 이름으로, 'from 패키지 import 하위모듈' 은 하위 모듈 이름까지"""
+        if level and globals:
+            package = globals.get("__package__") or ""
+            name = package.rsplit(".", level - 1)[0] + ("." + name if name else "")
+        if fromlist:
+            loaded = [f"{name}.{item}" for item in fromlist if f"{name}.{item}" in sys.modules]
+            if loaded:
+                return ", ".join(loaded)
+        return name
+
+    def mark(self, label):
+        """지금까지 걸린 시간을 단계 이름으로 기록"""
+        self.marks.append((label, perf_counter() - self.start))
+
+    def report(self, since=0, min_us=1000):
+        """since 번째 기록부터 -X importtime 형식으로. 누적 min_us 미만인 모듈은 생략"""
+        lines = ["import time: self [us] | cumulative | imported package"]
+        records = self.records[since:]
+        for depth, name, self_time, total, thread in records:
+            if total * 1e6 < min_us:
+                continue
+            where = "" if thread == "MainThread" else f"  ({thread})"
+            lines.append(f"import time: {self_time * 1e6:9.0f} | {total * 1e6:10.0f} | {'  ' * depth}{name}{where}")
+        top = sum(total for depth, _, _, total, _ in records if depth == 0)
+        lines.append(f"[시작] 새로 로드한 모듈 {len(records)}개, 최상위 import 합계 {top * 1000:.1f} ms")
+        for label, at in self.marks:
+            lines.append(f"[시작] {label}: {at * 1000:.1f} ms")
+        return "\n".join(lines)
+
+
+# main.py 가 --profile-startup 일 때 가장 먼저 install() 한다
+startup_profiler = StartupProfiler()
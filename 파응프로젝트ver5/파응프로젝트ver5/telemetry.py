@@ -0,0 +1,89 @@
+from profiler import percentile
+
+# ==========================================
+# 처리량 기록 (엔드리스 / 스트레스 테스트)
+# ==========================================
+# interval_sec 마다 한 줄씩: 살아 있는 유닛 수, 프레임 수, update(시뮬레이션) ms 와 draw ms 의 분포,
+# 따라잡기 한도 때문에 버린 시뮬레이션 시간. 유닛이 몇 마리일 때부터 느려지는지 찾는 용도다.
+#   - 게임: 프레임마다 frame(벽시계 초, gm, 프로파일러의 sim ms, draw + present ms 또는 그리지 않았으면 None)
+#   - 헤드리스: 스텝마다 frame(시뮬레이션 초, gm, 스텝 ms)  (draw 는 0)
+# path 를 주면 CSV 로 바로바로 저장하고 (도중에 꺼져도 앞부분은 남는다), rows 에도 모아 둔다.
+
+FIELDS = ("time_sec", "wave", "players", "enemies", "backlog", "effects", "frames", "rendered", "fps",
+          "update_p50_ms", "update_p99_ms", "update_max_ms", "draw_p50_ms", "draw_p99_ms", "draw_max_ms",
+          "dropped_ms")
+
+
+class ThroughputLog:
+    def __init__(self, path=None, interval_sec=1.0):
+        self.path = path
+        self.interval_sec = interval_sec
+        self.rows = []
+        self._file = None
+        self._origin = None
+        self._window_start = None
+        self._update_ms = []
+        self._draw_ms = []
+        self._dropped_at_start = 0.0
+        if path:
+            try:
+                self._file = open(path, "w", encoding="utf-8", newline="")
+                self._file.write(",".join(FIELDS) + "\n")
+            except OSError as e:
+                print(f"[경고] 처리량 기록 파일을 열 수 없음: {e}")
+
+    def frame(self, now, gm, update_ms, draw_ms=0.0):
+        """draw_ms 가 None 이면 그리기를 건너뛴 프레임 (rendered 열에 들어가지 않는다)"""
+        if self._origin is None:
+            self._origin = self._window_start = now
+            self._dropped_at_start = gm.dropped_ms
+        self._update_ms.append(update_ms)
+        if draw_ms is not None:
+            self._draw_ms.append(draw_ms)
+        if now - self._window_start >= self.interval_sec:
+            self._flush(now, gm)
+
+    def _flush(self, now, gm):
+        frames = len(self._update_ms)
+        if frames == 0:
+            return
+        update = sorted(self._update_ms)
+        draw = sorted(self._draw_ms) or [0.0]
+        elapsed = now - self._window_start
+        row = (round(now - self._origin, 2), getattr(gm, "wave", 0), len(gm.player_units), len(gm.enemy_units),
+               getattr(gm, "spawn_backlog", 0), len(gm.effects), frames, len(self._draw_ms),
+               round(frames / elapsed, 1) if elapsed > 0 else 0.0,
+               round(percentile(update, 0.50), 3), round(percentile(update, 0.99), 3), round(update[-1], 3),
+               round(percentile(draw, 0.50), 3), round(percentile(draw, 0.99), 3), round(draw[-1], 3),
+               round(gm.dropped_ms - self._dropped_at_start, 1))
+        self.rows.append(row)
+        if self._file:
+            self._file.write(",".join(str(value) for value in row) + "\n")
+            self._file.flush()
+
+        self._window_start = now
+        self._update_ms.clear()
+        self._draw_ms.clear()
+        self._dropped_at_start = gm.dropped_ms
+
+    def close(self, now=None, gm=None):
+        """남은 구간을 기록하고 파일을 닫는다"""
+        if now is not None and gm is not None:
+            self._flush(now, gm)
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def summary(self):
+        """최대 유닛 수, 가장 나빴던 구간의 update / draw p99, 가장 낮은 FPS"""
+        if not self.rows:
+            return "[처리량] 기록 없음"
+        index = {name: i for i, name in enumerate(FIELDS)}
+        peak = max(self.rows, key=lambda row: row[index["players"]] + row[index["enemies"]])
+        worst_update = max(row[index["update_p99_ms"]] for row in self.rows)
+        worst_draw = max(row[index["draw_p99_ms"]] for row in self.rows)
+        min_fps = min(row[index["fps"]] for row in self.rows)
+        dropped = sum(row[index["dropped_ms"]] for row in self.rows)
+        return (f"[처리량] {len(self.rows)}구간, 최대 유닛 {peak[index['players']]} + {peak[index['enemies']]}"
+                f" (웨이브 {peak[index['wave']]}), update p99 최대 {worst_update:.2f} ms,"
+                f" draw p99 최대 {worst_draw:.2f} ms, 최저 {min_fps:.1f} FPS, 버린 시간 {dropped:.0f} ms")
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# 게임 모듈은 패키지가 아니라 한 폴더에 평평하게 있으므로 (import config 등) 상위 폴더를 경로에 넣는다.
+# 화면 / 소리 장치가 없는 CI 에서도 돌도록 SDL 더미 드라이버를 쓴다.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
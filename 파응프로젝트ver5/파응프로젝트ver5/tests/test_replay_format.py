@@ -0,0 +1,22 @@
+import pytest
+import config
+import replay_check
+from assets import assets
+
+# replay_check.py 의 검사를 pytest 로 (CLI 는 더 긴 판 / 다른 스테이지를 손으로 돌릴 때 쓴다)
+
+MAX_TICKS = int(120 * 1000 / config.SIM_STEP_MS)
+
+
+def test_format_versions_pinned():
+    assert replay_check.check_formats() == []
+
+
+@pytest.mark.parametrize("engine", ["object", "array"])
+@pytest.mark.parametrize("stage_level", [1, 2, 3])
+def test_snapshot_and_replay_round_trip(stage_level, engine):
+    with assets.headless_mode():
+        errors, ticks, inputs = replay_check.check_stage(stage_level, engine, seed=1, max_ticks=MAX_TICKS,
+                                                         sample_every=600)
+    assert errors == []
+    assert inputs > 0
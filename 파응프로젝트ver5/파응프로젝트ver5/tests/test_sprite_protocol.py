@@ -0,0 +1,80 @@
+import pygame
+import pytest
+from entity import C1, M1_1, GameEntity
+from lane_index import LaneGroup
+
+# GameEntity 는 pygame.sprite.Sprite 를 상속하지 않고 규약만 흉내 낸다 (entity.py 의 "스프라이트 규약" 주석).
+# pygame 을 올렸을 때 Group 내부 동작이 바뀌어 조용히 깨지지 않도록 실제 Group / LaneGroup 으로 확인한다.
+
+COLOR = (10, 200, 30)
+
+
+@pytest.fixture
+def screen():
+    pygame.display.init()
+    surface = pygame.display.set_mode((400, 200))
+    yield surface
+    pygame.display.quit()
+
+
+def make_unit(unit_type, x, y=150):
+    unit = GameEntity(unit_type, x, y)
+    unit.image = pygame.Surface(unit.rect.size)
+    unit.image.fill(COLOR)
+    return unit
+
+
+def test_pygame_2():
+    # 규약은 pygame 2.x 의 AbstractGroup 기준. 메이저 버전이 바뀌면 entity.py 주석부터 다시 확인할 것
+    assert pygame.version.vernum[0] == 2
+
+
+def test_group_add_has_draw_remove(screen):
+    group = pygame.sprite.Group()
+    unit = make_unit(C1, 50)
+
+    group.add(unit)
+    assert unit in group and group.has(unit)
+    assert len(group) == 1
+    assert unit.alive() and unit.groups() == [group]
+
+    screen.fill((0, 0, 0))
+    group.draw(screen)
+    assert screen.get_at(unit.rect.center)[:3] == COLOR
+
+    group.remove(unit)
+    assert unit not in group and len(group) == 0
+    assert not unit.alive()
+
+
+def test_lane_group_and_group_together(screen):
+    lane = LaneGroup()
+    everyone = pygame.sprite.Group()
+    near = make_unit(M1_1, 100)
+    far = make_unit(M1_1, 300)
+    for unit in (near, far):
+        lane.add(unit)
+        everyone.add(unit)
+
+    assert near.lane is lane and set(near.groups()) == {lane, everyone}
+    assert lane.nearest(0) is near
+
+    # 이동 -> 정렬 위치 갱신
+    near.exact_x = 350.0
+    near.move()
+    assert lane.nearest(0) is far
+
+    screen.fill((0, 0, 0))
+    lane.draw(screen)
+    assert screen.get_at(far.rect.center)[:3] == COLOR
+
+    # kill() 은 속한 모든 그룹에서 빠진다 (레인 인덱스 포함)
+    near.kill()
+    assert near not in lane and near not in everyone
+    assert near.lane is None and not near.alive()
+    assert lane.nearest(400) is far
+
+    everyone.empty()
+    assert far.groups() == [lane]
+    lane.remove(far)
+    assert len(lane) == 0 and lane.nearest(0) is None
@@ -0,0 +1,111 @@
+from collections import OrderedDict
+import pygame
+
+# ==========================================
+# 텍스트 Surface 캐시 (LRU)
+# ==========================================
+class TextCache:
+    """(폰트, 문자열, 색상) 별로 font.render 결과를 재사용하는 LRU 캐시
+
+    버튼 비용("$50")처럼 매 프레임 같은 글자를 다시 래스터화하던 것을 없앤다.
+    가장 오래 안 쓴 항목부터 버려서 메모리는 max_entries 개로 제한된다.
+    """
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        key = (font, text, tuple(color))
+        surf = self._cache.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, True, color)
+        self._cache[key] = surf
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._cache.clear()
+
+
+# 프로세스 전체에서 공유하는 캐시
+text_cache = TextCache()
+
+
+# ==========================================
+# 숫자용 글리프 아틀라스
+# ==========================================
+class GlyphAtlas:
+    """자주 바뀌는 숫자를 글자 단위로 미리 그려 두고 blits 로 조립하는 아틀라스
+
+    돈처럼 0.5초마다 바뀌는 값은 문자열 캐시로는 매번 새 항목이 생기므로,
+    글자(0~9, '/', ' ' 등)를 한 번만 래스터화하고 위치만 바꿔서 찍는다.
+    """
+    CHARSET = "0123456789/ -:$."
+
+    def __init__(self, font, color, charset=CHARSET):
+        self.font = font
+        self.color = color
+        self.glyphs = {}
+        for ch in charset:
+            surf = font.render(ch, True, color)
+            self.glyphs[ch] = (surf, font.size(ch)[0])
+        self.height = font.get_height()
+
+    def can_draw(self, text):
+        return all(ch in self.glyphs for ch in text)
+
+    def size(self, text):
+        return sum(self.glyphs[ch][1] for ch in text), self.height
+
+    def draw(self, screen, text, pos):
+        x, y = pos
+        blit_list = []
+        for ch in text:
+            surf, advance = self.glyphs[ch]
+            blit_list.append((surf, (x, y)))
+            x += advance
+        screen.blits(blit_list, doreturn=False)
+        return pygame.Rect(pos, (x - pos[0], self.height))
+
+
+# ==========================================
+# 값이 바뀔 때만 다시 그리는 HUD 텍스트
+# ==========================================
+class HudText:
+    """고정 라벨 + 바뀌는 값으로 된 HUD 텍스트 ("Money: " + "120 / 2000")
+
+    - 값 문자열이 그대로면 지난번 Surface 를 그대로 쓴다 (래스터화 없음).
+    - use_atlas=True 면 값 부분은 GlyphAtlas 로 조립한다 (자주 바뀌는 숫자용).
+    """
+    def __init__(self, font, color, pos, label="", use_atlas=False):
+        self.font = font
+        self.color = color
+        self.pos = pos
+        self.label_surf = text_cache.render(font, label, color) if label else None
+        self.label_width = font.size(label)[0] if label else 0
+        self.atlas = GlyphAtlas(font, color) if use_atlas else None
+        self._last_value = None
+        self._value_surf = None
+
+    def draw(self, screen, value):
+        x, y = self.pos
+        if self.label_surf:
+            screen.blit(self.label_surf, (x, y))
+        value_pos = (x + self.label_width, y)
+
+        if self.atlas and self.atlas.can_draw(value):
+            self.atlas.draw(screen, value, value_pos)
+            return
+
+        if value != self._last_value:
+            self._last_value = value
+            self._value_surf = self.font.render(value, True, self.color)
+        screen.blit(self._value_surf, value_pos)
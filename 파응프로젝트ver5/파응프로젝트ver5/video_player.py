@@ -0,0 +1,127 @@
+import queue
+import threading
+import time
+import numpy as np
+import pygame
+import cv2  # [필수] opencv-python 설치 필요
+
+# ==========================================
+# 백그라운드 스레드 동영상 디코더
+# ==========================================
+# 메인 스레드는 "준비된 프레임을 시간에 맞춰 blit + flip" 만 한다.
+# 디코드 / 크기 조정 / 색 변환은 워커 스레드가 미리 할당한 RGB 버퍼(링)에 직접 써 넣는다.
+#
+#   free  큐 : 워커가 써도 되는 빈 버퍼 번호
+#   ready 큐 : 디코드가 끝난 (버퍼 번호, 표시 시각 ms)  /  None 은 영상 끝
+#
+# 버퍼마다 pygame.image.frombuffer 로 만든 Surface 를 하나씩 붙여 두므로
+# 프레임마다 tobytes() 복사나 Surface 생성이 없다. (Surface 가 버퍼 메모리를 그대로 본다)
+
+class VideoPlayer:
+    def __init__(self, video_path, size, buffer_count=4):
+        self.video_path = video_path
+        self.size = size
+        self.buffer_count = buffer_count
+        self.cap = None
+        self.fps = 30
+        self.dropped = 0
+        self.shown = 0
+        self._thread = None
+        self._stop = threading.Event()
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.video_path)
+        if not self.cap.isOpened():
+            return False
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        if fps > 0: self.fps = fps
+
+        w, h = self.size
+        # 링 버퍼: 버퍼마다 같은 메모리를 보는 Surface 를 미리 만든다
+        self.buffers = [np.empty((h, w, 3), dtype=np.uint8) for _ in range(self.buffer_count)]
+        self.surfaces = [pygame.image.frombuffer(buf, (w, h), "RGB") for buf in self.buffers]
+        self._free = queue.Queue()
+        self._ready = queue.Queue()
+        for i in range(self.buffer_count):
+            self._free.put(i)
+
+        self._thread = threading.Thread(target=self._decode_loop, daemon=True)
+        self._thread.start()
+        return True
+
+    def _decode_loop(self):
+        cap = self.cap
+        frame = None   # 원본 크기 BGR (cap.read 가 재사용)
+        small = None   # 화면 크기 BGR (resize 출력 재사용)
+        index = 0
+        while not self._stop.is_set():
+            try:
+                slot = self._free.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            ret, frame = cap.read(frame)
+            if not ret:
+                break
+
+            # 먼저 줄이고(픽셀 수 감소) 색 변환은 링 버퍼에 바로 기록
+            # (채널별 보간이라 기존 "변환 -> 크기 조정" 순서와 결과가 같다)
+            small = cv2.resize(frame, self.size, dst=small)
+            cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self.buffers[slot])
+
+            # 영상 자체의 타임스탬프 기준으로 표시 (못 읽으면 프레임 번호 / FPS)
+            pts = cap.get(cv2.CAP_PROP_POS_MSEC)
+            if pts <= 0 and index > 0:
+                pts = index * 1000.0 / self.fps
+            self._ready.put((slot, pts))
+            index += 1
+
+        self._ready.put(None)
+
+    def next_frame(self, timeout=1.0):
+        """(버퍼 번호, 표시 시각 ms) 또는 영상 끝이면 None"""
+        while True:
+            try:
+                return self._ready.get(timeout=timeout)
+            except queue.Empty:
+                if not self._thread.is_alive():
+                    return None
+
+    def release_frame(self, slot):
+        self._free.put(slot)
+
+    def close(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+        if self.cap:
+            self.cap.release()
+
+    def play(self, screen, handle_events):
+        """영상을 끝까지(또는 handle_events 가 False 를 돌려줄 때까지) 재생
+
+        표시 시각이 이미 다음 프레임 시각까지 지났으면 그 프레임은 그리지 않고 버린다.
+        """
+        start = time.perf_counter()
+        frame_ms = 1000.0 / self.fps
+        pending = self.next_frame()
+        while pending is not None:
+            slot, pts = pending
+            if not handle_events():
+                self.release_frame(slot)
+                return False
+
+            now_ms = (time.perf_counter() - start) * 1000
+            if now_ms > pts + frame_ms:
+                # 늦었다: 이 프레임은 건너뛴다
+                self.release_frame(slot)
+                self.dropped += 1
+            else:
+                if pts > now_ms:
+                    pygame.time.wait(int(pts - now_ms))
+                screen.blit(self.surfaces[slot], (0, 0))
+                pygame.display.flip()
+                self.release_frame(slot)
+                self.shown += 1
+            pending = self.next_frame()
+        return True
@@ -0,0 +1,85 @@
+import config
+from entity import M1_1, M1_2, M2_1, M2_2, MBoss
+
+# ==========================================
+# 엔드리스(스트레스) 모드 웨이브 표
+# ==========================================
+# 일반 스테이지는 2~5초마다 한 마리씩 정해진 수만 나오지만, 엔드리스 모드는
+# 웨이브가 진행될수록 간격은 줄고(ENDLESS_INTERVAL_DECAY) 한 번에 나오는 수는 늘어난다.
+# 웨이브마다의 (시각, 마리 수, 적 구성 단계, 보스 여부) 는 난수와 무관하게 처음에 한 번 계산해 두고,
+# 게임 중에는 표를 읽기만 한다. 어떤 적이 나올지만 판마다의 난수(GameManager.rng)로 고른다.
+# 표가 끝난 뒤에는 마지막 웨이브의 간격 / 마리 수로 끝없이 계속된다.
+
+# 웨이브 번호에 따른 적 구성 단계 (이 웨이브부터, 뽑는 적 종류)
+ENDLESS_TIERS = (
+    (0, (M1_1, M1_2)),
+    (6, (M1_1, M1_2, M2_1)),
+    (15, (M1_2, M2_1, M2_2)),
+    (30, (M2_1, M2_2)),
+)
+ENDLESS_BOSS = MBoss
+
+# 엔드리스 모드에 나오는 모든 적 (스테이지 manifest / 유닛 종류 갱신용)
+ENDLESS_ENEMY_POOL = [M1_1, M1_2, M2_1, M2_2]
+
+
+class WaveTable:
+    """웨이브 번호 -> (시작 시각 ms, 다음 웨이브까지 ms, 마리 수, 적 구성 단계, 보스 여부)
+
+    entries 는 미리 계산한 앞부분이고, 그 뒤 번호는 마지막 항목의 간격 / 마리 수로 이어 붙인다.
+    """
+    def __init__(self, waves=None, first_ms=None, start_interval_ms=None, min_interval_ms=None,
+                 decay=None, batch_step=None, max_batch=None, boss_every=None):
+        waves = waves or config.ENDLESS_TABLE_WAVES
+        at = config.ENDLESS_FIRST_WAVE_MS if first_ms is None else first_ms
+        interval = start_interval_ms or config.ENDLESS_START_INTERVAL_MS
+        min_interval = min_interval_ms or config.ENDLESS_MIN_INTERVAL_MS
+        decay = decay or config.ENDLESS_INTERVAL_DECAY
+        batch_step = batch_step or config.ENDLESS_BATCH_STEP
+        max_batch = max_batch or config.ENDLESS_MAX_BATCH
+        self.boss_every = config.ENDLESS_BOSS_EVERY if boss_every is None else boss_every
+
+        self.entries = []
+        for wave in range(waves):
+            # 시각은 정수 ms 로 (스케줄러 비교가 부동소수 누적 오차에 흔들리지 않도록)
+            step = round(interval)
+            count = min(max_batch, 1 + wave // batch_step)
+            self.entries.append((at, step, count, self._tier(wave), self._is_boss(wave)))
+            at += step
+            interval = max(min_interval, interval * decay)
+
+    @staticmethod
+    def _tier(wave):
+        tier = 0
+        for i, (start, _) in enumerate(ENDLESS_TIERS):
+            if wave >= start:
+                tier = i
+        return tier
+
+    def _is_boss(self, wave):
+        return self.boss_every > 0 and wave > 0 and wave % self.boss_every == 0
+
+    def __getitem__(self, wave):
+        if wave < len(self.entries):
+            return self.entries[wave]
+        at, step, count, tier, _ = self.entries[-1]
+        extra = wave - len(self.entries) + 1
+        return (at + step * extra, step, count, tier, self._is_boss(wave))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def pool(self, tier):
+        return ENDLESS_TIERS[tier][1]
+
+    def describe(self, every=10):
+        """웨이브 표 요약 (every 웨이브마다 한 줄)"""
+        lines = ["wave   시각(s)  간격(ms)  마리  단계  보스"]
+        for wave in range(0, len(self.entries), every):
+            at, step, count, tier, boss = self.entries[wave]
+            lines.append(f"{wave:4d} {at / 1000:9.1f} {step:9d} {count:5d} {tier:5d}  {'O' if boss else ''}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(WaveTable().describe())